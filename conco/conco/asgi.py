@@ -11,6 +11,11 @@ import os
 
 from django.core.asgi import get_asgi_application
 
+from conco.db_pool import open_pools
+
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'conco.settings')
 
 application = get_asgi_application()
+
+# Connect the DB pool now instead of on the first request
+open_pools()
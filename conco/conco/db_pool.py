@@ -0,0 +1,29 @@
+"""
+Startup pre-warming of the psycopg 3 connection pools (settings.DB_POOL).
+
+Django opens a pool lazily on the first query, so the first requests of a
+fresh worker would pay for min_size handshakes. open_pools() opens every
+configured pool when the WSGI/ASGI application loads and waits (up to
+DB_POOL_WARMUP_TIMEOUT) for the minimum connections.
+"""
+import logging
+
+from django.conf import settings
+from django.db import connections
+
+
+logger = logging.getLogger(__name__)
+
+
+def open_pools():
+    for alias in connections:
+        pool = connections[alias].pool
+        if pool is None:
+            continue
+
+        pool.open()
+        try:
+            pool.wait(timeout=settings.DB_POOL_WARMUP_TIMEOUT)
+        except Exception as exc:
+            # The pool keeps connecting in the background, do not block startup
+            logger.warning('Database pool %r is not ready yet: %s', alias, exc)
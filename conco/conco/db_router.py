@@ -0,0 +1,83 @@
+"""
+Primary/replica routing.
+
+With a 'replica' alias in DATABASES, reads of the projects app made while
+serving a public GET/HEAD request (ReplicaRoutingMiddleware) go to the
+replica. Everything else stays on the primary: writes, the admin, form
+posts, sessions/auth, management commands and reads inside a transaction.
+
+Reads after a write are kept on the primary in two ways: a write in the
+current request pins the rest of the request, and a write to a content model
+pins all requests for REPLICA_PIN_SECONDS, so a lagging replica never refills
+the freshly invalidated caches with old rows. Appeals, counters and the
+activity rollup are written by visitors and cron all the time and back no
+public cache: they only pin their own request.
+"""
+from contextlib import contextmanager
+
+from asgiref.local import Local
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, connections
+
+
+REPLICA_ALIAS = 'replica'
+REPLICATED_APPS = {'projects'}
+PIN_CACHE_KEY = 'replica_pinned'
+# Writes that do not pin every request (label_lower)
+UNPINNED_MODELS = {
+    'projects.appealvacancy',
+    'projects.appealvacancykey',
+    'projects.appealcontact',
+    'projects.counter',
+    'projects.dailyactivity',
+}
+
+_state = Local()
+
+
+def replica_enabled():
+    return REPLICA_ALIAS in settings.DATABASES
+
+
+def is_pinned():
+    """True for REPLICA_PIN_SECONDS after the last write to a content table."""
+    return cache.get(PIN_CACHE_KEY) is not None
+
+
+@contextmanager
+def use_replica():
+    """Allow replica reads for the enclosed block (one public request)."""
+    previous = getattr(_state, 'replica', False), getattr(_state, 'wrote', False)
+    _state.replica, _state.wrote = True, False
+    try:
+        yield
+    finally:
+        _state.replica, _state.wrote = previous
+
+
+class PrimaryReplicaRouter:
+    def db_for_read(self, model, **hints):
+        if (
+            not getattr(_state, 'replica', False)
+            or getattr(_state, 'wrote', False)
+            or model._meta.app_label not in REPLICATED_APPS
+            or connections[DEFAULT_DB_ALIAS].in_atomic_block
+            or not replica_enabled()
+        ):
+            return DEFAULT_DB_ALIAS
+        return REPLICA_ALIAS
+
+    def db_for_write(self, model, **hints):
+        if model._meta.app_label in REPLICATED_APPS:
+            _state.wrote = True
+            if replica_enabled() and model._meta.label_lower not in UNPINNED_MODELS:
+                cache.set(PIN_CACHE_KEY, True, settings.REPLICA_PIN_SECONDS)
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Both aliases hold the same data
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db == DEFAULT_DB_ALIAS
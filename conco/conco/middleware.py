@@ -1,6 +1,8 @@
 from django.utils import translation
 from django.conf import settings
 
+from conco.db_router import replica_enabled, is_pinned, use_replica
+
 
 class CustomLocaleMiddleware:
     DEFAULT_LANGUAGE = 'az'
@@ -20,7 +22,10 @@ class CustomLocaleMiddleware:
             request.LANGUAGE_CODE = self.DEFAULT_LANGUAGE
             return self.get_response(request)
 
-        language = request.session.get('django_language') or request.session.get('language')
+        # Explicit ?lang= wins (as in get_language_from_request) and spares the session lookup
+        language = request.GET.get('lang', '').lower()
+        if language not in self.LANGUAGES:
+            language = request.session.get('django_language') or request.session.get('language')
         if language and language in self.LANGUAGES:
             translation.activate(language)
             request.LANGUAGE_CODE = language
@@ -29,3 +34,25 @@ class CustomLocaleMiddleware:
             request.LANGUAGE_CODE = self.DEFAULT_LANGUAGE
 
         return self.get_response(request)
+
+
+class ReplicaRoutingMiddleware:
+    """Serve public GET/HEAD requests from the read replica (conco/db_router.py)."""
+
+    SAFE_METHODS = ('GET', 'HEAD')
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        admin_prefix = f'/{settings.ADMIN_URL.strip("/")}'
+        if (
+            not replica_enabled()
+            or request.method not in self.SAFE_METHODS
+            or request.path.startswith(admin_prefix)
+            or is_pinned()
+        ):
+            return self.get_response(request)
+
+        with use_replica():
+            return self.get_response(request)
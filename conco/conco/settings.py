@@ -61,12 +61,13 @@ if not ADMIN_URL.endswith('/'):
 # Application definition
 
 INSTALLED_APPS = [
-    'django.contrib.admin',
+    'projects.apps.ProjectsAdminConfig',
     'django.contrib.auth',
     'django.contrib.contenttypes',
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
     
     # Third Packages
     'django_cleanup.apps.CleanupConfig',
@@ -85,6 +86,7 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'conco.middleware.ReplicaRoutingMiddleware',
 ]
 
 
@@ -121,9 +123,50 @@ DATABASES = {
         'PASSWORD': os.getenv('POSTGRES_PASSWORD'),
         'HOST': os.getenv('POSTGRES_HOST'),
         'PORT': os.getenv('POSTGRES_PORT'),
+        # Pooled connections are checked by the pool, persistent ones by Django
+        'CONN_HEALTH_CHECKS': os.getenv('DB_CONN_HEALTH_CHECKS', 'True').lower() in ('true', '1', 'yes'),
     }
 }
 
+# psycopg 3 connection pool (Django's native pooling). Without DB_POOL every
+# request opens its own connection unless CONN_MAX_AGE keeps it alive.
+# The pool is opened and pre-warmed when the WSGI/ASGI app loads (conco/db_pool.py).
+DB_POOL = os.getenv('DB_POOL', 'False').lower() in ('true', '1', 'yes')
+if DB_POOL:
+    DATABASES['default']['OPTIONS'] = {
+        'pool': {
+            'min_size': int(os.getenv('DB_POOL_MIN_SIZE', 2)),
+            'max_size': int(os.getenv('DB_POOL_MAX_SIZE', 10)),
+            # Seconds a request waits for a free connection before failing
+            'timeout': float(os.getenv('DB_POOL_TIMEOUT', 10)),
+            'max_idle': float(os.getenv('DB_POOL_MAX_IDLE', 600)),
+            'max_lifetime': float(os.getenv('DB_POOL_MAX_LIFETIME', 3600)),
+        },
+    }
+else:
+    DATABASES['default']['CONN_MAX_AGE'] = int(os.getenv('CONN_MAX_AGE', 0))
+
+# Seconds to wait for the pre-warmed pool connections at startup
+DB_POOL_WARMUP_TIMEOUT = float(os.getenv('DB_POOL_WARMUP_TIMEOUT', 5))
+
+# Optional read replica for public pages (conco/db_router.py). Unset
+# POSTGRES_REPLICA_* values fall back to the primary's.
+if os.getenv('POSTGRES_REPLICA_HOST'):
+    DATABASES['replica'] = {
+        **DATABASES['default'],
+        'NAME': os.getenv('POSTGRES_REPLICA_DB', DATABASES['default']['NAME']),
+        'USER': os.getenv('POSTGRES_REPLICA_USER', DATABASES['default']['USER']),
+        'PASSWORD': os.getenv('POSTGRES_REPLICA_PASSWORD', DATABASES['default']['PASSWORD']),
+        'HOST': os.getenv('POSTGRES_REPLICA_HOST'),
+        'PORT': os.getenv('POSTGRES_REPLICA_PORT', DATABASES['default']['PORT']),
+        'TEST': {'MIRROR': 'default'},
+    }
+
+DATABASE_ROUTERS = ['conco.db_router.PrimaryReplicaRouter']
+
+# Seconds reads stay on the primary after a write (replication lag margin)
+REPLICA_PIN_SECONDS = int(os.getenv('REPLICA_PIN_SECONDS', 10))
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -198,6 +241,17 @@ CACHE_TIMEOUT_SHORT = 1800  # 30 minutes for occasionally changing data
 CACHE_TIMEOUT_MEDIUM = 7200  # 2 hours for normal pages (projects, vacancies lists)
 CACHE_TIMEOUT_LONG = 86400  # 24 hours for stable data (about, contact, background images)
 
+# Serializers must only read prefetched/denormalized data. In strict mode a
+# lazy query inside a serialize_* function raises instead of running.
+SERIALIZER_STRICT_MODE = os.getenv('SERIALIZER_STRICT_MODE', 'False').lower() in ('true', '1', 'yes')
+
+# Build the home page payload with a single PostgreSQL JSON query instead of
+# one ORM query per section (see projects/utils/page_composer.py).
+PAGE_COMPOSER_SQL = os.getenv('PAGE_COMPOSER_SQL', 'False').lower() in ('true', '1', 'yes')
+
+# Cold storage for CVs of archived appeal partitions (manage.py appeal_partitions)
+APPEAL_ARCHIVE_ROOT = os.getenv('APPEAL_ARCHIVE_ROOT', str(BASE_DIR / 'archive'))
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
@@ -2,6 +2,11 @@ import os
 
 from django.core.wsgi import get_wsgi_application
 
+from conco.db_pool import open_pools
+
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'conco.settings')
 
 application = get_wsgi_application()
+
+# Connect the DB pool now instead of on the first request
+open_pools()
@@ -1,17 +1,60 @@
+import datetime
+
 from django.contrib import admin
-from django.db.models import Q
+from django.contrib.admin.options import IncorrectLookupParameters
+from django.contrib.admin.widgets import AutocompleteSelect
+from django.db.models import Q, Count, OuterRef, Subquery, Value
+from django.db.models.functions import Cast, Coalesce, Concat
 from django.db import models
 from django.utils.html import format_html
 from django.urls import reverse
 from django import forms
 from django.core.exceptions import ValidationError
+from django.utils import timezone
 
 from projects.models import *
+from projects.utils.counters import get_counters, project_counter_keys, main_page_key, SPECIAL_PROJECTS, UNREAD_APPEALS
+from projects.utils.file_metadata import format_file_size
+from projects.utils.thumbnails import thumbnail_url, stored_thumbnail_url, ADMIN_PREVIEW_SIZE
+from projects.utils.cv_archive import cv_archive_response
+from projects.utils import normalize_az_phone
+from .mixins import IndexedSearchMixin, ExportMixin, GalleryMixin, ReadStateMixin
+from .paginators import EstimatedCountPaginator
 
 
 # Media
+class MediaAdminForm(forms.ModelForm):
+    """Arxa plan şəkli formu: yerləşmələr checkbox kimi göstərilir"""
+    placements = forms.MultipleChoiceField(
+        choices=Placement.choices,
+        widget=forms.CheckboxSelectMultiple,
+        required=False,
+        label='Arxa plan təyinatları'
+    )
+
+    class Meta:
+        model = Media
+        fields = ('image',)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        if self.instance.pk:
+            self.fields['placements'].initial = [
+                placement.placement for placement in self.instance.placements.all()
+            ]
+
+    def _save_m2m(self):
+        super()._save_m2m()
+        selected = set(self.cleaned_data.get('placements') or [])
+        current = set(self.instance.placements.values_list('placement', flat=True))
+        self.instance.placements.filter(placement__in=current - selected).delete()
+        for placement in selected - current:
+            MediaPlacement.objects.create(media=self.instance, placement=placement)
+
+
 @admin.register(Media)
 class MediaAdmin(admin.ModelAdmin):
+    form = MediaAdminForm
     list_display = (
         'id',
         'media_preview',
@@ -20,13 +63,7 @@ class MediaAdmin(admin.ModelAdmin):
     )
     list_display_links = ('media_preview',)
     list_filter = (
-        'is_home_page_background_image',
-        'is_about_page_background_image',
-        'is_contact_page_background_image',
-        'is_project_page_background_image',
-        'is_vacany_page_background_image',
-        'is_service_page_background_image',
-        'is_footer_background_image',
+        'placements__placement',
         'created_at',
     )
     readonly_fields = ('created_at', 'media_preview_detailed')
@@ -36,15 +73,7 @@ class MediaAdmin(admin.ModelAdmin):
             'fields': ('image', 'media_preview_detailed')
         }),
         ('Arxa Plan Təyinatları', {
-            'fields': (
-                'is_home_page_background_image',
-                'is_about_page_background_image',
-                'is_contact_page_background_image',
-                'is_project_page_background_image',
-                'is_vacany_page_background_image',
-                'is_service_page_background_image',
-                'is_footer_background_image',
-            ),
+            'fields': ('placements',),
         }),
     )
 
@@ -56,21 +85,15 @@ class MediaAdmin(admin.ModelAdmin):
 
     def get_queryset(self, request):
         qs = super().get_queryset(request)
-        return         qs.filter(
-            models.Q(is_home_page_background_image=True) |
-            models.Q(is_about_page_background_image=True) |
-            models.Q(is_contact_page_background_image=True) |
-            models.Q(is_project_page_background_image=True) |
-            models.Q(is_vacany_page_background_image=True) |
-            models.Q(is_service_page_background_image=True) |
-            models.Q(is_footer_background_image=True)
-        )
+        return qs.filter(
+            models.Exists(MediaPlacement.objects.filter(media=models.OuterRef('pk')))
+        ).prefetch_related('placements')
 
     def media_preview(self, obj):
         if obj.image:
             return format_html(
-                '<img src="{}" style="max-width: 80px; max-height: 80px; border-radius: 4px;" />',
-                obj.image.url
+                '<img src="{}" loading="lazy" style="max-width: 80px; max-height: 80px; border-radius: 4px;" />',
+                thumbnail_url(obj.image)
             )
         return "-"
     media_preview.short_description = "Şəkil"
@@ -78,28 +101,28 @@ class MediaAdmin(admin.ModelAdmin):
     def media_preview_detailed(self, obj):
         if obj.image:
             return format_html(
-                '<img src="{}" style="max-width: 300px; max-height: 300px; border-radius: 8px;" />',
-                obj.image.url
+                '<a href="{}" target="_blank"><img src="{}" loading="lazy" style="max-width: 300px; max-height: 300px; border-radius: 8px;" /></a>',
+                obj.image.url,
+                thumbnail_url(obj.image, ADMIN_PREVIEW_SIZE)
             )
         return "-"
     media_preview_detailed.short_description = "Şəkil Önizləmə"
 
+    PLACEMENT_ICONS = {
+        Placement.HOME: "🏠",
+        Placement.ABOUT: "ℹ️",
+        Placement.CONTACT: "🤝",
+        Placement.PROJECT: "📁",
+        Placement.VACANCY: "💼",
+        Placement.SERVICE: "🛠️",
+        Placement.FOOTER: "🖼️",
+    }
+
     def background_flags(self, obj):
-        flags = []
-        if obj.is_home_page_background_image:
-            flags.append("🏠 Ana səhifə")
-        if obj.is_about_page_background_image:
-            flags.append("ℹ️ Haqqımızda səhifəsi")
-        if obj.is_contact_page_background_image:
-            flags.append("🤝 Əlaqə səhifəi")
-        if obj.is_project_page_background_image:
-            flags.append("📁 Layihələr səhifəsi")
-        if obj.is_vacany_page_background_image:
-            flags.append("💼 Vakansiyalar səhifəsi")
-        if obj.is_service_page_background_image:
-            flags.append("🛠️ Xidmətlər səhifəsi")
-        if obj.is_footer_background_image:
-            flags.append("🖼️ Websiten-ın aşağı hissəsi üçün")
+        flags = [
+            f"{self.PLACEMENT_ICONS.get(placement.placement, '')} {placement.get_placement_display()}"
+            for placement in sorted(obj.placements.all(), key=lambda p: Placement.values.index(p.placement))
+        ]
         return " | ".join(flags) if flags else "-"
     background_flags.short_description = "Arxa Plan"
 
@@ -119,30 +142,28 @@ class MediaInlineBase(admin.TabularInline):
     def thumbnail_preview(self, obj):
         if obj and obj.image:
             return format_html(
-                '<img src="{}" style="max-width: 60px; max-height: 60px; border-radius: 4px;" />',
-                obj.image.url
+                '<img src="{}" loading="lazy" style="max-width: 60px; max-height: 60px; border-radius: 4px;" />',
+                thumbnail_url(obj.image)
             )
         return "-"
     thumbnail_preview.short_description = "Önizləmə"
 
 
-class MediaInlineProject(MediaInlineBase):
-    fk_name = 'project'
-    fields = ('image', 'thumbnail_preview', 'created_at')
-    
-    def get_queryset(self, request):
-        qs = super().get_queryset(request)
-        return qs.select_related('project')
-
-
 class MediaInlinePartner(MediaInlineBase):
     fields = ('image', 'thumbnail_preview', 'created_at')
 
 
 class MediaInlineAbout(MediaInlineBase):
+    # Şəkillər qalereyadan idarə olunur, burada yalnız video (və onun şəkli)
     fields = ('image', 'video', 'thumbnail_preview', 'created_at')
-    max_num = 12
+    verbose_name = "Video"
+    verbose_name_plural = "Video"
+    max_num = 1
     extra = 1
+
+    def get_queryset(self, request):
+        qs = super().get_queryset(request)
+        return qs.exclude(video='').exclude(video__isnull=True)
     
     def get_formset(self, request, obj=None, **kwargs):
         from django.forms import BaseInlineFormSet
@@ -235,13 +256,18 @@ class ProjectCategoryAdmin(admin.ModelAdmin):
     name_link.short_description = "Ad (AZ)"
     name_link.admin_order_field = 'name_az'
     
+    def get_queryset(self, request):
+        qs = super().get_queryset(request)
+        return qs.annotate(projects_total=Count('projects'))
+
     def projects_count(self, obj):
-        count = obj.projects.count()
+        count = obj.projects_total
         if count > 0:
             url = reverse('admin:projects_project_changelist') + f'?category__id__exact={obj.id}'
             return format_html('<a href="{}" style="color: #28a745; text-decoration: none;">📁 {} layihə</a>', url, count)
         return "0 layihə"
     projects_count.short_description = "Layihələr"
+    projects_count.admin_order_field = 'projects_total'
 
 # Project 
 class ProjectAdminForm(forms.ModelForm):
@@ -260,6 +286,16 @@ class ProjectAdminForm(forms.ModelForm):
 
         errors = {}
 
+        # Limitlər sayğaclardan oxunur; layihənin özü artıq sayılıbsa çıxılır
+        own_keys = project_counter_keys(self.instance) if self.instance.pk else set()
+        counter_keys = [SPECIAL_PROJECTS]
+        if category is not None:
+            counter_keys.append(main_page_key(category.pk))
+        taken = {
+            key: value - (key in own_keys)
+            for key, value in get_counters(counter_keys).items()
+        }
+
         # 1) "Seçilmiş Layihə" üçün ümumi maksimum 9 və "Ana səhifədə olsun" tələb olunur
         if speacial_project:
             # "Seçilmiş" layihələr üçün "Ana səhifədə olsun" field-i tələb olunur
@@ -270,11 +306,7 @@ class ProjectAdminForm(forms.ModelForm):
                 )
             
             # Maksimum 9 layihə limiti
-            qs = Project.objects.filter(speacial_project=True, on_main_page=True)
-            if self.instance and self.instance.pk:
-                qs = qs.exclude(pk=self.instance.pk)
-
-            if qs.count() >= 9:
+            if taken[SPECIAL_PROJECTS] >= 9:
                 errors['speacial_project'] = (
                     '⚠️ Xəbərdarlıq: "Seçilmiş layihə" üçün maksimum 9 layihə seçilə bilər. '
                     'Yeni layihəni seçilmiş etmək üçün köhnələrdən birinin "Seçilmiş Lahiyə" seçimini silməlisiniz.'
@@ -286,11 +318,7 @@ class ProjectAdminForm(forms.ModelForm):
                 # Nəzəri halda category boş qala bilərsə, əvvəl onu tələb et
                 errors['category'] = 'Ana səhifədə göstərmək üçün kateqoriya seçilməlidir.'
             else:
-                qs = Project.objects.filter(on_main_page=True, category=category)
-                if self.instance and self.instance.pk:
-                    qs = qs.exclude(pk=self.instance.pk)
-
-                if qs.count() >= 9:
+                if taken[main_page_key(category.pk)] >= 9:
                     errors['on_main_page'] = (
                         f'⚠️ Xəbərdarlıq: "{category}" kateqoriyası üçün ana səhifədə maksimum 9 layihə ola bilər. '
                         'Yeni layihəni ana səhifəyə əlavə etmək üçün həmin kateqoriyadan köhnələrdən birinin '
@@ -304,7 +332,7 @@ class ProjectAdminForm(forms.ModelForm):
 
 
 @admin.register(Project)
-class ProjectAdmin(admin.ModelAdmin):
+class ProjectAdmin(GalleryMixin, IndexedSearchMixin, admin.ModelAdmin):
     form = ProjectAdminForm
     list_display = (
         'id',
@@ -323,11 +351,16 @@ class ProjectAdmin(admin.ModelAdmin):
         'project_date',
     )
     search_fields = ('name_az', 'name_en', 'name_ru', 'description_az', 'description_en', 'description_ru')
+    search_vector_index = 'project_admin_search_idx'
+    search_trigram_fields = ('name_az', 'name_en', 'name_ru')
     exclude = ('slug',)
-    inlines = [MediaInlineProject]
+    gallery_fk = 'project'
     readonly_fields = ('created_at',)
     ordering = ('-project_date', '-created_at')
     list_per_page = 25
+
+    class Media:
+        js = ('assets/js/admin_image_compress.js',)
     
     fieldsets = (
         ('Əsas Məlumatlar', {
@@ -447,12 +480,18 @@ class PartnerAdmin(admin.ModelAdmin):
         }),
     )
     
+    def get_queryset(self, request):
+        qs = super().get_queryset(request)
+        # Kiçik şəkil üçün ilk medianın fayl adı (refresh_cover_media ilə eyni sıra), sətir başına sorğu yoxdur
+        first_image = Media.objects.filter(partner=models.OuterRef('pk')).exclude(image='').order_by('id')
+        return qs.annotate(cover_image_name=models.Subquery(first_image.values('image')[:1]))
+
     def partner_logo(self, obj):
-        media = obj.medias.first()
-        if media and media.image:
+        if obj.cover_image_name:
+            storage = Media._meta.get_field('image').storage
             return format_html(
-                '<img src="{}" style="max-width: 60px; max-height: 60px; border-radius: 4px; object-fit: contain;" />',
-                media.image.url
+                '<img src="{}" loading="lazy" style="max-width: 60px; max-height: 60px; border-radius: 4px; object-fit: contain;" />',
+                stored_thumbnail_url(storage, obj.cover_image_name)
             )
         return "❌"
     partner_logo.short_description = "Logo"
@@ -468,8 +507,8 @@ class PartnerAdmin(admin.ModelAdmin):
         media = obj.medias.first()
         if media and media.image:
             return format_html(
-                '<img src="{}" style="max-width: 250px; max-height: 250px; border-radius: 8px; box-shadow: 0 2px 8px rgba(0,0,0,0.1);" />',
-                media.image.url
+                '<img src="{}" loading="lazy" style="max-width: 250px; max-height: 250px; border-radius: 8px; box-shadow: 0 2px 8px rgba(0,0,0,0.1);" />',
+                thumbnail_url(media.image, ADMIN_PREVIEW_SIZE)
             )
         return "Logo yoxdur"
     logo_preview.short_description = "Logo Önizləmə"
@@ -482,11 +521,15 @@ class PartnerAdmin(admin.ModelAdmin):
 
 # About 
 @admin.register(About)
-class AboutAdmin(admin.ModelAdmin):
+class AboutAdmin(GalleryMixin, IndexedSearchMixin, admin.ModelAdmin):
     list_display = ('id', 'title_link', 'second_title_az', 'media_count', 'updated_info')
     list_display_links = ('id',)
     search_fields = ('main_title_az', 'main_title_en', 'main_title_ru', 'second_title_az', 'second_title_en', 'second_title_ru', 'description_az', 'description_en', 'description_ru')
+    search_vector_index = 'about_admin_search_idx'
+    search_trigram_fields = ('main_title_az', 'main_title_en', 'main_title_ru')
     inlines = [MediaInlineAbout]
+    gallery_fk = 'about'
+    gallery_max_images = 12
     list_per_page = 25
     
     fieldsets = (
@@ -514,12 +557,17 @@ class AboutAdmin(admin.ModelAdmin):
     title_link.short_description = "Əsas Başlıq"
     title_link.admin_order_field = 'main_title_az'
     
+    def get_queryset(self, request):
+        qs = super().get_queryset(request)
+        return qs.annotate(media_total=Count('medias'))
+
     def media_count(self, obj):
-        count = obj.medias.count()
+        count = obj.media_total
         if count > 0:
             return format_html('<span style="background: #007bff; color: white; padding: 3px 8px; border-radius: 12px; font-size: 11px;">📷 {} şəkil</span>', count)
         return "📷 0 şəkil"
     media_count.short_description = "Medialar"
+    media_count.admin_order_field = 'media_total'
     
     def updated_info(self, obj):
         if hasattr(obj, 'updated_at'):
@@ -530,11 +578,13 @@ class AboutAdmin(admin.ModelAdmin):
 
 # Service (Xidmətlər)
 @admin.register(Service)
-class ServiceAdmin(admin.ModelAdmin):
+class ServiceAdmin(IndexedSearchMixin, admin.ModelAdmin):
     list_display = ('id', 'title_link', 'media_count', 'active_status', 'created_at')
     list_display_links = ('id',)
     list_filter = ('is_active', 'created_at')
     search_fields = ('title_az', 'title_en', 'title_ru', 'description_az', 'description_en', 'description_ru')
+    search_vector_index = 'service_admin_search_idx'
+    search_trigram_fields = ('title_az', 'title_en', 'title_ru')
     inlines = [MediaInlineService]
     list_per_page = 25
 
@@ -564,12 +614,17 @@ class ServiceAdmin(admin.ModelAdmin):
     title_link.short_description = "Ad (AZ)"
     title_link.admin_order_field = 'title_az'
 
+    def get_queryset(self, request):
+        qs = super().get_queryset(request)
+        return qs.annotate(media_total=Count('medias'))
+
     def media_count(self, obj):
-        count = obj.medias.count()
+        count = obj.media_total
         if count > 0:
             return format_html('<span style="background: #007bff; color: white; padding: 3px 8px; border-radius: 12px; font-size: 11px;">📷 {} şəkil</span>', count)
         return "📷 0 şəkil"
     media_count.short_description = "Medialar"
+    media_count.admin_order_field = 'media_total'
 
     def active_status(self, obj):
         if obj.is_active:
@@ -650,7 +705,7 @@ class ContactAdmin(admin.ModelAdmin):
 
 # Vacancy 
 @admin.register(Vacancy)
-class VacancyAdmin(admin.ModelAdmin):
+class VacancyAdmin(IndexedSearchMixin, admin.ModelAdmin):
     inlines = [MediaInlineVacancy]
     list_display = (
         'id',
@@ -662,10 +717,13 @@ class VacancyAdmin(admin.ModelAdmin):
     list_display_links = ('id',)
     list_filter = ('is_active', 'created_at')
     search_fields = ('title_az', 'title_en', 'title_ru', 'description_az', 'description_en', 'description_ru')
+    search_vector_index = 'vacancy_admin_search_idx'
+    search_trigram_fields = ('title_az', 'title_en', 'title_ru')
     exclude = ('slug',)
     readonly_fields = ('created_at',)
     ordering = ('-created_at',)
     list_per_page = 25
+    actions = ('download_cvs',)
     
     fieldsets = (
         ('Azərbaycan', {
@@ -685,6 +743,10 @@ class VacancyAdmin(admin.ModelAdmin):
         }),
     )
     
+    @admin.action(description='Vakansiyalara gələn bütün CV-ləri ZIP kimi yüklə', permissions=['view'])
+    def download_cvs(self, request, queryset):
+        return cv_archive_response(AppealVacancy.objects.filter(vacancy__in=queryset))
+
     def title_link(self, obj):
         url = reverse('admin:projects_vacancy_change', args=[obj.pk])
         return format_html('<a href="{}" style="color: #417690; text-decoration: none; font-weight: 600; font-size: 14px;">🔗 {}</a>', url, obj.title_az)
@@ -697,10 +759,20 @@ class VacancyAdmin(admin.ModelAdmin):
         return format_html('<span style="background: #dc3545; color: white; padding: 4px 10px; border-radius: 12px; font-size: 11px; font-weight: bold;">✗ Deaktiv</span>')
     vacancy_status.short_description = "Status"
     
+    def get_queryset(self, request):
+        qs = super().get_queryset(request)
+        # Oxunmamışlar Counter cədvəlindən (signals və toplu əməliyyatlar saxlayır)
+        unread = Counter.objects.filter(
+            key=Concat(Value(f'{UNREAD_APPEALS}:'), Cast(OuterRef('pk'), models.CharField()))
+        ).values('value')
+        return qs.annotate(
+            appeals_total=Count('appeal_set'),
+            appeals_unread=Coalesce(Subquery(unread), 0),
+        )
+
     def appeals_count(self, obj):
-        count = obj.appeal_set.count()
-        read_count = obj.appeal_set.filter(is_read=True).count()
-        unread_count = count - read_count
+        count = obj.appeals_total
+        unread_count = obj.appeals_unread
         
         if count > 0:
             url = reverse('admin:projects_appealvacancy_changelist') + f'?vacancy__id__exact={obj.id}'
@@ -713,6 +785,7 @@ class VacancyAdmin(admin.ModelAdmin):
             return format_html(badge_html)
         return format_html('<span style="color: #6c757d;">📄 0 CV</span>')
     appeals_count.short_description = "CV-lər"
+    appeals_count.admin_order_field = 'appeals_total'
 
 # Motto
 @admin.register(Motto)
@@ -758,9 +831,99 @@ class MottoAdmin(admin.ModelAdmin):
     text_preview_ru.short_description = "Deviz (RU)"
     text_preview_ru.admin_order_field = 'text_ru'
 
+# Müraciət cədvəlləri aylara bölünüb (partition); created_at aralığı verilən
+# sorğular yalnız lazım olan bölmələri oxuyur.
+class CreatedPeriodFilter(admin.SimpleListFilter):
+    """Default: son 12 ay. Tarix filtri/date_hierarchy seçiləndə o aralıq işləyir."""
+    title = 'Dövr'
+    parameter_name = 'period'
+    default_months = 12
+
+    def lookups(self, request, model_admin):
+        return (
+            ('3', 'Son 3 ay'),
+            ('12', 'Son 12 ay'),
+            ('all', 'Hamısı'),
+        )
+
+    def value(self):
+        value = super().value()
+        if value is None and not any(key.startswith('created_at') for key in self.request_params):
+            return str(self.default_months)
+        return value
+
+    def __init__(self, request, params, model, model_admin):
+        self.request_params = dict(request.GET)
+        super().__init__(request, params, model, model_admin)
+
+    def choices(self, changelist):
+        for lookup, title in self.lookup_choices:
+            yield {
+                'selected': self.value() == lookup,
+                'query_string': changelist.get_query_string({self.parameter_name: lookup}),
+                'display': title,
+            }
+
+    def queryset(self, request, queryset):
+        value = self.value()
+        if value in (None, 'all'):
+            return queryset
+        months = int(value)
+        today = timezone.localdate()
+        index = today.year * 12 + today.month - 1 - (months - 1)
+        since = timezone.make_aware(datetime.datetime(index // 12, index % 12 + 1, 1))
+        return queryset.filter(created_at__gte=since)
+
+
+class VacancyAutocompleteFilter(admin.SimpleListFilter):
+    """Bütün vakansiyaları siyahıya yükləmək əvəzinə autocomplete (VacancyAdmin axtarışı)"""
+    title = 'Vakansiya'
+    parameter_name = 'vacancy__id__exact'
+    template = 'admin/projects/autocomplete_filter.html'
+
+    def __init__(self, request, params, model, model_admin):
+        super().__init__(request, params, model, model_admin)
+        self.field = forms.ModelChoiceField(
+            queryset=Vacancy.objects.all(),
+            required=False,
+            widget=AutocompleteSelect(
+                model._meta.get_field('vacancy'),
+                model_admin.admin_site,
+                attrs={'style': 'width: 100%;'},
+            ),
+        )
+
+    def has_output(self):
+        return True
+
+    def lookups(self, request, model_admin):
+        return ()
+
+    def choices(self, changelist):
+        value = self.value()
+        base_url = changelist.get_query_string(remove=[self.parameter_name])
+        yield {
+            'selected': value is None,
+            'query_string': base_url,
+            'display': 'Hamısı',
+            'base_url': base_url,
+            'widget': self.field.widget.render(
+                self.parameter_name, value if value and value.isdigit() else None
+            ),
+        }
+
+    def queryset(self, request, queryset):
+        value = self.value()
+        if not value:
+            return queryset
+        if not value.isdigit():
+            raise IncorrectLookupParameters(value)
+        return queryset.filter(vacancy_id=value)
+
+
 # Appeal (CV) 
 @admin.register(AppealVacancy)
-class AppealAdmin(admin.ModelAdmin):
+class AppealAdmin(ReadStateMixin, ExportMixin, IndexedSearchMixin, admin.ModelAdmin):
     list_display = (
         'candidate_info',
         'vacancy_info',
@@ -773,7 +936,7 @@ class AppealAdmin(admin.ModelAdmin):
 
     list_display_links = None
     list_editable = ('is_read',)
-    list_filter = ('is_read', 'created_at', 'vacancy')
+    list_filter = (CreatedPeriodFilter, 'is_read', 'created_at', VacancyAutocompleteFilter)
     readonly_fields = ('created_at', 'cv_preview')
     search_fields = (
         'full_name',
@@ -786,6 +949,25 @@ class AppealAdmin(admin.ModelAdmin):
     ordering = ('-created_at',)
     list_per_page = 25
     date_hierarchy = 'created_at'
+    search_trigram_fields = ('full_name', 'email', 'phone_number')
+    # Yüz minlərlə müraciət: COUNT(*) və distinct tarixlər sorğulanmır
+    list_select_related = ('vacancy',)
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    change_list_template = 'admin/projects/appeal_change_list.html'
+    actions = ('mark_read', 'mark_unread', 'export_csv', 'export_xlsx', 'download_cvs')
+    export_fields = (
+        ('id', 'ID'),
+        ('vacancy__title_az', 'Vakansiya'),
+        ('full_name', 'Ad Soyad'),
+        ('email', 'E-poçt'),
+        ('phone_number', 'Mobil nömrə'),
+        ('info', 'Əlavə məlumat'),
+        ('cv', 'CV'),
+        ('cv_original_name', 'CV faylının adı'),
+        ('created_at', 'Tarix'),
+        ('is_read', 'Oxunub'),
+    )
 
     fieldsets = (
         ('Vakansiya', {
@@ -805,6 +987,44 @@ class AppealAdmin(admin.ModelAdmin):
         }),
     )
 
+    @property
+    def media(self):
+        autocomplete = AutocompleteSelect(self.model._meta.get_field('vacancy'), self.admin_site)
+        return (
+            super().media
+            + autocomplete.media
+            + forms.Media(js=['admin/js/jquery.init.js', 'assets/js/admin_autocomplete_filter.js'])
+        )
+
+    @admin.action(description='Seçilənlərin CV-lərini ZIP kimi yüklə', permissions=['view'])
+    def download_cvs(self, request, queryset):
+        return cv_archive_response(queryset)
+
+    def prepare_export_row(self, request, row):
+        # Fayl adı əvəzinə yükləmə linki
+        row = list(row)
+        index = [lookup for lookup, _ in self.export_fields].index('cv')
+        if row[index]:
+            storage = AppealVacancy._meta.get_field('cv').storage
+            row[index] = request.build_absolute_uri(storage.url(row[index]))
+        return row
+
+    def get_search_condition(self, request, search_term):
+        condition = super().get_search_condition(request, search_term)
+        phone_number = normalize_az_phone(search_term)
+        if phone_number:
+            # Nömrələr normallaşdırılmış formada saxlanılır
+            condition |= Q(phone_number=phone_number)
+        # Vakansiyalar azdır: id-lər əvvəlcədən seçilir ki, JOIN lazım olmasın
+        vacancy_ids = list(Vacancy.objects.filter(
+            Q(title_az__icontains=search_term)
+            | Q(title_en__icontains=search_term)
+            | Q(title_ru__icontains=search_term)
+        ).values_list('pk', flat=True))
+        if vacancy_ids:
+            condition |= Q(vacancy_id__in=vacancy_ids)
+        return condition
+
     def candidate_info(self, obj):
         """Namizəd məlumatlarını səliqəli şəkildə göstərir"""
         detail_url = reverse('admin:projects_appealvacancy_change', args=[obj.pk])
@@ -884,9 +1104,9 @@ class AppealAdmin(admin.ModelAdmin):
         detail_url = reverse('admin:projects_appealvacancy_change', args=[obj.pk])
         
         if obj.cv:
-            file_name = obj.cv.name.split('/')[-1]
-            file_size = obj.cv.size if hasattr(obj.cv, 'size') else None
-            size_text = f"{round(file_size / 1024, 1)} KB" if isinstance(file_size, (int, float)) else "N/A"
+            # Saxlanılmış sütunlar: hər sətir üçün fayl sistemi yoxlanılmır
+            file_name = obj.cv_original_name or obj.cv.name.split('/')[-1]
+            size_text = format_file_size(obj.cv_size)
             
             return format_html(
                 '<div style="padding: 8px 0;">'
@@ -953,21 +1173,24 @@ class AppealAdmin(admin.ModelAdmin):
 
     def cv_preview(self, obj):
         if obj.cv:
-            file_name = obj.cv.name.split('/')[-1]
-            file_size = obj.cv.size if hasattr(obj.cv, 'size') else None
+            file_name = obj.cv_original_name or obj.cv.name.split('/')[-1]
 
             return format_html(
                 '<div style="padding:12px;background:#e3f2fd;border-radius:4px;'
                 'border-left:3px solid #2196f3;">'
                 '<span style="color:#1976d2;font-weight:500;">📄 {}</span> '
-                '<span style="color:#666;font-size:12px;">({} KB)</span>'
+                '<span style="color:#666;font-size:12px;">({}, {})</span>'
                 '<a href="{}" target="_blank" '
                 'style="color:#2196f3;text-decoration:none;margin-left:8px;font-weight:500;">'
                 '📥 Endir</a>'
+                '<div style="color:#999;font-size:11px;margin-top:4px;font-family:monospace;">'
+                'SHA-256: {}</div>'
                 '</div>',
                 file_name,
-                round(file_size / 1024, 2) if isinstance(file_size, (int, float)) else 'N/A',
-                obj.cv.url
+                format_file_size(obj.cv_size),
+                obj.cv_content_type or 'N/A',
+                obj.cv.url,
+                obj.cv_sha256 or 'N/A'
             )
         return "-"
 
@@ -976,7 +1199,7 @@ class AppealAdmin(admin.ModelAdmin):
 
 # AppealContact (Contact Messages)
 @admin.register(AppealContact)
-class AppealContactAdmin(admin.ModelAdmin):
+class AppealContactAdmin(ReadStateMixin, ExportMixin, admin.ModelAdmin):
     list_display = (
         'sender_info',
         'subject_preview',
@@ -988,7 +1211,7 @@ class AppealContactAdmin(admin.ModelAdmin):
 
     list_display_links = None
     list_editable = ('is_read',)
-    list_filter = ('is_read', 'created_at', 'created_date')
+    list_filter = (CreatedPeriodFilter, 'is_read', 'created_at')
     readonly_fields = ('created_at', 'created_date')
     search_fields = (
         'full_name',
@@ -999,6 +1222,19 @@ class AppealContactAdmin(admin.ModelAdmin):
     ordering = ('-created_at',)
     list_per_page = 25
     date_hierarchy = 'created_at'
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    change_list_template = 'admin/projects/appeal_change_list.html'
+    actions = ('mark_read', 'mark_unread', 'export_csv', 'export_xlsx')
+    export_fields = (
+        ('id', 'ID'),
+        ('full_name', 'Ad Soyad'),
+        ('email', 'E-poçt'),
+        ('subject', 'Mövzu'),
+        ('info', 'Mesaj'),
+        ('created_at', 'Tarix'),
+        ('is_read', 'Oxunub'),
+    )
 
     fieldsets = (
         ('Göndərən Məlumatları', {
@@ -0,0 +1,254 @@
+from django import forms
+from django.contrib import admin
+from django.contrib.admin.options import IncorrectLookupParameters
+from django.contrib.admin.utils import unquote
+from django.contrib.postgres.search import SearchQuery
+from django.core import signing
+from django.core.exceptions import PermissionDenied, ValidationError
+from django.db.models import Q
+from django.http import Http404, JsonResponse, StreamingHttpResponse
+from django.shortcuts import get_object_or_404
+from django.urls import path
+from django.utils import timezone
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import require_GET, require_POST
+
+from projects.models import Media
+from projects.models.search_models import ADMIN_SEARCH_CONFIG
+from projects.utils.gallery import (
+    create_media, discard_uploads, gallery_item, gallery_page, pending_uploads, store_upload,
+    unsign_uploads,
+)
+from projects.utils.read_state import set_read_state
+from projects.utils.exports import (
+    CSV_CONTENT_TYPE, XLSX_CONTENT_TYPE, export_rows, stream_csv, stream_xlsx,
+)
+from projects.utils.search import query_terms
+
+
+class IndexedSearchMixin:
+    """
+    Changelist search served by indexes instead of an OR of ILIKE '%term%'
+    scans over every search_fields column.
+
+    search_vector_index: name of the model's admin_search_index(); every word
+    of the search is a prefix match against that tsvector.
+    search_trigram_fields: short columns (names, e-mail, phone) additionally
+    matched by substring; pg_trgm GIN indexes serve these. Without pg_trgm
+    the substring match still runs, as an unindexed scan.
+    """
+    search_vector_index = None
+    search_trigram_fields = ()
+
+    def get_search_vector(self):
+        for index in self.model._meta.indexes:
+            if index.name == self.search_vector_index:
+                return index.expressions[0]
+        raise LookupError(f'{self.model.__name__} has no index {self.search_vector_index!r}')
+
+    def get_search_condition(self, request, search_term):
+        condition = Q()
+        terms = query_terms(search_term.lower())
+        if self.search_vector_index and terms:
+            condition |= Q(admin_search_document=SearchQuery(
+                ' & '.join(f'{term}:*' for term in terms),
+                config=ADMIN_SEARCH_CONFIG,
+                search_type='raw',
+            ))
+        for field in self.search_trigram_fields:
+            condition |= Q(**{f'{field}__icontains': search_term})
+        return condition
+
+    def get_search_results(self, request, queryset, search_term):
+        search_term = search_term.strip()
+        if not search_term:
+            return queryset, False
+
+        if self.search_vector_index:
+            queryset = queryset.alias(admin_search_document=self.get_search_vector())
+        condition = self.get_search_condition(request, search_term)
+        if not condition:
+            return queryset.none(), False
+        return queryset.filter(condition), False
+
+
+class ExportMixin:
+    """
+    Streamed CSV/XLSX export: the export_csv/export_xlsx actions take the
+    selected rows, export/<csv|xlsx>/ (linked above the changelist) takes
+    everything the current filters and search match.
+
+    export_fields: ((lookup, header), ...) read with values_list().
+    """
+    export_fields = ()
+    export_content_types = {
+        'csv': CSV_CONTENT_TYPE,
+        'xlsx': XLSX_CONTENT_TYPE,
+    }
+
+    def get_urls(self):
+        info = self.opts.app_label, self.opts.model_name
+        return [
+            path(
+                'export/<str:file_format>/',
+                self.admin_site.admin_view(self.export_view),
+                name='%s_%s_export' % info,
+            ),
+        ] + super().get_urls()
+
+    def prepare_export_row(self, request, row):
+        return row
+
+    def export_response(self, request, queryset, file_format):
+        lookups = [lookup for lookup, _ in self.export_fields]
+        headers = [header for _, header in self.export_fields]
+        rows = (self.prepare_export_row(request, row) for row in export_rows(queryset, lookups))
+
+        if file_format == 'xlsx':
+            content = stream_xlsx(headers, rows, sheet_name=str(self.opts.verbose_name_plural))
+        else:
+            content = stream_csv(headers, rows)
+        response = StreamingHttpResponse(content, content_type=self.export_content_types[file_format])
+        filename = f'{self.opts.model_name}-{timezone.localdate():%Y-%m-%d}.{file_format}'
+        response['Content-Disposition'] = f'attachment; filename="{filename}"'
+        return response
+
+    def export_view(self, request, file_format):
+        if not self.has_view_permission(request):
+            raise PermissionDenied
+        if file_format not in self.export_content_types:
+            raise Http404
+        try:
+            changelist = self.get_changelist_instance(request)
+        except IncorrectLookupParameters:
+            raise Http404
+        return self.export_response(request, changelist.queryset, file_format)
+
+    @admin.action(description='Seçilənləri CSV kimi yüklə', permissions=['view'])
+    def export_csv(self, request, queryset):
+        return self.export_response(request, queryset, 'csv')
+
+    @admin.action(description='Seçilənləri XLSX kimi yüklə', permissions=['view'])
+    def export_xlsx(self, request, queryset):
+        return self.export_response(request, queryset, 'xlsx')
+
+
+class ReadStateMixin:
+    """
+    mark_read/mark_unread actions: one UPDATE for the whole selection
+    (set_read_state) instead of list_editable saving row by row.
+    """
+
+    def update_read_state(self, request, queryset, is_read):
+        count = set_read_state(queryset, is_read)
+        state = 'oxunmuş' if is_read else 'oxunmamış'
+        self.message_user(request, f'{count} {self.opts.verbose_name_plural} {state} kimi qeyd edildi.')
+
+    @admin.action(description='Seçilənləri oxunmuş kimi qeyd et', permissions=['change'])
+    def mark_read(self, request, queryset):
+        self.update_read_state(request, queryset, True)
+
+    @admin.action(description='Seçilənləri oxunmamış kimi qeyd et', permissions=['change'])
+    def mark_unread(self, request, queryset):
+        self.update_read_state(request, queryset, False)
+
+
+class GalleryMixin:
+    """
+    Media gallery on the change form in place of a Media inline: thumbnails
+    of existing media are fetched a page at a time, new files are uploaded
+    one request each and their Media rows are created in one bulk_create
+    (projects.utils.gallery).
+
+    gallery_fk: the Media foreign key pointing at this model.
+    gallery_max_images: limit of images per object, None for no limit.
+    """
+    gallery_fk = None
+    gallery_max_images = None
+    change_form_template = 'admin/projects/gallery_change_form.html'
+
+    def get_urls(self):
+        info = self.opts.app_label, self.opts.model_name
+        wrap = self.admin_site.admin_view
+        return [
+            path('<path:object_id>/gallery/', wrap(self.gallery_view), name='%s_%s_gallery' % info),
+            path(
+                '<path:object_id>/gallery/upload/',
+                wrap(self.gallery_upload_view),
+                name='%s_%s_gallery_upload' % info,
+            ),
+            path(
+                '<path:object_id>/gallery/create/',
+                wrap(self.gallery_create_view),
+                name='%s_%s_gallery_create' % info,
+            ),
+            path(
+                '<path:object_id>/gallery/<int:media_id>/delete/',
+                wrap(self.gallery_delete_view),
+                name='%s_%s_gallery_delete' % info,
+            ),
+        ] + super().get_urls()
+
+    def get_gallery_owner(self, request, object_id, change=False):
+        obj = self.get_object(request, unquote(object_id))
+        if obj is None:
+            raise Http404
+        allowed = self.has_change_permission(request, obj) if change else self.has_view_permission(request, obj)
+        if not allowed:
+            raise PermissionDenied
+        return obj
+
+    def get_gallery_queryset(self, obj):
+        return Media.objects.filter(**{self.gallery_fk: obj}).exclude(image='')
+
+    def gallery_error(self, message):
+        return JsonResponse({'error': message}, status=400)
+
+    @method_decorator(require_GET)
+    def gallery_view(self, request, object_id):
+        obj = self.get_gallery_owner(request, object_id)
+        after = request.GET.get('after', '')
+        if after and not after.isdigit():
+            return self.gallery_error('Yanlış səhifə.')
+        medias, next_after = gallery_page(self.get_gallery_queryset(obj), int(after) if after else None)
+        return JsonResponse({'items': [gallery_item(media) for media in medias], 'next': next_after})
+
+    @method_decorator(require_POST)
+    def gallery_upload_view(self, request, object_id):
+        self.get_gallery_owner(request, object_id, change=True)
+        try:
+            upload = forms.ImageField().clean(request.FILES.get('file'))
+        except ValidationError as e:
+            return self.gallery_error(' '.join(e.messages))
+        return JsonResponse({'token': store_upload(upload)})
+
+    @method_decorator(require_POST)
+    def gallery_create_view(self, request, object_id):
+        obj = self.get_gallery_owner(request, object_id, change=True)
+        try:
+            names = unsign_uploads(request.POST.getlist('token'))
+        except signing.BadSignature:
+            return self.gallery_error('Yükləmənin müddəti bitib, faylları yenidən seçin.')
+        # Təkrar göndərilən tokenlərin faylları artıq Media-dır: nə sayılır, nə silinir
+        names = pending_uploads(names)
+
+        if self.gallery_max_images is not None:
+            total = self.get_gallery_queryset(obj).count() + len(names)
+            if total > self.gallery_max_images:
+                discard_uploads(names)
+                return self.gallery_error(
+                    f'Maksimum {self.gallery_max_images} şəkil yükləmək mümkündür (ümumi: {total}).'
+                )
+
+        medias = create_media(self.gallery_fk, obj, names)
+        if medias:
+            self.log_change(request, obj, f'{len(medias)} şəkil əlavə edildi.')
+        return JsonResponse({'items': [gallery_item(media) for media in medias]})
+
+    @method_decorator(require_POST)
+    def gallery_delete_view(self, request, object_id, media_id):
+        obj = self.get_gallery_owner(request, object_id, change=True)
+        media = get_object_or_404(self.get_gallery_queryset(obj), pk=media_id)
+        media.delete()
+        self.log_change(request, obj, f'Şəkil silindi (ID: {media_id}).')
+        return JsonResponse({'deleted': media_id})
@@ -0,0 +1,48 @@
+import json
+
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
+
+
+def estimate_table_rows(using, table):
+    """pg_class statistics; a partitioned table is the sum of its partitions."""
+    with connections[using].cursor() as cursor:
+        cursor.execute(
+            "SELECT COALESCE(SUM(GREATEST(reltuples, 0)), 0) FROM pg_class "
+            "WHERE relkind = 'r' AND (oid = %s::regclass "
+            "OR oid IN (SELECT relid FROM pg_partition_tree(%s::regclass)))",
+            [table, table],
+        )
+        return int(cursor.fetchone()[0])
+
+
+def estimate_query_rows(queryset):
+    """Row estimate of the planner for a filtered queryset."""
+    plan = json.loads(queryset.order_by().explain(format='json'))
+    return int(plan[0]['Plan']['Plan Rows'])
+
+
+def estimate_count(queryset):
+    if connections[queryset.db].vendor != 'postgresql':
+        return None
+    if queryset.query.where:
+        return estimate_query_rows(queryset)
+    return estimate_table_rows(queryset.db, queryset.model._meta.db_table)
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Changelist paginator that does not COUNT(*) large tables: the count is the
+    planner's estimate. Below `exact_threshold` rows the estimate is replaced
+    by the exact count, which is cheap there (and right after a bulk load,
+    before ANALYZE, the statistics still say 0).
+    """
+    exact_threshold = 10000
+
+    @cached_property
+    def count(self):
+        estimate = estimate_count(self.object_list)
+        if estimate is None or estimate < self.exact_threshold:
+            return super().count
+        return estimate
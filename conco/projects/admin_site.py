@@ -0,0 +1,45 @@
+from django.contrib import admin
+from django.utils.html import format_html
+
+from projects.utils.activity import dashboard_data
+from projects.utils.counters import get_counters, UNREAD_APPEALS, UNREAD_CONTACTS
+
+
+class ConcoAdminSite(admin.AdminSite):
+    """
+    Admin index and sidebar with unread badges next to CVs and contact
+    messages; the index starts with the activity dashboard (utils/activity.py).
+    """
+    index_template = 'admin/projects/dashboard_index.html'
+
+    # model_name -> Counter açarı
+    unread_badges = {
+        'appealvacancy': UNREAD_APPEALS,
+        'appealcontact': UNREAD_CONTACTS,
+    }
+
+    def get_app_list(self, request, app_label=None):
+        app_list = super().get_app_list(request, app_label)
+        models = [
+            model for app in app_list for model in app['models']
+            if app['app_label'] == 'projects' and model['object_name'].lower() in self.unread_badges
+        ]
+        if not models:
+            return app_list
+
+        values = get_counters(self.unread_badges.values())
+        for model in models:
+            unread = values[self.unread_badges[model['object_name'].lower()]]
+            if unread > 0:
+                model['name'] = format_html(
+                    '{} <span style="background: #dc3545; color: white; padding: 1px 7px; '
+                    'border-radius: 10px; font-size: 11px; font-weight: bold;">{}</span>',
+                    model['name'], unread,
+                )
+        return app_list
+
+    def index(self, request, extra_context=None):
+        extra_context = extra_context or {}
+        if request.user.has_perm('projects.view_appealvacancy'):
+            extra_context['dashboard'] = dashboard_data()
+        return super().index(request, extra_context)
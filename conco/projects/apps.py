@@ -1,4 +1,5 @@
 from django.apps import AppConfig
+from django.contrib.admin import apps as admin_apps
 
 
 class ProjectsConfig(AppConfig):
@@ -7,3 +8,9 @@ class ProjectsConfig(AppConfig):
 
     def ready(self):
         import projects.signals
+
+
+class ProjectsAdminConfig(admin_apps.AdminConfig):
+    # INSTALLED_APPS-da django.contrib.admin əvəzinə; 'projects' üçün default deyil
+    default = False
+    default_site = 'projects.admin_site.ConcoAdminSite'
@@ -2,6 +2,7 @@ from django import forms
 from django.core.exceptions import ValidationError
 from django.utils.translation import gettext_lazy as _
 from projects.models import AppealVacancy, AppealContact
+from projects.utils import normalize_az_phone
 
 
 class AppealForm(forms.ModelForm):
@@ -69,6 +70,16 @@ class AppealForm(forms.ModelForm):
             raise ValidationError(_('Xəta baş verdi. Zəhmət olmasa yenidən cəhd edin.'))
         return value
 
+    def clean_email(self):
+        # Təkrar müraciət yoxlaması normallaşdırılmış açarlar üzrə aparılır
+        return self.cleaned_data['email'].strip().lower()
+
+    def clean_phone_number(self):
+        phone_number = normalize_az_phone(self.cleaned_data['phone_number'])
+        if not phone_number:
+            raise ValidationError(_('Düzgün Azərbaycan mobil nömrəsi deyil.'))
+        return phone_number
+
 
 class AppealContactForm(forms.ModelForm):
     website = forms.CharField(
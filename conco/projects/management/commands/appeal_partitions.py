@@ -0,0 +1,125 @@
+from django.conf import settings
+from django.core.files.storage import FileSystemStorage
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.utils import timezone
+
+from projects.models import AppealVacancy, AppealVacancyKey
+from projects.utils.cache_utils import invalidate_model_cache
+from projects.utils.counters import rebuild_counters
+from projects.utils.partitions import (
+    PARTITIONED_TABLES, ARCHIVE_SCHEMA, add_months, month_start,
+    ensure_partitions, is_partitioned, list_partitions, archive_partition,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        'Creates the upcoming monthly partitions of the appeal tables and, with '
+        '--retain-months, detaches older partitions into the archive schema '
+        'after moving their CV files to APPEAL_ARCHIVE_ROOT. Run it monthly (cron).'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--ahead', type=int, default=3,
+            help='Months to prepare after the current one (default: 3).'
+        )
+        parser.add_argument(
+            '--retain-months', type=int,
+            help='Keep this many months (the current one included); archive the older partitions.'
+        )
+        parser.add_argument(
+            '--drop', action='store_true',
+            help=f'Drop archived partitions instead of moving them to the "{ARCHIVE_SCHEMA}" schema.'
+        )
+        parser.add_argument('--dry-run', action='store_true')
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'postgresql':
+            raise CommandError('Appeal partitioning needs PostgreSQL.')
+
+        this_month = month_start(timezone.now())
+        until = add_months(this_month, options['ahead'])
+        retain = options['retain_months']
+        if retain is not None and retain < 1:
+            raise CommandError('--retain-months must be at least 1.')
+
+        archived = False
+        with transaction.atomic(), connection.cursor() as cursor:
+            for table in PARTITIONED_TABLES:
+                if not is_partitioned(cursor, table):
+                    raise CommandError(f'{table} is not partitioned, run migrate first.')
+
+                if options['dry_run']:
+                    existing = {name for name, _ in list_partitions(cursor, table)}
+                    month = this_month
+                    while month <= until:
+                        name = f'{table}_p{month:%Y_%m}'
+                        if name not in existing:
+                            self.stdout.write(f'would create {name}')
+                        month = add_months(month, 1)
+                else:
+                    for name in ensure_partitions(cursor, table, this_month, until):
+                        self.stdout.write(self.style.SUCCESS(f'created {name}'))
+
+                if retain is None:
+                    continue
+
+                cutoff = add_months(this_month, 1 - retain)
+                for name, month in list_partitions(cursor, table):
+                    if month >= cutoff:
+                        break
+                    if options['dry_run']:
+                        self.stdout.write(f'would archive {name}')
+                        continue
+                    if table == AppealVacancy._meta.db_table:
+                        copied = self.copy_cvs(cursor, name)
+                        # Media copies go only once DETACH/DROP is committed:
+                        # a rollback leaves every row with its file
+                        transaction.on_commit(lambda copied=copied: self.delete_cvs(copied))
+                        self.stdout.write(f'{name}: {len(copied)} CV files copied to {settings.APPEAL_ARCHIVE_ROOT}')
+                        self.delete_appeal_keys(cursor, name)
+                    archive_partition(cursor, table, name, drop=options['drop'])
+                    archived = True
+                    self.stdout.write(self.style.SUCCESS(
+                        f'{"dropped" if options["drop"] else "archived"} {name}'
+                    ))
+
+            if archived:
+                # Archived applicants no longer count on the site
+                rebuild_counters()
+
+        if archived:
+            invalidate_model_cache('AppealVacancy')
+
+    def copy_cvs(self, cursor, partition):
+        """Copy CVs of the partition to cold storage; returns the copied names."""
+        source = AppealVacancy._meta.get_field('cv').storage
+        target = FileSystemStorage(location=settings.APPEAL_ARCHIVE_ROOT)
+
+        cursor.execute(f'SELECT cv FROM "{partition}" WHERE cv <> \'\'')
+        copied = []
+        for (name,) in cursor.fetchall():
+            if not source.exists(name):
+                continue
+            with source.open(name) as cv_file:
+                # Keep the relative name so archived rows still point to the file
+                if target.exists(name):
+                    target.delete(name)
+                target.save(name, cv_file)
+            copied.append(name)
+        return copied
+
+    def delete_cvs(self, names):
+        source = AppealVacancy._meta.get_field('cv').storage
+        for name in names:
+            source.delete(name)
+        self.stdout.write(f'{len(names)} archived CV files removed from media')
+
+    def delete_appeal_keys(self, cursor, partition):
+        """Archived applicants may apply again: drop their duplicate-detection keys."""
+        cursor.execute(
+            f'DELETE FROM "{AppealVacancyKey._meta.db_table}" '
+            f'WHERE appeal_id IN (SELECT id FROM "{partition}")'
+        )
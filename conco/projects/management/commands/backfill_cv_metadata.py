@@ -0,0 +1,58 @@
+from django.core.management.base import BaseCommand
+
+from projects.models import AppealVacancy
+from projects.utils.file_metadata import read_file_metadata
+
+
+METADATA_FIELDS = ['cv_size', 'cv_content_type', 'cv_original_name', 'cv_sha256']
+
+
+class Command(BaseCommand):
+    help = (
+        'Stores size, content type, name and SHA-256 of the CVs uploaded before '
+        'the metadata was recorded at upload time.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=200)
+        parser.add_argument(
+            '--all', action='store_true',
+            help='Recompute the metadata of every appeal, not only the missing ones.'
+        )
+
+    def handle(self, *args, **options):
+        storage = AppealVacancy._meta.get_field('cv').storage
+        appeals = AppealVacancy.objects.exclude(cv='').only('pk', 'cv', 'cv_original_name').order_by('pk')
+        if not options['all']:
+            appeals = appeals.filter(cv_size__isnull=True)
+
+        updated = missing = 0
+        batch = []
+        for appeal in appeals.iterator(chunk_size=options['batch_size']):
+            if not storage.exists(appeal.cv.name):
+                missing += 1
+                self.stderr.write(f'#{appeal.pk}: {appeal.cv.name} tapılmadı')
+                continue
+
+            with storage.open(appeal.cv.name) as cv_file:
+                # The uploaded name is unknown for old rows: storage may have
+                # added a suffix, so only an already recorded name is kept
+                metadata = read_file_metadata(cv_file, appeal.cv_original_name or appeal.cv.name)
+            appeal.cv_size = metadata['size']
+            appeal.cv_content_type = metadata['content_type']
+            appeal.cv_original_name = metadata['original_name']
+            appeal.cv_sha256 = metadata['sha256']
+            batch.append(appeal)
+
+            if len(batch) >= options['batch_size']:
+                updated += self.flush(batch)
+        updated += self.flush(batch)
+
+        self.stdout.write(self.style.SUCCESS(f'{updated} CV updated, {missing} missing'))
+
+    def flush(self, batch):
+        # Only the metadata columns: save() would fire the appeal signals
+        AppealVacancy.objects.bulk_update(batch, METADATA_FIELDS)
+        count = len(batch)
+        batch.clear()
+        return count
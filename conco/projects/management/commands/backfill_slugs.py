@@ -0,0 +1,91 @@
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.db.models import Q
+
+from projects.models import Project, ProjectCategory, SearchEntry, Vacancy
+from projects.utils import SluggedModel
+from projects.utils.cache_utils import invalidate_model_cache
+from projects.utils.read_tables import schedule_project_cards_refresh, schedule_vacancy_cards_refresh
+from projects.utils.search import schedule_search_refresh
+from projects.utils.slug_routes import record_slug, route_kind
+from projects.utils.typeahead import schedule_typeahead_rebuild
+from projects.utils.unique_slugify import assign_unique_slugs
+
+
+def refresh_slug_readers(model, rows):
+    """
+    bulk_update sends no post_save: do what the slug receivers would have
+    done (routes, read tables, search rows, caches, typeahead) for `rows`.
+    """
+    kind = route_kind(model)
+    if kind:
+        for row in rows:
+            record_slug(kind, row.pk, row.slug)
+
+    ids = [row.pk for row in rows]
+    if model is Project:
+        schedule_project_cards_refresh(project_ids=ids)
+        schedule_search_refresh(SearchEntry.Kind.PROJECT, ids)
+    elif model is ProjectCategory:
+        # Project cards carry the category slug
+        project_ids = list(Project.objects.filter(category_id__in=ids).values_list('pk', flat=True))
+        if project_ids:
+            schedule_project_cards_refresh(project_ids=project_ids)
+    elif model is Vacancy:
+        schedule_vacancy_cards_refresh(vacancy_ids=ids)
+        schedule_search_refresh(SearchEntry.Kind.VACANCY, ids)
+
+    invalidate_model_cache(model.__name__)
+    schedule_typeahead_rebuild()
+
+
+def get_slugged_models():
+    return [
+        model for model in apps.get_app_config('projects').get_models()
+        if issubclass(model, SluggedModel)
+    ]
+
+
+class Command(BaseCommand):
+    help = (
+        'Assigns slugs to rows that have none (e.g. after a bulk import). '
+        'Existing slugs are read once per model and the new ones are written with bulk_update. '
+        'Importers can call utils.unique_slugify.assign_unique_slugs() before bulk_create instead.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--model', action='append', dest='models',
+            help='Model name (Project, ProjectCategory, Vacancy). Default: all slugged models.'
+        )
+        parser.add_argument('--batch-size', type=int, default=1000)
+        parser.add_argument('--dry-run', action='store_true')
+
+    def handle(self, *args, **options):
+        models = get_slugged_models()
+        if options['models']:
+            wanted = {name.lower() for name in options['models']}
+            models = [model for model in models if model.__name__.lower() in wanted]
+            if not models:
+                raise CommandError(f"Unknown model: {', '.join(options['models'])}")
+
+        for model in models:
+            self.backfill(model, options['batch_size'], options['dry_run'])
+
+    def backfill(self, model, batch_size, dry_run):
+        manager = model._default_manager
+        missing = Q(slug='') | Q(slug__isnull=True)
+
+        with transaction.atomic():
+            # The unique index still guards against rows inserted meanwhile;
+            # on IntegrityError the whole model is rolled back and can be rerun.
+            rows = assign_unique_slugs(list(manager.filter(missing).order_by('pk')))
+
+            if not dry_run:
+                manager.bulk_update(rows, ['slug'], batch_size=batch_size)
+                if rows:
+                    refresh_slug_readers(model, rows)
+
+        label = 'would get' if dry_run else 'got'
+        self.stdout.write(self.style.SUCCESS(f'{model.__name__}: {len(rows)} rows {label} a slug'))
@@ -0,0 +1,130 @@
+import statistics
+import time
+
+from django.contrib import admin
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.core.paginator import Paginator
+from django.db import connection, transaction
+from django.test import Client
+from django.test.utils import override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from projects.admin.admin_v1 import VacancyAutocompleteFilter
+from projects.models import AppealVacancy, Vacancy
+from projects.utils.partitions import add_months, ensure_partitions, month_start
+
+
+INSERT_SQL = """
+    INSERT INTO projects_appealvacancy (
+        vacancy_id, full_name, email, phone_number, info, cv,
+        cv_content_type, cv_original_name, cv_sha256, created_at, is_read
+    )
+    SELECT
+        v.ids[1 + i %% array_length(v.ids, 1)],
+        'Namizəd ' || i,
+        'bench' || i || '@example.com',
+        '50' || lpad((i %% 10000000)::text, 7, '0'),
+        '',
+        'cvs/bench.pdf',
+        'application/pdf',
+        'bench.pdf',
+        '',
+        %s::timestamptz + random() * (now() - %s::timestamptz),
+        i %% 3 = 0
+    FROM generate_series(%s, %s) AS i, (SELECT array_agg(id) AS ids FROM projects_vacancy) AS v
+"""
+
+# What the changelist looked like before the estimated counts
+DJANGO_DEFAULTS = {
+    'paginator': Paginator,
+    'show_full_result_count': True,
+    'change_list_template': None,
+    'list_select_related': False,
+}
+
+
+class Command(BaseCommand):
+    help = (
+        'Loads synthetic appeals (rolled back afterwards) and compares the '
+        'AppealAdmin changelist latency with Django\'s defaults (COUNT(*), '
+        'vacancy list filter, distinct-date hierarchy) against the current setup.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, nargs='+', default=[10000, 100000, 1000000])
+        parser.add_argument('--requests', type=int, default=5)
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'postgresql':
+            raise CommandError('The benchmark needs PostgreSQL.')
+        if not Vacancy.objects.exists():
+            raise CommandError('Create at least one vacancy first.')
+
+        model_admin = admin.site._registry[AppealVacancy]
+        baseline = DJANGO_DEFAULTS | {
+            'list_filter': tuple(
+                'vacancy' if spec is VacancyAutocompleteFilter else spec
+                for spec in model_admin.list_filter
+            ),
+        }
+        optimized = {name: getattr(type(model_admin), name) for name in baseline}
+
+        this_month = month_start(timezone.now())
+        since = add_months(this_month, -11)
+        vacancy_id = Vacancy.objects.values_list('pk', flat=True).first()
+        changelist = reverse('admin:projects_appealvacancy_changelist')
+        urls = [
+            changelist,
+            f'{changelist}?vacancy__id__exact={vacancy_id}',
+            f'{changelist}?created_at__year={this_month.year}&created_at__month={this_month.month}',
+        ]
+
+        try:
+            with transaction.atomic(), override_settings(ALLOWED_HOSTS=['testserver']):
+                user = get_user_model().objects.create_superuser('bench-admin', 'bench@example.com', None)
+                client = Client()
+                client.force_login(user)
+
+                with connection.cursor() as cursor:
+                    ensure_partitions(cursor, AppealVacancy._meta.db_table, since, this_month)
+
+                loaded = AppealVacancy.objects.count()
+                for rows in sorted(options['rows']):
+                    if rows > loaded:
+                        started = time.perf_counter()
+                        with connection.cursor() as cursor:
+                            cursor.execute(INSERT_SQL, [since, since, loaded + 1, rows])
+                            cursor.execute(f'ANALYZE {AppealVacancy._meta.db_table}')
+                        loaded = rows
+                        self.stdout.write(f'{rows} rows loaded in {time.perf_counter() - started:.1f} s')
+
+                    for url in urls:
+                        results = []
+                        for settings_ in (baseline, optimized):
+                            for name, value in settings_.items():
+                                setattr(model_admin, name, value)
+                            results.append(self.measure(client, url, options['requests']))
+                        self.stdout.write(
+                            f'  {rows:>8} {url:<70} '
+                            f'django {results[0]:8.1f} ms   current {results[1]:8.1f} ms'
+                        )
+
+                transaction.set_rollback(True)
+        finally:
+            for name in baseline:
+                model_admin.__dict__.pop(name, None)
+
+    def measure(self, client, url, requests):
+        timings = []
+        for index in range(requests + 1):
+            started = time.perf_counter()
+            response = client.get(url)
+            elapsed = (time.perf_counter() - started) * 1000
+            if response.status_code != 200:
+                raise CommandError(f'{url} returned {response.status_code}')
+            # The first request warms up templates and caches
+            if index:
+                timings.append(elapsed)
+        return statistics.median(timings)
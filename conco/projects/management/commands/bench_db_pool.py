@@ -0,0 +1,99 @@
+import statistics
+import time
+
+from django.core.cache import cache
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, connections
+from django.test import Client
+from django.test.utils import override_settings
+
+
+DEFAULT_POOL = {'min_size': 2, 'max_size': 4}
+
+
+class Command(BaseCommand):
+    help = (
+        'Compares request latency with a new PostgreSQL connection per request '
+        'against the psycopg 3 connection pool.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=200)
+        parser.add_argument('--url', default='/')
+        parser.add_argument(
+            '--cold', action='store_true',
+            help='Clear the cache before every request so the page is rebuilt from the database.'
+        )
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'postgresql':
+            raise CommandError('Connection pooling needs PostgreSQL.')
+        try:
+            import psycopg_pool  # noqa: F401
+        except ImportError:
+            raise CommandError('Install psycopg[pool] (psycopg 3) to benchmark the pool.')
+
+        pool_options = connection.settings_dict['OPTIONS'].get('pool') or DEFAULT_POOL
+        original = {
+            alias: (connections[alias].settings_dict['OPTIONS'], connections[alias].settings_dict['CONN_MAX_AGE'])
+            for alias in connections
+        }
+
+        results = {}
+        try:
+            for label, db_options in (('no pool', {}), ('pool', {'pool': pool_options})):
+                self.configure(db_options)
+                results[label] = self.measure(options)
+        finally:
+            self.close_all()
+            for alias, (db_options, max_age) in original.items():
+                connections[alias].settings_dict['OPTIONS'] = db_options
+                connections[alias].settings_dict['CONN_MAX_AGE'] = max_age
+
+        for label, timings in results.items():
+            timings.sort()
+            self.stdout.write(
+                f'{label}: median {statistics.median(timings):.2f} ms, '
+                f'mean {statistics.mean(timings):.2f} ms, '
+                f'p95 {timings[int(len(timings) * 0.95) - 1]:.2f} ms, '
+                f'max {timings[-1]:.2f} ms'
+            )
+
+    def configure(self, db_options):
+        self.close_all()
+        for alias in connections:
+            connections[alias].settings_dict['OPTIONS'] = {
+                key: value for key, value in connections[alias].settings_dict['OPTIONS'].items()
+                if key != 'pool'
+            } | db_options
+            connections[alias].settings_dict['CONN_MAX_AGE'] = 0
+            pool = connections[alias].pool
+            if pool is not None:
+                pool.open(wait=True)
+
+    def close_all(self):
+        for alias in connections:
+            connections[alias].close()
+            connections[alias].close_pool()
+
+    def measure(self, options):
+        client = Client()
+        timings = []
+        with override_settings(ALLOWED_HOSTS=['testserver']):
+            for index in range(options['requests'] + 1):
+                if options['cold']:
+                    cache.clear()
+                started = time.perf_counter()
+                response = client.get(options['url'])
+                # The test client keeps connections open; a real request
+                # closes them (or hands them back to the pool) when it ends
+                for conn in connections.all(initialized_only=True):
+                    conn.close()
+                elapsed = (time.perf_counter() - started) * 1000
+
+                if response.status_code != 200:
+                    raise CommandError(f'{options["url"]} returned {response.status_code}')
+                # The first request only warms up the caches
+                if index:
+                    timings.append(elapsed)
+        return timings
@@ -0,0 +1,59 @@
+import statistics
+import time
+
+from django.core.cache import cache
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext, override_settings
+
+from projects.utils.queries import get_home_page_data
+from projects.utils.page_composer import compose_home_page_data
+
+
+class Command(BaseCommand):
+    help = 'Compares the ORM home page build against the single-query PostgreSQL composer (cache bypassed).'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--iterations', type=int, default=50)
+        parser.add_argument('--lang', default='az', choices=['az', 'en', 'ru'])
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'postgresql':
+            raise CommandError('The SQL composer needs PostgreSQL.')
+
+        lang = options['lang']
+        request = RequestFactory().get('/')
+        # Skip the page cache, only the build itself is measured
+        build_orm = get_home_page_data.__wrapped__
+
+        def orm_path():
+            with override_settings(PAGE_COMPOSER_SQL=False):
+                return build_orm(request, lang)
+
+        def sql_path():
+            return compose_home_page_data(request, lang)
+
+        results = {}
+        for label, build in (('orm', orm_path), ('sql', sql_path)):
+            timings = []
+            for _ in range(options['iterations']):
+                # The ORM path still goes through cached_query helpers
+                cache.clear()
+                with CaptureQueriesContext(connection) as queries:
+                    started = time.perf_counter()
+                    payload = build()
+                    timings.append((time.perf_counter() - started) * 1000)
+            results[label] = (payload, timings, len(queries))
+
+        for label, (payload, timings, query_count) in results.items():
+            self.stdout.write(
+                f'{label}: {query_count} queries, '
+                f'median {statistics.median(timings):.2f} ms, '
+                f'mean {statistics.mean(timings):.2f} ms, '
+                f'max {max(timings):.2f} ms'
+            )
+
+        same = results['orm'][0] == results['sql'][0]
+        style = self.style.SUCCESS if same else self.style.WARNING
+        self.stdout.write(style(f'payloads identical: {"yes" if same else "no"}'))
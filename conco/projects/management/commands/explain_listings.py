@@ -0,0 +1,107 @@
+import json
+import re
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from projects.models import ProjectCategory, Service, Media, MediaPlacement, Placement, AppealVacancy
+from projects.utils.queries import get_projects, get_vacancies, get_partners, get_project_cards, get_vacancy_cards
+
+
+def get_listing_querysets():
+    """
+    Public listing queries from queries.py, built the same way the pages build
+    them, together with the index each one is expected to use.
+    """
+    category_slug = ProjectCategory.objects.values_list('slug', flat=True).first() or 'x'
+    listings = [
+        ('home projects', get_projects(is_active=True, on_main_page=True), 'project_listing_idx'),
+        ('special projects', get_projects(is_active=True, on_main_page=True, speacial_project=True), 'project_listing_idx'),
+        ('category projects', get_projects(category_slug=category_slug), 'project_category_listing_idx'),
+        ('vacancies', get_vacancies(is_active=True), 'vacancy_listing_idx'),
+        ('project cards', get_project_cards(lang='az'), 'project_card_listing_idx'),
+        ('category project cards', get_project_cards(lang='az', category_slug='x'), 'project_card_category_idx'),
+        ('vacancy cards', get_vacancy_cards(lang='az'), 'vacancy_card_listing_idx'),
+        ('partners', get_partners(is_active=True), 'partner_listing_idx'),
+        ('services', Service.objects.filter(is_active=True).order_by('-created_at'), 'service_listing_idx'),
+        ('project medias', Media.objects.filter(project_id=1).order_by('created_at'), 'media_project_idx'),
+        ('vacancy appeals', AppealVacancy.objects.filter(vacancy_id=1, is_read=False).order_by('-created_at'), 'appeal_vacancy_listing_idx'),
+        ('applicant exists', AppealVacancy.objects.filter(email='x@x.az', phone_number='994500000000').order_by(), 'appeal_vacancy_applicant_idx'),
+    ]
+    for placement in Placement.values:
+        listings.append((
+            f'{placement} background',
+            MediaPlacement.objects.filter(placement=placement).order_by('media_id'),
+            'unique_media_per_placement',
+        ))
+    return listings
+
+
+INDEX_SCAN_RE = re.compile(r'(?: using|Bitmap Index Scan on) (\S+)')
+# Below this many rows a sequential scan is the right plan and proves nothing
+MIN_ROWS = 1000
+# Pages read listings a page at a time (queries.py: per_page 9)
+PAGE_SIZE = 9
+
+
+def plan_indexes(plan):
+    """
+    Index names used by an EXPLAIN plan. Scans of a partitioned table name
+    the per-partition indexes, so those are resolved to their parent index
+    (pg_partition_ancestors) as well.
+    """
+    names = set(INDEX_SCAN_RE.findall(plan))
+    if names and connection.vendor == 'postgresql':
+        with connection.cursor() as cursor:
+            cursor.execute(
+                'SELECT DISTINCT ancestor.relid::regclass::text '
+                'FROM pg_class index, pg_partition_ancestors(index.oid) AS ancestor '
+                'WHERE index.relname = ANY(%s)',
+                [list(names)],
+            )
+            names.update(name for name, in cursor.fetchall())
+    return names
+
+
+def estimated_rows(model):
+    """The planner's row estimate of the whole table (all partitions)."""
+    plan = json.loads(model._default_manager.order_by().explain(format='json'))
+    return plan[0]['Plan']['Plan Rows']
+
+
+class Command(BaseCommand):
+    help = (
+        'Runs EXPLAIN on every public listing query and fails if one of them does not use its index. '
+        'Run it against production-sized data: listings of smaller tables are skipped.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--min-rows', type=int, default=MIN_ROWS,
+            help=f'Skip listings whose table has fewer rows (default: {MIN_ROWS}).'
+        )
+
+    def handle(self, *args, **options):
+        failed = []
+        skipped = []
+
+        for label, queryset, index_name in get_listing_querysets():
+            rows = estimated_rows(queryset.model)
+            if rows < options['min_rows']:
+                skipped.append(label)
+                self.stdout.write(self.style.WARNING(f'- {label} (skipped: about {rows} rows)'))
+                continue
+
+            plan = queryset[:PAGE_SIZE].explain()
+            if index_name in plan_indexes(plan):
+                self.stdout.write(self.style.SUCCESS(f'✓ {label}'))
+            else:
+                failed.append(label)
+                self.stdout.write(self.style.ERROR(f'✗ {label} (expected {index_name})'))
+            if options['verbosity'] > 1:
+                self.stdout.write(plan)
+
+        if failed:
+            raise CommandError(f"Listings without an index: {', '.join(failed)}")
+        if skipped:
+            self.stdout.write(f"{len(skipped)} listings skipped, tables smaller than {options['min_rows']} rows.")
@@ -0,0 +1,46 @@
+from django.core.management.base import BaseCommand
+
+from projects.models import Media
+from projects.utils.thumbnails import THUMBNAIL_SIZES, ensure_thumbnail, make_thumbnail
+
+
+class Command(BaseCommand):
+    help = (
+        'Creates the admin thumbnails of images uploaded before thumbnails were '
+        'generated at upload time, so the first admin page view does not have to.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500)
+        parser.add_argument(
+            '--force', action='store_true',
+            help='Regenerate thumbnails that already exist.'
+        )
+
+    def handle(self, *args, **options):
+        storage = Media._meta.get_field('image').storage
+        names = (
+            Media.objects.exclude(image='').order_by('pk')
+            .values_list('image', flat=True)
+            .iterator(chunk_size=options['batch_size'])
+        )
+
+        created = missing = 0
+        for name in names:
+            if not storage.exists(name):
+                missing += 1
+                self.stderr.write(f'{name} tapılmadı')
+                continue
+            for size in THUMBNAIL_SIZES:
+                if options['force']:
+                    try:
+                        make_thumbnail(storage, name, size)
+                    except Exception as e:
+                        self.stderr.write(f'{name}: {e}')
+                        continue
+                elif ensure_thumbnail(storage, name, size) is None:
+                    self.stderr.write(f'{name}: thumbnail could not be created')
+                    continue
+                created += 1
+
+        self.stdout.write(self.style.SUCCESS(f'{created} thumbnails ready, {missing} images missing'))
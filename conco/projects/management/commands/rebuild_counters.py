@@ -0,0 +1,34 @@
+from django.core.management.base import BaseCommand
+
+from projects.models import Counter
+from projects.utils.counters import compute_counters, rebuild_counters
+
+
+class Command(BaseCommand):
+    help = 'Recomputes the Counter table from scratch (after bulk updates that bypass signals).'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--check', action='store_true',
+            help='Only report counters that differ from the computed values.'
+        )
+
+    def handle(self, *args, **options):
+        if options['check']:
+            stored = dict(Counter.objects.values_list('key', 'value'))
+            expected = compute_counters()
+            drift = {
+                key: (stored.get(key, 0), expected.get(key, 0))
+                for key in stored.keys() | expected.keys()
+                if stored.get(key, 0) != expected.get(key, 0)
+            }
+            for key, (old, new) in sorted(drift.items()):
+                self.stdout.write(self.style.WARNING(f'{key}: {old} != {new}'))
+            if not drift:
+                self.stdout.write(self.style.SUCCESS('Counters are up to date.'))
+            return
+
+        values = rebuild_counters()
+        for key, value in sorted(values.items()):
+            self.stdout.write(f'{key}: {value}')
+        self.stdout.write(self.style.SUCCESS(f'{len(values)} counters rebuilt.'))
@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand
+
+from projects.models import ProjectCard, VacancyCard, SearchEntry
+from projects.utils.read_tables import refresh_project_cards, refresh_vacancy_cards
+from projects.utils.search import refresh_search_entries
+from projects.utils.slug_routes import rebuild_slug_routes
+
+
+class Command(BaseCommand):
+    help = (
+        'Rebuilds the per-language read tables (ProjectCard, VacancyCard, SearchEntry) from scratch '
+        'and records missing /projects/<slug>/ routes (SlugRoute).'
+    )
+
+    def handle(self, *args, **options):
+        # Cards of deleted rows go away in cascade, but a full rebuild also
+        # drops cards of languages that were removed from settings.LANGUAGES.
+        ProjectCard.objects.all().delete()
+        VacancyCard.objects.all().delete()
+
+        refresh_project_cards()
+        refresh_vacancy_cards()
+        for kind in SearchEntry.Kind:
+            refresh_search_entries(kind)
+        routes = rebuild_slug_routes()
+
+        self.stdout.write(self.style.SUCCESS(
+            f'{ProjectCard.objects.count()} project cards, '
+            f'{VacancyCard.objects.count()} vacancy cards, '
+            f'{SearchEntry.objects.count()} search entries, '
+            f'{routes} slug routes recorded'
+        ))
@@ -0,0 +1,37 @@
+import datetime
+
+from django.core.management.base import BaseCommand, CommandError
+
+from projects.utils.activity import first_activity_day, rollup_activity
+
+
+class Command(BaseCommand):
+    help = (
+        'Updates the daily activity rollup behind the admin dashboard: only the '
+        'days since the previous run are re-aggregated. Days before the oldest live '
+        'appeal (archived partitions) are kept. Run it hourly (docker compose "scheduler" service).'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--since',
+            help='Recompute from this day on (YYYY-MM-DD), e.g. after appeals were edited in bulk. '
+                 'Earlier than the oldest live appeal means from that appeal on.'
+        )
+        parser.add_argument(
+            '--full', action='store_true',
+            help='Recompute every day from the oldest live appeal on.'
+        )
+
+    def handle(self, *args, **options):
+        since = None
+        if options['full']:
+            since = first_activity_day()
+        elif options['since']:
+            try:
+                since = datetime.date.fromisoformat(options['since'])
+            except ValueError:
+                raise CommandError(f"Invalid --since date: {options['since']}")
+
+        since, rows = rollup_activity(since)
+        self.stdout.write(self.style.SUCCESS(f'{rows} rows rolled up from {since:%Y-%m-%d}.'))
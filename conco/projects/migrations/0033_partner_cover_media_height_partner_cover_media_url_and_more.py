@@ -0,0 +1,110 @@
+# Generated by Django 5.2.18 on 2026-10-19 19:14
+
+from django.core.files.images import get_image_dimensions
+from django.core.files.storage import default_storage
+from django.db import migrations, models
+
+
+def backfill_cover_media(apps, schema_editor):
+    Media = apps.get_model('projects', 'Media')
+    for model_name, fk_name in (
+        ('Project', 'project_id'),
+        ('Partner', 'partner_id'),
+        ('Vacancy', 'vacancy_id'),
+        ('Service', 'service_id'),
+    ):
+        Model = apps.get_model('projects', model_name)
+        medias = (
+            Media.objects
+            .filter(**{f'{fk_name}__isnull': False})
+            .exclude(image='')
+            .order_by(fk_name, 'id')
+            .values_list(fk_name, 'image')
+        )
+        seen = set()
+        for owner_id, image_name in medias.iterator():
+            if owner_id in seen:
+                continue
+            seen.add(owner_id)
+            width = height = None
+            try:
+                with default_storage.open(image_name) as image_file:
+                    width, height = get_image_dimensions(image_file)
+            except Exception:
+                pass
+            Model.objects.filter(pk=owner_id).update(
+                cover_media_url=default_storage.url(image_name),
+                cover_media_width=width,
+                cover_media_height=height,
+            )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0032_service_url_alter_service_description_az_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='partner',
+            name='cover_media_height',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='partner',
+            name='cover_media_url',
+            field=models.CharField(blank=True, editable=False, max_length=500, null=True, verbose_name='Örtük şəkli'),
+        ),
+        migrations.AddField(
+            model_name='partner',
+            name='cover_media_width',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='cover_media_height',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='cover_media_url',
+            field=models.CharField(blank=True, editable=False, max_length=500, null=True, verbose_name='Örtük şəkli'),
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='cover_media_width',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='service',
+            name='cover_media_height',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='service',
+            name='cover_media_url',
+            field=models.CharField(blank=True, editable=False, max_length=500, null=True, verbose_name='Örtük şəkli'),
+        ),
+        migrations.AddField(
+            model_name='service',
+            name='cover_media_width',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='vacancy',
+            name='cover_media_height',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='vacancy',
+            name='cover_media_url',
+            field=models.CharField(blank=True, editable=False, max_length=500, null=True, verbose_name='Örtük şəkli'),
+        ),
+        migrations.AddField(
+            model_name='vacancy',
+            name='cover_media_width',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.RunPython(backfill_cover_media, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,85 @@
+# Generated by Django 5.2.18 on 2026-10-19 19:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0033_partner_cover_media_height_partner_cover_media_url_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='appealvacancy',
+            index=models.Index(fields=['vacancy', 'is_read', 'created_at'], name='appeal_vacancy_listing_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='media',
+            index=models.Index(fields=['project', 'created_at'], name='media_project_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='media',
+            index=models.Index(fields=['about', 'created_at'], name='media_about_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='media',
+            index=models.Index(fields=['partner', 'created_at'], name='media_partner_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='media',
+            index=models.Index(fields=['vacancy', 'created_at'], name='media_vacancy_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='media',
+            index=models.Index(fields=['service', 'created_at'], name='media_service_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='media',
+            index=models.Index(condition=models.Q(('is_home_page_background_image', True)), fields=['-created_at'], name='media_home_bg_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='media',
+            index=models.Index(condition=models.Q(('is_about_page_background_image', True)), fields=['-created_at'], name='media_about_bg_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='media',
+            index=models.Index(condition=models.Q(('is_contact_page_background_image', True)), fields=['-created_at'], name='media_contact_bg_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='media',
+            index=models.Index(condition=models.Q(('is_project_page_background_image', True)), fields=['-created_at'], name='media_project_bg_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='media',
+            index=models.Index(condition=models.Q(('is_vacany_page_background_image', True)), fields=['-created_at'], name='media_vacancy_bg_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='media',
+            index=models.Index(condition=models.Q(('is_service_page_background_image', True)), fields=['-created_at'], name='media_service_bg_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='media',
+            index=models.Index(condition=models.Q(('is_footer_background_image', True)), fields=['-created_at'], name='media_footer_bg_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='partner',
+            index=models.Index(fields=['is_active', 'created_at'], name='partner_listing_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['is_active', 'on_main_page', 'speacial_project', '-created_at'], name='project_listing_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['category', 'is_active', 'created_at'], name='project_category_listing_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='service',
+            index=models.Index(fields=['is_active', 'created_at'], name='service_listing_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='vacancy',
+            index=models.Index(fields=['is_active', 'created_at'], name='vacancy_listing_idx'),
+        ),
+    ]
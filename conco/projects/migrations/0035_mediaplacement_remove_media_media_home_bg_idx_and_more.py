@@ -0,0 +1,120 @@
+# Generated by Django 5.2.18 on 2026-10-19 19:18
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+BACKGROUND_FLAGS = {
+    'home': 'is_home_page_background_image',
+    'about': 'is_about_page_background_image',
+    'contact': 'is_contact_page_background_image',
+    'project': 'is_project_page_background_image',
+    'vacancy': 'is_vacany_page_background_image',
+    'service': 'is_service_page_background_image',
+    'footer': 'is_footer_background_image',
+}
+
+
+def copy_background_flags(apps, schema_editor):
+    Media = apps.get_model('projects', 'Media')
+    MediaPlacement = apps.get_model('projects', 'MediaPlacement')
+    placements = []
+    for placement, flag in BACKGROUND_FLAGS.items():
+        for media_id in Media.objects.filter(**{flag: True}).values_list('id', flat=True):
+            placements.append(MediaPlacement(media_id=media_id, placement=placement))
+    MediaPlacement.objects.bulk_create(placements)
+
+
+def restore_background_flags(apps, schema_editor):
+    Media = apps.get_model('projects', 'Media')
+    MediaPlacement = apps.get_model('projects', 'MediaPlacement')
+    for placement, flag in BACKGROUND_FLAGS.items():
+        media_ids = MediaPlacement.objects.filter(placement=placement).values_list('media_id', flat=True)
+        Media.objects.filter(id__in=media_ids).update(**{flag: True})
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0034_appealvacancy_appeal_vacancy_listing_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MediaPlacement',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('placement', models.CharField(choices=[('home', 'Ana səhifə'), ('about', 'Haqqımızda səhifəsi'), ('contact', 'Əlaqə səhifəsi'), ('project', 'Layihələr səhifəsi'), ('vacancy', 'Vakansiyalar səhifəsi'), ('service', 'Xidmətlər səhifəsi'), ('footer', 'Websiten-ın aşağı hissəsi')], max_length=20, verbose_name='Yerləşmə')),
+            ],
+            options={
+                'verbose_name': 'Arxa plan yerləşməsi',
+                'verbose_name_plural': 'Arxa plan yerləşmələri',
+            },
+        ),
+        migrations.AddField(
+            model_name='mediaplacement',
+            name='media',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='placements', to='projects.media', verbose_name='Media'),
+        ),
+        migrations.AddConstraint(
+            model_name='mediaplacement',
+            constraint=models.UniqueConstraint(fields=('placement', 'media'), name='unique_media_per_placement'),
+        ),
+        migrations.RunPython(copy_background_flags, restore_background_flags),
+        migrations.RemoveIndex(
+            model_name='media',
+            name='media_home_bg_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='media',
+            name='media_about_bg_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='media',
+            name='media_contact_bg_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='media',
+            name='media_project_bg_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='media',
+            name='media_vacancy_bg_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='media',
+            name='media_service_bg_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='media',
+            name='media_footer_bg_idx',
+        ),
+        migrations.RemoveField(
+            model_name='media',
+            name='is_about_page_background_image',
+        ),
+        migrations.RemoveField(
+            model_name='media',
+            name='is_contact_page_background_image',
+        ),
+        migrations.RemoveField(
+            model_name='media',
+            name='is_footer_background_image',
+        ),
+        migrations.RemoveField(
+            model_name='media',
+            name='is_home_page_background_image',
+        ),
+        migrations.RemoveField(
+            model_name='media',
+            name='is_project_page_background_image',
+        ),
+        migrations.RemoveField(
+            model_name='media',
+            name='is_service_page_background_image',
+        ),
+        migrations.RemoveField(
+            model_name='media',
+            name='is_vacany_page_background_image',
+        ),
+    ]
@@ -0,0 +1,110 @@
+# Generated by Django 5.2.18 on 2026-10-19 19:22
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def populate_cards(apps, schema_editor):
+    Project = apps.get_model('projects', 'Project')
+    Vacancy = apps.get_model('projects', 'Vacancy')
+    ProjectCard = apps.get_model('projects', 'ProjectCard')
+    VacancyCard = apps.get_model('projects', 'VacancyCard')
+    languages = [code for code, _ in settings.LANGUAGES]
+
+    project_cards = []
+    for project in Project.objects.select_related('category').iterator():
+        for lang in languages:
+            project_cards.append(ProjectCard(
+                lang=lang,
+                project_id=project.pk,
+                slug=project.slug,
+                name=getattr(project, f'name_{lang}'),
+                url=project.url,
+                category_id=project.category_id,
+                category_slug=project.category.slug,
+                category_name=getattr(project.category, f'name_{lang}'),
+                cover_url=project.cover_media_url,
+                cover_width=project.cover_media_width,
+                cover_height=project.cover_media_height,
+                is_active=project.is_active,
+                is_completed=project.is_completed,
+                speacial_project=project.speacial_project,
+                on_main_page=project.on_main_page,
+                project_date=project.project_date,
+                created_at=project.created_at,
+            ))
+    ProjectCard.objects.bulk_create(project_cards, batch_size=500)
+
+    vacancy_cards = []
+    for vacancy in Vacancy.objects.iterator():
+        for lang in languages:
+            vacancy_cards.append(VacancyCard(
+                lang=lang,
+                vacancy_id=vacancy.pk,
+                slug=vacancy.slug,
+                title=getattr(vacancy, f'title_{lang}'),
+                image=vacancy.cover_media_url,
+                is_active=vacancy.is_active,
+                created_at=vacancy.created_at,
+            ))
+    VacancyCard.objects.bulk_create(vacancy_cards, batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0035_mediaplacement_remove_media_media_home_bg_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProjectCard',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('lang', models.CharField(max_length=2)),
+                ('slug', models.SlugField(max_length=255)),
+                ('name', models.CharField(blank=True, max_length=250, null=True)),
+                ('url', models.URLField(blank=True, null=True)),
+                ('category_id', models.BigIntegerField()),
+                ('category_slug', models.SlugField(max_length=255)),
+                ('category_name', models.CharField(blank=True, max_length=255, null=True)),
+                ('cover_url', models.CharField(blank=True, max_length=500, null=True)),
+                ('cover_width', models.PositiveIntegerField(blank=True, null=True)),
+                ('cover_height', models.PositiveIntegerField(blank=True, null=True)),
+                ('is_active', models.BooleanField(null=True)),
+                ('is_completed', models.BooleanField(null=True)),
+                ('speacial_project', models.BooleanField(null=True)),
+                ('on_main_page', models.BooleanField(null=True)),
+                ('project_date', models.DateField(blank=True, null=True)),
+                ('created_at', models.DateTimeField()),
+                ('project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='cards', to='projects.project')),
+            ],
+            options={
+                'verbose_name': 'Layihə kartı',
+                'verbose_name_plural': 'Layihə kartları',
+                'indexes': [models.Index(fields=['lang', 'is_active', '-created_at'], name='project_card_listing_idx'), models.Index(fields=['lang', 'category_slug', 'is_active', '-created_at'], name='project_card_category_idx')],
+                'constraints': [models.UniqueConstraint(fields=('project', 'lang'), name='unique_project_card_per_lang')],
+            },
+        ),
+        migrations.CreateModel(
+            name='VacancyCard',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('lang', models.CharField(max_length=2)),
+                ('slug', models.SlugField(max_length=255)),
+                ('title', models.CharField(blank=True, max_length=250, null=True)),
+                ('image', models.CharField(blank=True, max_length=500, null=True)),
+                ('is_active', models.BooleanField()),
+                ('created_at', models.DateTimeField()),
+                ('vacancy', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='cards', to='projects.vacancy')),
+            ],
+            options={
+                'verbose_name': 'Vakansiya kartı',
+                'verbose_name_plural': 'Vakansiya kartları',
+                'indexes': [models.Index(fields=['lang', 'is_active', '-created_at'], name='vacancy_card_listing_idx')],
+                'constraints': [models.UniqueConstraint(fields=('vacancy', 'lang'), name='unique_vacancy_card_per_lang')],
+            },
+        ),
+        migrations.RunPython(populate_cards, migrations.RunPython.noop),
+    ]
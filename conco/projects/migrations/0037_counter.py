@@ -0,0 +1,44 @@
+# Generated by Django 5.2.18 on 2026-10-19 19:26
+
+from django.db import migrations, models
+
+
+def populate_counters(apps, schema_editor):
+    Counter = apps.get_model('projects', 'Counter')
+    Project = apps.get_model('projects', 'Project')
+    Partner = apps.get_model('projects', 'Partner')
+    AppealVacancy = apps.get_model('projects', 'AppealVacancy')
+
+    values = {
+        'active_projects': Project.objects.filter(is_active=True).count(),
+        'active_partners': Partner.objects.filter(is_active=True).count(),
+        'distinct_applicants': AppealVacancy.objects.values('email', 'phone_number').distinct().count(),
+        'special_projects': Project.objects.filter(speacial_project=True, on_main_page=True).count(),
+    }
+    for category_id in Project.objects.filter(on_main_page=True).values_list('category_id', flat=True):
+        key = f'main_page_projects:{category_id}'
+        values[key] = values.get(key, 0) + 1
+    Counter.objects.bulk_create([Counter(key=key, value=value) for key, value in values.items()])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0036_projectcard_vacancycard'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Counter',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(max_length=100, unique=True, verbose_name='Açar')),
+                ('value', models.BigIntegerField(default=0, verbose_name='Dəyər')),
+            ],
+            options={
+                'verbose_name': 'Sayğac',
+                'verbose_name_plural': 'Sayğaclar',
+            },
+        ),
+        migrations.RunPython(populate_counters, migrations.RunPython.noop),
+    ]
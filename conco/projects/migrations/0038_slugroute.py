@@ -0,0 +1,45 @@
+# Generated by Django 5.2.18 on 2026-10-19 19:29
+
+from django.db import migrations, models
+
+
+def populate_slug_routes(apps, schema_editor):
+    SlugRoute = apps.get_model('projects', 'SlugRoute')
+    Project = apps.get_model('projects', 'Project')
+    ProjectCategory = apps.get_model('projects', 'ProjectCategory')
+
+    routes = [
+        SlugRoute(slug=slug, kind=kind, object_id=object_id)
+        for kind, model in (('project', Project), ('category', ProjectCategory))
+        for object_id, slug in model.objects.values_list('id', 'slug')
+    ]
+    SlugRoute.objects.bulk_create(routes, batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0037_counter'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SlugRoute',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('slug', models.SlugField(max_length=255, verbose_name='Slug')),
+                ('kind', models.CharField(choices=[('project', 'Layihə'), ('category', 'Kateqoriya')], max_length=20, verbose_name='Növ')),
+                ('object_id', models.BigIntegerField(verbose_name='Obyekt ID')),
+                ('version', models.PositiveIntegerField(default=1, verbose_name='Versiya')),
+                ('is_current', models.BooleanField(default=True, verbose_name='Aktual slug')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Yenilənmə tarixi')),
+            ],
+            options={
+                'verbose_name': 'Slug marşrutu',
+                'verbose_name_plural': 'Slug marşrutları',
+                'indexes': [models.Index(fields=['kind', 'object_id'], name='slug_route_object_idx')],
+                'constraints': [models.UniqueConstraint(fields=('slug', 'kind'), name='unique_slug_route_per_kind')],
+            },
+        ),
+        migrations.RunPython(populate_slug_routes, migrations.RunPython.noop),
+    ]
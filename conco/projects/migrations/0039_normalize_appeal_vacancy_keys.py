@@ -0,0 +1,34 @@
+from django.db import migrations
+from django.db.models import Q
+
+
+def normalize_keys(apps, schema_editor):
+    """
+    Duplicate detection runs on lowercased emails and 9-digit phone numbers;
+    bring existing rows to the same form unless that would collide.
+    """
+    from projects.utils import normalize_az_phone
+
+    AppealVacancy = apps.get_model('projects', 'AppealVacancy')
+    for appeal in AppealVacancy.objects.exclude(email__isnull=True, phone_number__isnull=True).iterator():
+        email = appeal.email.strip().lower() if appeal.email else appeal.email
+        phone_number = normalize_az_phone(appeal.phone_number) or appeal.phone_number
+        if (email, phone_number) == (appeal.email, appeal.phone_number):
+            continue
+        collides = AppealVacancy.objects.filter(
+            Q(email=email) | Q(phone_number=phone_number),
+            vacancy_id=appeal.vacancy_id,
+        ).exclude(pk=appeal.pk).exists()
+        if not collides:
+            AppealVacancy.objects.filter(pk=appeal.pk).update(email=email, phone_number=phone_number)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0038_slugroute'),
+    ]
+
+    operations = [
+        migrations.RunPython(normalize_keys, migrations.RunPython.noop),
+    ]
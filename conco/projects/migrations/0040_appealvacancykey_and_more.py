@@ -0,0 +1,60 @@
+# Generated by Django 5.2.18 on 2026-10-19 19:33
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def populate_keys(apps, schema_editor):
+    AppealVacancy = apps.get_model('projects', 'AppealVacancy')
+    AppealVacancyKey = apps.get_model('projects', 'AppealVacancyKey')
+
+    keys = []
+    appeals = AppealVacancy.objects.filter(vacancy__isnull=False).values_list(
+        'id', 'vacancy_id', 'email', 'phone_number'
+    )
+    for appeal_id, vacancy_id, email, phone_number in appeals.iterator():
+        if email:
+            keys.append(AppealVacancyKey(vacancy_id=vacancy_id, appeal_id=appeal_id, key=f'email:{email}'))
+        if phone_number:
+            keys.append(AppealVacancyKey(vacancy_id=vacancy_id, appeal_id=appeal_id, key=f'phone:{phone_number}'))
+    AppealVacancyKey.objects.bulk_create(keys, batch_size=1000, ignore_conflicts=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0039_normalize_appeal_vacancy_keys'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AppealVacancyKey',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(max_length=260, verbose_name='Açar')),
+                ('appeal_id', models.BigIntegerField(db_index=True, verbose_name='Müraciət ID')),
+            ],
+            options={
+                'verbose_name': 'Müraciət açarı',
+                'verbose_name_plural': 'Müraciət açarları',
+            },
+        ),
+        migrations.RemoveConstraint(
+            model_name='appealvacancy',
+            name='unique_email_per_vacancy',
+        ),
+        migrations.RemoveConstraint(
+            model_name='appealvacancy',
+            name='unique_phone_per_vacancy',
+        ),
+        migrations.AddField(
+            model_name='appealvacancykey',
+            name='vacancy',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='appeal_keys', to='projects.vacancy', verbose_name='Vakansiya'),
+        ),
+        migrations.AddConstraint(
+            model_name='appealvacancykey',
+            constraint=models.UniqueConstraint(fields=('vacancy', 'key'), name='unique_appeal_key_per_vacancy'),
+        ),
+        migrations.RunPython(populate_keys, migrations.RunPython.noop),
+    ]
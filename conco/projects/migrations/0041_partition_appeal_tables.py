@@ -0,0 +1,25 @@
+from django.db import migrations
+from django.utils import timezone
+
+
+def partition_appeal_tables(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    from projects.utils.partitions import PARTITIONED_TABLES, add_months, month_start, partition_table
+
+    this_month = month_start(timezone.now())
+    with schema_editor.connection.cursor() as cursor:
+        for table in PARTITIONED_TABLES:
+            partition_table(cursor, table, this_month, add_months(this_month, 3))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0040_appealvacancykey_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(partition_appeal_tables, migrations.RunPython.noop),
+    ]
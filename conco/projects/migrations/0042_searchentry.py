@@ -0,0 +1,128 @@
+# Generated by Django 5.2.18 on 2026-10-19 19:45
+
+import unicodedata
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.contrib.postgres.search import SearchVector
+from django.db import migrations, models
+from django.utils.text import Truncator
+
+
+# Frozen copies of projects.utils.search as of this migration
+SEARCH_CONFIGS = {
+    'az': 'simple',
+    'en': 'english',
+    'ru': 'russian',
+}
+
+SNIPPET_LENGTH = 200
+
+FOLD_TABLE = str.maketrans({
+    'ə': 'e', 'Ə': 'e',
+    'ı': 'i', 'İ': 'i',
+    'ё': 'е', 'Ё': 'е',
+})
+
+
+def fold_text(value):
+    value = (value or '').translate(FOLD_TABLE).lower()
+    return ''.join(
+        ''.join(c for c in unicodedata.normalize('NFD', char) if not unicodedata.combining(c))
+        if char < '\u0250' else char
+        for char in value
+    )
+
+
+def populate_search_entries(apps, schema_editor):
+    SearchEntry = apps.get_model('projects', 'SearchEntry')
+    sources = (
+        ('project', apps.get_model('projects', 'Project').objects.select_related('category'), 'name'),
+        ('service', apps.get_model('projects', 'Service').objects.all(), 'title'),
+        ('vacancy', apps.get_model('projects', 'Vacancy').objects.all(), 'title'),
+    )
+
+    entries = []
+    for kind, objects, title_field in sources:
+        for obj in objects.filter(is_active=True).iterator():
+            for lang in SEARCH_CONFIGS:
+                title = getattr(obj, f'{title_field}_{lang}') or getattr(obj, f'{title_field}_az') or ''
+                description = getattr(obj, f'description_{lang}') or obj.description_az or ''
+                body = description
+                if kind == 'project':
+                    category = getattr(obj.category, f'name_{lang}') or obj.category.name_az
+                    body = ' '.join(filter(None, [description, category]))
+                entries.append(SearchEntry(
+                    kind=kind,
+                    object_id=obj.pk,
+                    lang=lang,
+                    title=title[:250],
+                    snippet=Truncator(description).chars(SNIPPET_LENGTH),
+                    slug=getattr(obj, 'slug', None),
+                    image=obj.cover_media_url,
+                    title_text=fold_text(title)[:250],
+                    body_text=fold_text(body),
+                    created_at=obj.created_at,
+                ))
+    SearchEntry.objects.bulk_create(entries, batch_size=500)
+
+    for lang, config in SEARCH_CONFIGS.items():
+        SearchEntry.objects.filter(lang=lang).update(
+            document=(
+                SearchVector('title_text', weight='A', config=config)
+                + SearchVector('body_text', weight='B', config=config)
+            )
+        )
+
+
+def create_trigram_index(apps, schema_editor):
+    """
+    Typo-tolerant title matching needs pg_trgm (PostgreSQL contrib). Without
+    it the search works with full-text matches only.
+    """
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'")
+        if not cursor.fetchone():
+            return
+        cursor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+        cursor.execute(
+            'CREATE INDEX IF NOT EXISTS search_title_trgm_idx '
+            'ON projects_searchentry USING gin (title_text gin_trgm_ops)'
+        )
+
+
+def drop_trigram_index(apps, schema_editor):
+    schema_editor.execute('DROP INDEX IF EXISTS search_title_trgm_idx')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0041_partition_appeal_tables'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('project', 'Layihə'), ('service', 'Servis'), ('vacancy', 'Vakansiya')], max_length=20)),
+                ('object_id', models.BigIntegerField()),
+                ('lang', models.CharField(max_length=2)),
+                ('title', models.CharField(max_length=250)),
+                ('snippet', models.CharField(blank=True, max_length=300)),
+                ('slug', models.SlugField(blank=True, max_length=255, null=True)),
+                ('image', models.CharField(blank=True, max_length=500, null=True)),
+                ('title_text', models.CharField(max_length=250)),
+                ('body_text', models.TextField(blank=True)),
+                ('document', django.contrib.postgres.search.SearchVectorField(null=True)),
+                ('created_at', models.DateTimeField()),
+            ],
+            options={
+                'indexes': [django.contrib.postgres.indexes.GinIndex(condition=models.Q(('lang', 'az')), fields=['document'], name='search_document_az_idx'), django.contrib.postgres.indexes.GinIndex(condition=models.Q(('lang', 'en')), fields=['document'], name='search_document_en_idx'), django.contrib.postgres.indexes.GinIndex(condition=models.Q(('lang', 'ru')), fields=['document'], name='search_document_ru_idx')],
+                'constraints': [models.UniqueConstraint(fields=('kind', 'object_id', 'lang'), name='unique_search_entry')],
+            },
+        ),
+        migrations.RunPython(populate_search_entries, migrations.RunPython.noop),
+        migrations.RunPython(create_trigram_index, drop_trigram_index),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.18 on 2026-10-19 19:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0042_searchentry'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='appealvacancy',
+            name='cv_content_type',
+            field=models.CharField(blank=True, editable=False, max_length=100, verbose_name='CV fayl tipi'),
+        ),
+        migrations.AddField(
+            model_name='appealvacancy',
+            name='cv_original_name',
+            field=models.CharField(blank=True, editable=False, max_length=255, verbose_name='CV-nin orijinal adı'),
+        ),
+        migrations.AddField(
+            model_name='appealvacancy',
+            name='cv_sha256',
+            field=models.CharField(blank=True, editable=False, max_length=64, verbose_name='CV SHA-256'),
+        ),
+        migrations.AddField(
+            model_name='appealvacancy',
+            name='cv_size',
+            field=models.PositiveBigIntegerField(blank=True, editable=False, null=True, verbose_name='CV ölçüsü (bayt)'),
+        ),
+    ]
@@ -0,0 +1,67 @@
+# Generated by Django 5.2.18 on 2026-10-19 19:53
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+
+# Admin substring search (icontains) filters on UPPER(column::text)
+TRIGRAM_INDEXES = {
+    'projects_project': ['name_az', 'name_en', 'name_ru'],
+    'projects_vacancy': ['title_az', 'title_en', 'title_ru'],
+    'projects_service': ['title_az', 'title_en', 'title_ru'],
+    'projects_about': ['main_title_az', 'main_title_en', 'main_title_ru'],
+    'projects_appealvacancy': ['full_name', 'email', 'phone_number'],
+}
+
+
+def trigram_index_name(table, column):
+    return f'{table.removeprefix("projects_")}_{column}_trgm_idx'
+
+
+def create_trigram_indexes(apps, schema_editor):
+    """Only where pg_trgm is available (see 0042_searchentry)."""
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'")
+        if not cursor.fetchone():
+            return
+        cursor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+        for table, columns in TRIGRAM_INDEXES.items():
+            for column in columns:
+                cursor.execute(
+                    f'CREATE INDEX IF NOT EXISTS {trigram_index_name(table, column)} '
+                    f'ON {table} USING gin ((UPPER({column}::text)) gin_trgm_ops)'
+                )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    for table, columns in TRIGRAM_INDEXES.items():
+        for column in columns:
+            schema_editor.execute(f'DROP INDEX IF EXISTS {trigram_index_name(table, column)}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0043_appealvacancy_cv_content_type_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='about',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.search.SearchVector('main_title_az', 'main_title_en', 'main_title_ru', 'second_title_az', 'second_title_en', 'second_title_ru', 'description_az', 'description_en', 'description_ru', config='simple'), name='about_admin_search_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.search.SearchVector('name_az', 'name_en', 'name_ru', 'description_az', 'description_en', 'description_ru', config='simple'), name='project_admin_search_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='service',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.search.SearchVector('title_az', 'title_en', 'title_ru', 'description_az', 'description_en', 'description_ru', config='simple'), name='service_admin_search_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='vacancy',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.search.SearchVector('title_az', 'title_en', 'title_ru', 'description_az', 'description_en', 'description_ru', config='simple'), name='vacancy_admin_search_idx'),
+        ),
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
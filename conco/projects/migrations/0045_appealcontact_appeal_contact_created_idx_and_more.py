@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-19 19:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0044_about_about_admin_search_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='appealcontact',
+            index=models.Index(fields=['created_at', 'id'], name='appeal_contact_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='appealvacancy',
+            index=models.Index(fields=['created_at', 'id'], name='appeal_vacancy_created_idx'),
+        ),
+    ]
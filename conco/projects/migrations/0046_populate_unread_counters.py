@@ -0,0 +1,45 @@
+# Generated by Django 5.2.18 on 2026-10-19 23:55
+
+from django.db import migrations
+from django.db.models import Count
+
+
+def populate_unread_counters(apps, schema_editor):
+    Counter = apps.get_model('projects', 'Counter')
+    AppealVacancy = apps.get_model('projects', 'AppealVacancy')
+    AppealContact = apps.get_model('projects', 'AppealContact')
+
+    values = {
+        'unread_appeals': AppealVacancy.objects.filter(is_read=False).count(),
+        'unread_contacts': AppealContact.objects.filter(is_read=False).count(),
+    }
+    unread = (
+        AppealVacancy.objects.filter(is_read=False, vacancy__isnull=False)
+        .values_list('vacancy_id')
+        .annotate(count=Count('pk'))
+        .order_by()
+    )
+    for vacancy_id, count in unread:
+        values[f'unread_appeals:{vacancy_id}'] = count
+    Counter.objects.bulk_create(
+        [Counter(key=key, value=value) for key, value in values.items()],
+        update_conflicts=True,
+        unique_fields=['key'],
+        update_fields=['value'],
+    )
+
+
+def remove_unread_counters(apps, schema_editor):
+    Counter = apps.get_model('projects', 'Counter')
+    Counter.objects.filter(key__startswith='unread_').delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0045_appealcontact_appeal_contact_created_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(populate_unread_counters, remove_unread_counters),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-19 20:16
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0046_populate_unread_counters'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailyActivity',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField(verbose_name='Gün')),
+                ('kind', models.CharField(choices=[('appeal', 'Vakansiya müraciəti'), ('contact', 'Əlaqə mesajı')], max_length=10, verbose_name='Növ')),
+                ('count', models.PositiveIntegerField(default=0, verbose_name='Say')),
+                ('vacancy', models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='projects.vacancy', verbose_name='Vakansiya')),
+            ],
+            options={
+                'verbose_name': 'Günlük aktivlik',
+                'verbose_name_plural': 'Günlük aktivlik',
+                'constraints': [models.UniqueConstraint(fields=('day', 'kind', 'vacancy'), name='unique_daily_activity', nulls_distinct=False)],
+            },
+        ),
+    ]
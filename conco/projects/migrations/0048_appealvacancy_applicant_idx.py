@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-19 20:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0047_dailyactivity'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='appealvacancy',
+            index=models.Index(fields=['email', 'phone_number'], name='appeal_vacancy_applicant_idx'),
+        ),
+    ]
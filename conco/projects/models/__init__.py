@@ -1,10 +1,15 @@
 from .project_models import Project, ProjectCategory
-from .media_models import Media
+from .media_models import Media, MediaPlacement, Placement
 from .partner_models import Partner
 from .about_models import About
 from .contact_models import Contact
 from .vacancy_models import Vacancy
-from .appeal_models import AppealVacancy, AppealContact
+from .appeal_models import AppealVacancy, AppealVacancyKey, AppealContact
 from .motto_models import Motto
 from .statistic_models import Statistic
-from .service_models import Service
\ No newline at end of file
+from .service_models import Service
+from .read_models import ProjectCard, VacancyCard
+from .counter_models import Counter
+from .route_models import SlugRoute
+from .search_models import SearchEntry
+from .activity_models import DailyActivity
@@ -1,6 +1,8 @@
 from django.db import models
 from django.core.validators import MaxLengthValidator
 
+from .search_models import admin_search_index
+
 
 class About(models.Model):
     main_title_az = models.CharField(
@@ -55,6 +57,22 @@ class About(models.Model):
     class Meta:
         verbose_name = 'Haqqımızda'
         verbose_name_plural = 'Haqqımızda'
+        indexes = [
+            admin_search_index(
+                [
+                    'main_title_az',
+                    'main_title_en',
+                    'main_title_ru',
+                    'second_title_az',
+                    'second_title_en',
+                    'second_title_ru',
+                    'description_az',
+                    'description_en',
+                    'description_ru',
+                ],
+                name='about_admin_search_idx'
+            ),
+        ]
 
     def __str__(self):
         return self.main_title_az or 'Haqqımızda'
@@ -0,0 +1,53 @@
+from django.db import models
+
+from .vacancy_models import Vacancy
+
+
+class DailyActivity(models.Model):
+    """
+    Appeals and contact messages per day (and vacancy), rolled up from the
+    appeal tables by `manage.py rollup_activity` (see utils/activity.py).
+    The admin dashboard reads only this table. Rows outlive archived appeal
+    partitions and deleted vacancies.
+    """
+
+    class Kind(models.TextChoices):
+        APPEAL = 'appeal', 'Vakansiya müraciəti'
+        CONTACT = 'contact', 'Əlaqə mesajı'
+
+    day = models.DateField(
+        verbose_name='Gün'
+    )
+    kind = models.CharField(
+        max_length=10,
+        choices=Kind.choices,
+        verbose_name='Növ'
+    )
+    # Kept for deleted vacancies too, hence no FK constraint
+    vacancy = models.ForeignKey(
+        Vacancy,
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        null=True,
+        blank=True,
+        related_name='+',
+        verbose_name='Vakansiya'
+    )
+    count = models.PositiveIntegerField(
+        default=0,
+        verbose_name='Say'
+    )
+
+    class Meta:
+        verbose_name = 'Günlük aktivlik'
+        verbose_name_plural = 'Günlük aktivlik'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['day', 'kind', 'vacancy'],
+                nulls_distinct=False,
+                name='unique_daily_activity'
+            ),
+        ]
+
+    def __str__(self):
+        return f'{self.day} {self.kind}: {self.count}'
@@ -7,6 +7,7 @@ from django.utils import timezone
 
 from .vacancy_models import Vacancy
 from projects.utils import normalize_az_phone
+from projects.utils.file_metadata import read_file_metadata
 
 
 class AppealVacancy(models.Model):
@@ -46,6 +47,31 @@ class AppealVacancy(models.Model):
         validators=[FileExtensionValidator(allowed_extensions=['pdf', 'doc', 'docx'])],
         verbose_name='CV'
     )
+    # Yükləmə zamanı yazılır: admin siyahısı fayl sistemindən oxumur
+    cv_size = models.PositiveBigIntegerField(
+        null=True,
+        blank=True,
+        editable=False,
+        verbose_name='CV ölçüsü (bayt)'
+    )
+    cv_content_type = models.CharField(
+        max_length=100,
+        blank=True,
+        editable=False,
+        verbose_name='CV fayl tipi'
+    )
+    cv_original_name = models.CharField(
+        max_length=255,
+        blank=True,
+        editable=False,
+        verbose_name='CV-nin orijinal adı'
+    )
+    cv_sha256 = models.CharField(
+        max_length=64,
+        blank=True,
+        editable=False,
+        verbose_name='CV SHA-256'
+    )
     created_at = models.DateTimeField(
         auto_now_add=True,
         verbose_name='Yaradılma tarixi'
@@ -58,19 +84,30 @@ class AppealVacancy(models.Model):
     class Meta:
         verbose_name = 'CV'
         verbose_name_plural = 'CV-lər'
-        constraints = [
-            models.UniqueConstraint(
-                fields=['vacancy', 'email'],
-                name='unique_email_per_vacancy'
+        # Unique email/phone per vacancy is enforced by AppealVacancyKey:
+        # on PostgreSQL this table is partitioned by month and a unique
+        # constraint here would have to include created_at.
+        indexes = [
+            models.Index(
+                fields=['vacancy', 'is_read', 'created_at'],
+                name='appeal_vacancy_listing_idx'
             ),
-            models.UniqueConstraint(
-                fields=['vacancy', 'phone_number'],
-                name='unique_phone_per_vacancy'
+            # Admin siyahısı: -created_at sıralaması, tarix filtrləri
+            models.Index(
+                fields=['created_at', 'id'],
+                name='appeal_vacancy_created_idx'
+            ),
+            # counters.applicant_exists: DISTINCT_APPLICANTS sayğacı hər müraciətdə yoxlanılır
+            models.Index(
+                fields=['email', 'phone_number'],
+                name='appeal_vacancy_applicant_idx'
             ),
         ]
         ordering  = ['-created_at']
 
     def clean(self):
+        if self.email:
+            self.email = self.email.strip().lower()
         if self.phone_number:
             normalized = normalize_az_phone(self.phone_number)
             if normalized:
@@ -80,14 +117,60 @@ class AppealVacancy(models.Model):
                     'phone_number': 'Düzgün Azərbaycan mobil nömrəsi deyil.'
                 })
         
+    def set_cv_metadata(self, name=None):
+        metadata = read_file_metadata(self.cv.file, name)
+        self.cv_size = metadata['size']
+        self.cv_content_type = metadata['content_type']
+        self.cv_original_name = metadata['original_name']
+        self.cv_sha256 = metadata['sha256']
+
     def save(self, *args, **kwargs):
         self.full_clean()  
+        if self.cv and not self.cv._committed:
+            # Yeni yüklənmiş fayl
+            self.set_cv_metadata()
         super().save(*args, **kwargs)
 
     def __str__(self):
-        return self.vacancy.title_az
+        # Vakansiya silinə bilər (SET_NULL)
+        return self.vacancy.title_az if self.vacancy else (self.full_name or 'CV')
     
 
+class AppealVacancyKey(models.Model):
+    """
+    Normalized duplicate-detection key of an application ('email:...',
+    'phone:...'), unique per vacancy. Not partitioned, so the check spans
+    every month.
+    """
+    vacancy = models.ForeignKey(
+        Vacancy,
+        on_delete=models.CASCADE,
+        related_name='appeal_keys',
+        verbose_name='Vakansiya'
+    )
+    key = models.CharField(
+        max_length=260,
+        verbose_name='Açar'
+    )
+    appeal_id = models.BigIntegerField(
+        db_index=True,
+        verbose_name='Müraciət ID'
+    )
+
+    class Meta:
+        verbose_name = 'Müraciət açarı'
+        verbose_name_plural = 'Müraciət açarları'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['vacancy', 'key'],
+                name='unique_appeal_key_per_vacancy'
+            ),
+        ]
+
+    def __str__(self):
+        return self.key
+
+
 class AppealContact(models.Model):
     full_name = models.CharField(
         null=True,
@@ -128,6 +211,12 @@ class AppealContact(models.Model):
         verbose_name = 'Mesaj'
         verbose_name_plural = 'Mesajlar'
         ordering = ['-created_at']
+        indexes = [
+            models.Index(
+                fields=['created_at', 'id'],
+                name='appeal_contact_created_idx'
+            ),
+        ]
     
     def save(self, *args, **kwargs):
         if not self.created_date:
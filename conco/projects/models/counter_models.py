@@ -0,0 +1,26 @@
+from django.db import models
+
+
+class Counter(models.Model):
+    """
+    Incrementally maintained aggregate (see utils/counters.py).
+    Keys: active_projects, active_partners, distinct_applicants,
+    special_projects, main_page_projects:<category_id>, unread_appeals,
+    unread_appeals:<vacancy_id>, unread_contacts
+    """
+    key = models.CharField(
+        max_length=100,
+        unique=True,
+        verbose_name='Açar'
+    )
+    value = models.BigIntegerField(
+        default=0,
+        verbose_name='Dəyər'
+    )
+
+    class Meta:
+        verbose_name = 'Sayğac'
+        verbose_name_plural = 'Sayğaclar'
+
+    def __str__(self):
+        return f'{self.key}: {self.value}'
@@ -11,6 +11,16 @@ from .service_models import Service
 logger = logging.getLogger(__name__)
 
 
+class Placement(models.TextChoices):
+    HOME = 'home', 'Ana səhifə'
+    ABOUT = 'about', 'Haqqımızda səhifəsi'
+    CONTACT = 'contact', 'Əlaqə səhifəsi'
+    PROJECT = 'project', 'Layihələr səhifəsi'
+    VACANCY = 'vacancy', 'Vakansiyalar səhifəsi'
+    SERVICE = 'service', 'Xidmətlər səhifəsi'
+    FOOTER = 'footer', 'Websiten-ın aşağı hissəsi'
+
+
 class Media(models.Model):
     about = models.ForeignKey(
         About,
@@ -62,35 +72,6 @@ class Media(models.Model):
         blank=True,
         verbose_name='Video'
     )
-    is_home_page_background_image = models.BooleanField(
-        default=False,
-        verbose_name='Ana səhifəs üçün arxa plan şəkli'
-    )
-    is_about_page_background_image = models.BooleanField(
-        default=False,
-        verbose_name='Haqqımızda səhifəsi üçü arxa plan şəkli'
-    )
-    is_contact_page_background_image = models.BooleanField(
-        default=False,
-        verbose_name='Əlaqə səhifəsi üçün arxa plan şəkli'
-    )
-    is_project_page_background_image = models.BooleanField(
-        default=False,
-        verbose_name='Lahiyə səhifəsi üçün arxa plan şəkli'
-    )
-    is_vacany_page_background_image = models.BooleanField(
-        default=False,
-        verbose_name='Vakansiya səhifəsi üçün arxa plan şəkli'
-    )
-    is_service_page_background_image = models.BooleanField(
-        default=False,
-        verbose_name='Servis səhifəsi üçün arxa plan şəkli'
-    )
-    is_footer_background_image = models.BooleanField(
-        default=False,
-        verbose_name='Websiten-ın aşağı hissəsi üçün arxa plan şəkli'
-    )
-
     created_at = models.DateTimeField(
         auto_now_add=True,
         verbose_name='Image yaradılma tarixi'
@@ -99,6 +80,13 @@ class Media(models.Model):
     class Meta:
         verbose_name = 'Media'
         verbose_name_plural = 'Medialar'
+        indexes = [
+            models.Index(fields=['project', 'created_at'], name='media_project_idx'),
+            models.Index(fields=['about', 'created_at'], name='media_about_idx'),
+            models.Index(fields=['partner', 'created_at'], name='media_partner_idx'),
+            models.Index(fields=['vacancy', 'created_at'], name='media_vacancy_idx'),
+            models.Index(fields=['service', 'created_at'], name='media_service_idx'),
+        ]
 
     @property
     def webp_url(self):
@@ -162,4 +150,32 @@ class Media(models.Model):
         
         super().delete(*args, **kwargs)
         
-        logger.info(f"[IMAGE DELETE] Image successfully deleted (Image ID: {image_id})")
\ No newline at end of file
+        logger.info(f"[IMAGE DELETE] Image successfully deleted (Image ID: {image_id})")
+
+
+class MediaPlacement(models.Model):
+    """Arxa plan şəklinin hansı səhifədə göstərildiyini saxlayır"""
+    media = models.ForeignKey(
+        Media,
+        related_name='placements',
+        on_delete=models.CASCADE,
+        verbose_name='Media'
+    )
+    placement = models.CharField(
+        max_length=20,
+        choices=Placement.choices,
+        verbose_name='Yerləşmə'
+    )
+
+    class Meta:
+        verbose_name = 'Arxa plan yerləşməsi'
+        verbose_name_plural = 'Arxa plan yerləşmələri'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['placement', 'media'],
+                name='unique_media_per_placement'
+            ),
+        ]
+
+    def __str__(self):
+        return self.get_placement_display()
@@ -1,8 +1,10 @@
 from django.db import models
 from django.core.validators import MaxLengthValidator
 
+from projects.utils import CoverMediaModel
 
-class Partner(models.Model):
+
+class Partner(CoverMediaModel):
     name_az = models.CharField(
         max_length=120,
         null=True,
@@ -52,6 +54,12 @@ class Partner(models.Model):
         verbose_name = 'Tərəfdaş'
         verbose_name_plural = 'Tərəfdaşlar'
         ordering = ('-created_at',)
+        indexes = [
+            models.Index(
+                fields=['is_active', 'created_at'],
+                name='partner_listing_idx'
+            ),
+        ]
 
     def __str__(self):
         return self.name_az or 'Əməkdaş'
@@ -1,7 +1,8 @@
 from django.db import models
 from django.core.validators import MaxLengthValidator
 
-from projects.utils import SluggedModel
+from projects.utils import SluggedModel, CoverMediaModel
+from .search_models import admin_search_index
 
 
 class ProjectCategory(SluggedModel):
@@ -35,7 +36,7 @@ class ProjectCategory(SluggedModel):
         return self.name_az or 'Kateqoriya'
 
 
-class Project(SluggedModel):
+class Project(SluggedModel, CoverMediaModel):
     category = models.ForeignKey(
         ProjectCategory,
         on_delete=models.PROTECT,
@@ -119,6 +120,27 @@ class Project(SluggedModel):
         verbose_name = 'Layihə'
         verbose_name_plural = 'Layihələr'
         ordering  = ['-created_at']
+        indexes = [
+            models.Index(
+                fields=['is_active', 'on_main_page', 'speacial_project', '-created_at'],
+                name='project_listing_idx'
+            ),
+            models.Index(
+                fields=['category', 'is_active', 'created_at'],
+                name='project_category_listing_idx'
+            ),
+            admin_search_index(
+                [
+                    'name_az',
+                    'name_en',
+                    'name_ru',
+                    'description_az',
+                    'description_en',
+                    'description_ru',
+                ],
+                name='project_admin_search_idx'
+            ),
+        ]
 
     def __str__(self):
         return self.name_az
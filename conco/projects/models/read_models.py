@@ -0,0 +1,141 @@
+from django.db import models
+
+from .project_models import Project
+from .vacancy_models import Vacancy
+
+
+class ProjectCard(models.Model):
+    """
+    Denormalized, per-language read row for project list pages.
+    Rebuilt from Project/ProjectCategory on write (see utils/read_tables.py).
+    """
+    lang = models.CharField(
+        max_length=2
+    )
+    project = models.ForeignKey(
+        Project,
+        on_delete=models.CASCADE,
+        related_name='cards'
+    )
+    slug = models.SlugField(
+        max_length=255
+    )
+    name = models.CharField(
+        max_length=250,
+        null=True,
+        blank=True
+    )
+    url = models.URLField(
+        null=True,
+        blank=True
+    )
+    category_id = models.BigIntegerField()
+    category_slug = models.SlugField(
+        max_length=255
+    )
+    category_name = models.CharField(
+        max_length=255,
+        null=True,
+        blank=True
+    )
+    cover_url = models.CharField(
+        max_length=500,
+        null=True,
+        blank=True
+    )
+    cover_width = models.PositiveIntegerField(
+        null=True,
+        blank=True
+    )
+    cover_height = models.PositiveIntegerField(
+        null=True,
+        blank=True
+    )
+    is_active = models.BooleanField(
+        null=True
+    )
+    is_completed = models.BooleanField(
+        null=True
+    )
+    speacial_project = models.BooleanField(
+        null=True
+    )
+    on_main_page = models.BooleanField(
+        null=True
+    )
+    project_date = models.DateField(
+        null=True,
+        blank=True
+    )
+    created_at = models.DateTimeField()
+
+    class Meta:
+        verbose_name = 'Layihə kartı'
+        verbose_name_plural = 'Layihə kartları'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['project', 'lang'],
+                name='unique_project_card_per_lang'
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=['lang', 'is_active', '-created_at'],
+                name='project_card_listing_idx'
+            ),
+            models.Index(
+                fields=['lang', 'category_slug', 'is_active', '-created_at'],
+                name='project_card_category_idx'
+            ),
+        ]
+
+    def __str__(self):
+        return f'{self.name} ({self.lang})'
+
+
+class VacancyCard(models.Model):
+    """
+    Denormalized, per-language read row for the vacancy list page.
+    """
+    lang = models.CharField(
+        max_length=2
+    )
+    vacancy = models.ForeignKey(
+        Vacancy,
+        on_delete=models.CASCADE,
+        related_name='cards'
+    )
+    slug = models.SlugField(
+        max_length=255
+    )
+    title = models.CharField(
+        max_length=250,
+        null=True,
+        blank=True
+    )
+    image = models.CharField(
+        max_length=500,
+        null=True,
+        blank=True
+    )
+    is_active = models.BooleanField()
+    created_at = models.DateTimeField()
+
+    class Meta:
+        verbose_name = 'Vakansiya kartı'
+        verbose_name_plural = 'Vakansiya kartları'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['vacancy', 'lang'],
+                name='unique_vacancy_card_per_lang'
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=['lang', 'is_active', '-created_at'],
+                name='vacancy_card_listing_idx'
+            ),
+        ]
+
+    def __str__(self):
+        return f'{self.title} ({self.lang})'
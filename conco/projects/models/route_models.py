@@ -0,0 +1,57 @@
+from django.db import models
+
+
+class SlugRoute(models.Model):
+    """
+    /projects/<slug>/ routing index: slug -> (kind, object_id, version).
+    Old slugs stay as non-current rows and are redirected to the current one.
+    Maintained by signals on Project/ProjectCategory (see utils/slug_routes.py).
+    """
+
+    class Kind(models.TextChoices):
+        PROJECT = 'project', 'Layihə'
+        CATEGORY = 'category', 'Kateqoriya'
+
+    slug = models.SlugField(
+        max_length=255,
+        verbose_name='Slug'
+    )
+    kind = models.CharField(
+        max_length=20,
+        choices=Kind.choices,
+        verbose_name='Növ'
+    )
+    object_id = models.BigIntegerField(
+        verbose_name='Obyekt ID'
+    )
+    version = models.PositiveIntegerField(
+        default=1,
+        verbose_name='Versiya'
+    )
+    is_current = models.BooleanField(
+        default=True,
+        verbose_name='Aktual slug'
+    )
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        verbose_name='Yenilənmə tarixi'
+    )
+
+    class Meta:
+        verbose_name = 'Slug marşrutu'
+        verbose_name_plural = 'Slug marşrutları'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['slug', 'kind'],
+                name='unique_slug_route_per_kind'
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=['kind', 'object_id'],
+                name='slug_route_object_idx'
+            ),
+        ]
+
+    def __str__(self):
+        return f'{self.slug} → {self.kind}:{self.object_id}'
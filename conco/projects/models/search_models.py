@@ -0,0 +1,85 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector, SearchVectorField
+from django.db import models
+
+
+SEARCH_LANGUAGES = ('az', 'en', 'ru')
+
+# Admin search spans all languages of a row: no stemming, one index per model
+ADMIN_SEARCH_CONFIG = 'simple'
+
+
+def admin_search_index(fields, name):
+    """
+    Expression GIN index over the tsvector of `fields`; PostgreSQL keeps it
+    up to date. The admin filters on the same expression (admin/mixins.py).
+    """
+    return GinIndex(SearchVector(*fields, config=ADMIN_SEARCH_CONFIG), name=name)
+
+
+class SearchEntry(models.Model):
+    """
+    Per-language full-text search row of a Project, Service or Vacancy.
+    Rebuilt from the source object on write (see utils/search.py).
+    """
+    class Kind(models.TextChoices):
+        PROJECT = 'project', 'Layihə'
+        SERVICE = 'service', 'Servis'
+        VACANCY = 'vacancy', 'Vakansiya'
+
+    kind = models.CharField(
+        max_length=20,
+        choices=Kind.choices
+    )
+    object_id = models.BigIntegerField()
+    lang = models.CharField(
+        max_length=2
+    )
+    title = models.CharField(
+        max_length=250
+    )
+    snippet = models.CharField(
+        max_length=300,
+        blank=True
+    )
+    slug = models.SlugField(
+        max_length=255,
+        null=True,
+        blank=True
+    )
+    image = models.CharField(
+        max_length=500,
+        null=True,
+        blank=True
+    )
+    # Lowercased, accent-folded text the document is built from
+    title_text = models.CharField(
+        max_length=250
+    )
+    body_text = models.TextField(
+        blank=True
+    )
+    document = SearchVectorField(
+        null=True
+    )
+    created_at = models.DateTimeField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['kind', 'object_id', 'lang'],
+                name='unique_search_entry'
+            ),
+        ]
+        # One GIN index per language: every search filters on a single lang
+        indexes = [
+            GinIndex(
+                fields=['document'],
+                condition=models.Q(lang=lang),
+                name=f'search_document_{lang}_idx'
+            )
+            for lang in SEARCH_LANGUAGES
+        ]
+
+    def __str__(self):
+        return f'{self.kind}:{self.object_id} ({self.lang})'
@@ -1,8 +1,11 @@
 from django.db import models
 from django.core.validators import MaxLengthValidator
 
+from projects.utils import CoverMediaModel
+from .search_models import admin_search_index
 
-class Service(models.Model):
+
+class Service(CoverMediaModel):
     title_az = models.CharField(
         max_length=250,
         verbose_name='Service adı (AZ)'
@@ -55,6 +58,23 @@ class Service(models.Model):
         verbose_name = 'Servis'
         verbose_name_plural = 'Servislər'
         ordering  = ['-created_at']
+        indexes = [
+            models.Index(
+                fields=['is_active', 'created_at'],
+                name='service_listing_idx'
+            ),
+            admin_search_index(
+                [
+                    'title_az',
+                    'title_en',
+                    'title_ru',
+                    'description_az',
+                    'description_en',
+                    'description_ru',
+                ],
+                name='service_admin_search_idx'
+            ),
+        ]
     
 
     def __str__(self):
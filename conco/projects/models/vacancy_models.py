@@ -1,10 +1,11 @@
 from django.db import models
 from django.core.validators import MaxLengthValidator
 
-from projects.utils import SluggedModel
+from projects.utils import SluggedModel, CoverMediaModel
+from .search_models import admin_search_index
 
 
-class Vacancy(SluggedModel):
+class Vacancy(SluggedModel, CoverMediaModel):
     title_az = models.CharField(
         max_length=250,
         verbose_name='Vakansiya adı (AZ)'
@@ -53,6 +54,23 @@ class Vacancy(SluggedModel):
         verbose_name = 'Vakansiya'
         verbose_name_plural = 'Vakansiyalar'
         ordering  = ['-created_at']
+        indexes = [
+            models.Index(
+                fields=['is_active', 'created_at'],
+                name='vacancy_listing_idx'
+            ),
+            admin_search_index(
+                [
+                    'title_az',
+                    'title_en',
+                    'title_ru',
+                    'description_az',
+                    'description_en',
+                    'description_ru',
+                ],
+                name='vacancy_admin_search_idx'
+            ),
+        ]
     
     def get_slug_source(self) -> str:
         return self.title_az
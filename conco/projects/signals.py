@@ -1,11 +1,20 @@
 from django.db.models.signals import post_save, post_delete, pre_save
 from django.dispatch import receiver
 from django.conf import settings
+from django_cleanup.signals import cleanup_post_delete
 
 # from projects.utils import send_mail_func
 from projects.utils.cache_utils import invalidate_model_cache
+from projects.utils.thumbnails import ADMIN_THUMBNAIL_SIZE, delete_thumbnails, ensure_thumbnail
+from projects.utils.read_tables import schedule_project_cards_refresh, schedule_vacancy_cards_refresh
+from projects.utils import counters
+from projects.utils.slug_routes import record_slug, forget_object
+from projects.utils.appeals import sync_appeal_keys
+from projects.utils.search import schedule_search_refresh, schedule_category_search_refresh
+from projects.utils.typeahead import schedule_typeahead_rebuild
 from projects.models import (
     AppealVacancy, 
+    AppealVacancyKey,
     AppealContact, 
     Project, 
     ProjectCategory, 
@@ -14,9 +23,13 @@ from projects.models import (
     About, 
     Contact, 
     Media,
+    MediaPlacement,
+    SlugRoute,
+    SearchEntry,
     Motto, 
     Statistic,
     Service,
+    Counter,
 )
 
 
@@ -121,10 +134,271 @@ def invalidate_media_cache(sender, instance, **kwargs):
         invalidate_model_cache('Vacancy')
     if getattr(instance, 'service_id', None):
         invalidate_model_cache('Service')
-    
-    # If media is a background image for home page, invalidate home page cache
-    if instance.is_home_page_background_image:
-        invalidate_model_cache('Media')
+
+
+@receiver(post_save, sender=Media)
+def create_media_thumbnail(sender, instance, **kwargs):
+    """Admin thumbnail right after upload; a no-op when it already exists."""
+    if instance.image:
+        ensure_thumbnail(instance.image.storage, instance.image.name, ADMIN_THUMBNAIL_SIZE)
+
+
+@receiver(cleanup_post_delete)
+def delete_image_thumbnails(sender, file_name, field_name, file, **kwargs):
+    """django-cleanup removed a replaced/deleted image: its thumbnails go too."""
+    if field_name == 'image':
+        delete_thumbnails(file.storage, file_name)
+
+
+@receiver(post_save, sender=MediaPlacement)
+@receiver(post_delete, sender=MediaPlacement)
+def invalidate_media_placement_cache(sender, instance, **kwargs):
+    """Invalidate cache when a background placement is added or removed."""
+    invalidate_model_cache('MediaPlacement')
+
+
+@receiver(post_save, sender=Media)
+@receiver(post_delete, sender=Media)
+def refresh_cover_media(sender, instance, **kwargs):
+    """Keep the denormalized cover image of the media owner up to date."""
+    owners = (
+        (Project, 'project_id'),
+        (Partner, 'partner_id'),
+        (Vacancy, 'vacancy_id'),
+        (Service, 'service_id'),
+    )
+    for model, fk_name in owners:
+        owner_id = getattr(instance, fk_name, None)
+        if not owner_id:
+            continue
+        # The owner may already be gone when media is deleted in cascade
+        owner = model.objects.filter(pk=owner_id).first()
+        if owner:
+            owner.refresh_cover_media()
+
+    # Cards carry the cover too, rebuild them after the cover is refreshed
+    if getattr(instance, 'project_id', None):
+        schedule_project_cards_refresh(project_ids=[instance.project_id])
+    if getattr(instance, 'vacancy_id', None):
+        schedule_vacancy_cards_refresh(vacancy_ids=[instance.vacancy_id])
+
+    # Search results show the cover as well
+    search_owners = (
+        (SearchEntry.Kind.PROJECT, 'project_id'),
+        (SearchEntry.Kind.VACANCY, 'vacancy_id'),
+        (SearchEntry.Kind.SERVICE, 'service_id'),
+    )
+    for kind, fk_name in search_owners:
+        if getattr(instance, fk_name, None):
+            schedule_search_refresh(kind, [getattr(instance, fk_name)])
+
+
+# Read table (ProjectCard, VacancyCard) maintenance
+
+@receiver(post_save, sender=Project)
+def refresh_project_cards_on_save(sender, instance, **kwargs):
+    """Rebuild the per-language cards of a saved Project."""
+    schedule_project_cards_refresh(project_ids=[instance.pk])
+
+
+@receiver(post_save, sender=ProjectCategory)
+def refresh_category_project_cards_on_save(sender, instance, **kwargs):
+    """Category name/slug is copied into every project card of the category."""
+    schedule_project_cards_refresh(category_id=instance.pk)
+
+
+@receiver(post_save, sender=Vacancy)
+def refresh_vacancy_cards_on_save(sender, instance, **kwargs):
+    """Rebuild the per-language cards of a saved Vacancy."""
+    schedule_vacancy_cards_refresh(vacancy_ids=[instance.pk])
+
+
+# Site search index (see utils/search.py)
+
+@receiver(post_save, sender=Project)
+@receiver(post_delete, sender=Project)
+def refresh_project_search(sender, instance, **kwargs):
+    schedule_search_refresh(SearchEntry.Kind.PROJECT, [instance.pk])
+
+
+@receiver(post_save, sender=ProjectCategory)
+def refresh_category_search(sender, instance, **kwargs):
+    """Project search rows include the category name."""
+    schedule_category_search_refresh(instance.pk)
+
+
+@receiver(post_save, sender=Service)
+@receiver(post_delete, sender=Service)
+def refresh_service_search(sender, instance, **kwargs):
+    schedule_search_refresh(SearchEntry.Kind.SERVICE, [instance.pk])
+
+
+@receiver(post_save, sender=Vacancy)
+@receiver(post_delete, sender=Vacancy)
+def refresh_vacancy_search(sender, instance, **kwargs):
+    schedule_search_refresh(SearchEntry.Kind.VACANCY, [instance.pk])
+
+
+@receiver(post_save, sender=Project)
+@receiver(post_delete, sender=Project)
+@receiver(post_save, sender=ProjectCategory)
+@receiver(post_delete, sender=ProjectCategory)
+@receiver(post_save, sender=Service)
+@receiver(post_delete, sender=Service)
+@receiver(post_save, sender=Vacancy)
+@receiver(post_delete, sender=Vacancy)
+def rebuild_typeahead(sender, instance, **kwargs):
+    """In-memory suggestion index (utils/typeahead.py) is rebuilt on next use."""
+    schedule_typeahead_rebuild()
+
+
+# Slug routing index (see utils/slug_routes.py)
+
+@receiver(post_save, sender=Project)
+def record_project_slug(sender, instance, **kwargs):
+    record_slug(SlugRoute.Kind.PROJECT, instance.pk, instance.slug)
+
+
+@receiver(post_save, sender=ProjectCategory)
+def record_category_slug(sender, instance, **kwargs):
+    record_slug(SlugRoute.Kind.CATEGORY, instance.pk, instance.slug)
+
+
+@receiver(post_delete, sender=Project)
+def forget_project_slug(sender, instance, **kwargs):
+    forget_object(SlugRoute.Kind.PROJECT, instance.pk)
+
+
+@receiver(post_delete, sender=ProjectCategory)
+def forget_category_slug(sender, instance, **kwargs):
+    forget_object(SlugRoute.Kind.CATEGORY, instance.pk)
+
+
+# Counter maintenance (see utils/counters.py)
+
+@receiver(pre_save, sender=Project)
+def remember_project_counter_keys(sender, instance, **kwargs):
+    old = sender.objects.filter(pk=instance.pk).only(
+        'is_active', 'speacial_project', 'on_main_page', 'category_id'
+    ).first() if instance.pk else None
+    instance._counter_keys = counters.project_counter_keys(old) if old else set()
+
+
+@receiver(post_save, sender=Project)
+def update_project_counters(sender, instance, **kwargs):
+    counters.apply_key_changes(
+        getattr(instance, '_counter_keys', set()),
+        counters.project_counter_keys(instance),
+    )
+    instance._counter_keys = counters.project_counter_keys(instance)
+
+
+@receiver(post_delete, sender=Project)
+def decrement_project_counters(sender, instance, **kwargs):
+    counters.apply_key_changes(counters.project_counter_keys(instance), set())
+
+
+@receiver(pre_save, sender=Partner)
+def remember_partner_counter_keys(sender, instance, **kwargs):
+    old = sender.objects.filter(pk=instance.pk).only('is_active').first() if instance.pk else None
+    instance._counter_keys = counters.partner_counter_keys(old) if old else set()
+
+
+@receiver(post_save, sender=Partner)
+def update_partner_counters(sender, instance, **kwargs):
+    counters.apply_key_changes(
+        getattr(instance, '_counter_keys', set()),
+        counters.partner_counter_keys(instance),
+    )
+    instance._counter_keys = counters.partner_counter_keys(instance)
+
+
+@receiver(post_delete, sender=Partner)
+def decrement_partner_counters(sender, instance, **kwargs):
+    counters.apply_key_changes(counters.partner_counter_keys(instance), set())
+
+
+@receiver(pre_save, sender=AppealVacancy)
+def remember_applicant(sender, instance, **kwargs):
+    old = sender.objects.filter(pk=instance.pk).values_list(
+        'email', 'phone_number', 'is_read', 'vacancy_id'
+    ).first() if instance.pk else None
+    instance._applicant = old[:2] if old else None
+    instance._unread_keys = counters.appeal_counter_keys(*old[2:]) if old else set()
+
+
+@receiver(post_save, sender=AppealVacancy)
+def update_applicant_counter(sender, instance, **kwargs):
+    """distinct_applicants: fərqli (email, telefon) cütlərinin sayı"""
+    old = getattr(instance, '_applicant', None)
+    new = (instance.email, instance.phone_number)
+    if old == new:
+        return
+    if not counters.applicant_exists(*new, exclude_pk=instance.pk):
+        counters.increment(counters.DISTINCT_APPLICANTS, 1)
+    if old is not None and not counters.applicant_exists(*old, exclude_pk=instance.pk):
+        counters.increment(counters.DISTINCT_APPLICANTS, -1)
+    instance._applicant = new
+
+
+@receiver(post_delete, sender=AppealVacancy)
+def decrement_applicant_counter(sender, instance, **kwargs):
+    if not counters.applicant_exists(instance.email, instance.phone_number):
+        counters.increment(counters.DISTINCT_APPLICANTS, -1)
+
+
+@receiver(post_save, sender=AppealVacancy)
+def update_unread_appeal_counters(sender, instance, **kwargs):
+    # The public form inserts without pre_save: a new appeal has no old keys
+    new_keys = counters.appeal_counter_keys(instance.is_read, instance.vacancy_id)
+    counters.apply_key_changes(getattr(instance, '_unread_keys', set()), new_keys)
+    instance._unread_keys = new_keys
+
+
+@receiver(post_delete, sender=AppealVacancy)
+def decrement_unread_appeal_counters(sender, instance, **kwargs):
+    counters.apply_key_changes(
+        counters.appeal_counter_keys(instance.is_read, instance.vacancy_id), set()
+    )
+
+
+@receiver(post_delete, sender=Vacancy)
+def forget_unread_appeal_counter(sender, instance, **kwargs):
+    # Appeals of a deleted vacancy stay (SET_NULL) and only count in the total
+    Counter.objects.filter(key=counters.unread_appeals_key(instance.pk)).delete()
+
+
+@receiver(pre_save, sender=AppealContact)
+def remember_contact_read_state(sender, instance, **kwargs):
+    old = sender.objects.filter(pk=instance.pk).values_list('is_read', flat=True).first() if instance.pk else None
+    instance._unread_keys = counters.contact_counter_keys(old) if old is not None else set()
+
+
+@receiver(post_save, sender=AppealContact)
+def update_unread_contact_counter(sender, instance, **kwargs):
+    new_keys = counters.contact_counter_keys(instance.is_read)
+    counters.apply_key_changes(getattr(instance, '_unread_keys', set()), new_keys)
+    instance._unread_keys = new_keys
+
+
+@receiver(post_delete, sender=AppealContact)
+def decrement_unread_contact_counter(sender, instance, **kwargs):
+    counters.apply_key_changes(counters.contact_counter_keys(instance.is_read), set())
+
+
+# Duplicate-detection keys of vacancy applications (see utils/appeals.py)
+
+@receiver(post_save, sender=AppealVacancy)
+def sync_keys_on_appeal_save(sender, instance, **kwargs):
+    """Admin edits of email/phone; the public form inserts its keys itself."""
+    if getattr(instance, '_keys_synced', False):
+        return
+    sync_appeal_keys(instance)
+
+
+@receiver(post_delete, sender=AppealVacancy)
+def delete_appeal_keys(sender, instance, **kwargs):
+    AppealVacancyKey.objects.filter(appeal_id=instance.pk).delete()
 
 
 @receiver(post_save, sender=Motto)
@@ -9,6 +9,9 @@ from projects.views.views_v1 import (
     ContactPageView,
     VacancyPageView,
     VacancyDetailPageView,
+    SearchPageView,
+    SearchResultsView,
+    SearchSuggestView,
 )
 
 
@@ -54,5 +57,20 @@ urlpatterns = [
         'vacancies/<slug:slug>/', 
         VacancyDetailPageView.as_view(), 
         name='vacancy-detail'
+    ),
+    path(
+        'search/', 
+        SearchPageView.as_view(), 
+        name='search-page'
+    ),
+    path(
+        'search/results/', 
+        SearchResultsView.as_view(), 
+        name='search-results'
+    ),
+    path(
+        'search/suggest/', 
+        SearchSuggestView.as_view(), 
+        name='search-suggest'
     )
 ]   
@@ -1,4 +1,4 @@
-from .abstract_models import SluggedModel
+from .abstract_models import SluggedModel, CoverMediaModel
 from .unique_slugify import unique_slugify
 from .normalize_phone_number import normalize_az_phone
 # from .send_mail import send_mail_func
@@ -6,6 +6,7 @@ from .normalize_phone_number import normalize_az_phone
 
 __all__ = [
     'SluggedModel', 
+    'CoverMediaModel',
     'unique_slugify', 
     'normalize_az_phone', 
     'send_mail_func',
@@ -1,4 +1,4 @@
-from django.db import models
+from django.db import models, transaction, IntegrityError
 
 from projects.utils.unique_slugify import unique_slugify
 
@@ -33,7 +33,83 @@ class SluggedModel(models.Model):
                 return val  
         raise ValueError(f"No slug source on {self.__class__.__name__}")
 
+    # Paralel yazılarda eyni slug seçilə bilər; unique index xəta verəndə
+    # slug yenidən hesablanır.
+    slug_retries = 5
+
     def save(self, *args, **kwargs):
-        if not self.slug:
+        if self.slug:
+            return super().save(*args, **kwargs)
+
+        for attempt in range(self.slug_retries):
             unique_slugify(self, self.get_slug_source(), slug_field="slug")
-        super().save(*args, **kwargs)  
\ No newline at end of file
+            try:
+                with transaction.atomic():
+                    return super().save(*args, **kwargs)
+            except IntegrityError:
+                slug_taken = type(self)._default_manager.filter(
+                    slug=self.slug
+                ).exclude(pk=self.pk).exists()
+                if not slug_taken or attempt == self.slug_retries - 1:
+                    raise
+
+
+class CoverMediaModel(models.Model):
+    """
+    Abstract model that keeps a denormalized copy of the first image in
+    `medias` so list pages can render a card without touching Media.
+    """
+
+    cover_media_url = models.CharField(
+        max_length=500,
+        null=True,
+        blank=True,
+        editable=False,
+        verbose_name='Örtük şəkli'
+    )
+    cover_media_width = models.PositiveIntegerField(
+        null=True,
+        blank=True,
+        editable=False
+    )
+    cover_media_height = models.PositiveIntegerField(
+        null=True,
+        blank=True,
+        editable=False
+    )
+
+    class Meta:
+        abstract = True
+
+    @property
+    def cover_media(self):
+        if not self.cover_media_url:
+            return None
+        return {
+            'url': self.cover_media_url,
+            'width': self.cover_media_width,
+            'height': self.cover_media_height,
+        }
+
+    def refresh_cover_media(self):
+        """
+        Recompute the cover from the first image in `medias` and write it
+        with a plain UPDATE, so no save signals are fired.
+        """
+        media = self.medias.exclude(image='').exclude(image__isnull=True).order_by('id').first()
+        url = width = height = None
+        if media:
+            url = media.image.url
+            try:
+                width, height = media.image.width, media.image.height
+            except Exception:
+                pass
+
+        self.cover_media_url = url
+        self.cover_media_width = width
+        self.cover_media_height = height
+        type(self).objects.filter(pk=self.pk).update(
+            cover_media_url=url,
+            cover_media_width=width,
+            cover_media_height=height,
+        )
@@ -0,0 +1,168 @@
+"""
+Daily activity rollup (DailyActivity) and the admin dashboard built on it.
+
+rollup_activity() re-aggregates only the trailing days since the last run
+(a created_at range scan that touches the newest appeal partitions) and
+replaces their rows; older days are final. Days before the oldest live
+appeal are never recomputed: their appeals may sit in archived partitions,
+so the rollup is all that is left of them. The dashboard reads the small
+rollup table, Counter and the content tables, never GROUP BY over the
+appeal tables. `manage.py rollup_activity` runs it hourly (the docker
+compose "scheduler" service).
+"""
+import datetime
+
+from django.db import transaction
+from django.db.models import Count, Max, Min, Sum
+from django.db.models.functions import TruncDate, TruncWeek
+from django.utils import timezone
+
+from projects.models import AppealContact, AppealVacancy, DailyActivity, Service, Vacancy
+from projects.utils import counters
+
+
+# Appeals committed late or around midnight: the last days are recomputed
+ROLLUP_OVERLAP_DAYS = 2
+DASHBOARD_DAYS = 14
+DASHBOARD_WEEKS = 8
+DASHBOARD_VACANCIES = 10
+
+
+def day_start(day):
+    return timezone.make_aware(datetime.datetime.combine(day, datetime.time.min))
+
+
+def first_activity_day():
+    days = [
+        model.objects.aggregate(first=Min('created_at'))['first']
+        for model in (AppealVacancy, AppealContact)
+    ]
+    days = [timezone.localtime(day).date() for day in days if day]
+    return min(days) if days else timezone.localdate()
+
+
+def rollup_since():
+    last = DailyActivity.objects.aggregate(last=Max('day'))['last']
+    if last is None:
+        return first_activity_day()
+    return last - datetime.timedelta(days=ROLLUP_OVERLAP_DAYS)
+
+
+def rollup_activity(since=None):
+    """Recompute DailyActivity from day `since` on; returns (since, rows written)."""
+    if since is None:
+        since = rollup_since()
+    # Never delete rollup days whose appeals are no longer in the live tables
+    since = max(since, first_activity_day())
+    start = day_start(since)
+
+    appeals = (
+        AppealVacancy.objects.filter(created_at__gte=start)
+        .annotate(day=TruncDate('created_at'))
+        .values_list('day', 'vacancy_id')
+        .annotate(count=Count('pk'))
+        .order_by()
+    )
+    contacts = (
+        AppealContact.objects.filter(created_at__gte=start)
+        .annotate(day=TruncDate('created_at'))
+        .values_list('day')
+        .annotate(count=Count('pk'))
+        .order_by()
+    )
+    rows = [
+        DailyActivity(day=day, kind=DailyActivity.Kind.APPEAL, vacancy_id=vacancy_id, count=count)
+        for day, vacancy_id, count in appeals
+    ] + [
+        DailyActivity(day=day, kind=DailyActivity.Kind.CONTACT, count=count)
+        for day, count in contacts
+    ]
+
+    with transaction.atomic():
+        DailyActivity.objects.filter(day__gte=since).delete()
+        DailyActivity.objects.bulk_create(rows, batch_size=1000)
+    return since, len(rows)
+
+
+def daily_totals(kind, since):
+    return dict(
+        DailyActivity.objects.filter(kind=kind, day__gte=since)
+        .values_list('day')
+        .annotate(total=Sum('count'))
+        .order_by()
+    )
+
+
+def daily_rows(days):
+    appeals = daily_totals(DailyActivity.Kind.APPEAL, days[0])
+    contacts = daily_totals(DailyActivity.Kind.CONTACT, days[0])
+    # Bar widths relative to the busiest day of each series
+    appeals_peak = max(appeals.values(), default=0) or 1
+    contacts_peak = max(contacts.values(), default=0) or 1
+    return [
+        {
+            'day': day,
+            'appeals': appeals.get(day, 0),
+            'appeals_percent': round(appeals.get(day, 0) * 100 / appeals_peak),
+            'contacts': contacts.get(day, 0),
+            'contacts_percent': round(contacts.get(day, 0) * 100 / contacts_peak),
+        }
+        for day in days
+    ]
+
+
+def vacancy_label(vacancy_id, titles):
+    if vacancy_id is None:
+        return 'Vakansiyasız'
+    return titles.get(vacancy_id) or f'Silinmiş vakansiya #{vacancy_id}'
+
+
+def weekly_by_vacancy(weeks):
+    totals = {}
+    rows = (
+        DailyActivity.objects.filter(kind=DailyActivity.Kind.APPEAL, day__gte=weeks[0])
+        .annotate(week=TruncWeek('day'))
+        .values_list('vacancy_id', 'week')
+        .annotate(total=Sum('count'))
+        .order_by()
+    )
+    for vacancy_id, week, total in rows:
+        totals.setdefault(vacancy_id, {})[week] = total
+
+    top = sorted(totals, key=lambda vacancy_id: -sum(totals[vacancy_id].values()))[:DASHBOARD_VACANCIES]
+    titles = dict(Vacancy.objects.filter(pk__in=[pk for pk in top if pk]).values_list('pk', 'title_az'))
+    return [
+        {
+            'vacancy_id': vacancy_id,
+            'title': vacancy_label(vacancy_id, titles),
+            'weeks': [totals[vacancy_id].get(week, 0) for week in weeks],
+            'total': sum(totals[vacancy_id].values()),
+        }
+        for vacancy_id in top
+    ]
+
+
+def dashboard_data(today=None):
+    today = today or timezone.localdate()
+    days = [today - datetime.timedelta(days=offset) for offset in range(DASHBOARD_DAYS - 1, -1, -1)]
+    this_week = today - datetime.timedelta(days=today.weekday())
+    weeks = [this_week - datetime.timedelta(weeks=offset) for offset in range(DASHBOARD_WEEKS - 1, -1, -1)]
+
+    values = counters.get_counters([
+        counters.UNREAD_APPEALS, counters.UNREAD_CONTACTS,
+        counters.ACTIVE_PROJECTS, counters.ACTIVE_PARTNERS,
+    ])
+    return {
+        'days': daily_rows(days),
+        'weeks': weeks,
+        'appeals_per_week': weekly_by_vacancy(weeks),
+        'unread_appeals': values[counters.UNREAD_APPEALS],
+        'unread_contacts': values[counters.UNREAD_CONTACTS],
+        'content': [
+            ('Aktiv layihələr', values[counters.ACTIVE_PROJECTS]),
+            ('Aktiv tərəfdaşlar', values[counters.ACTIVE_PARTNERS]),
+            ('Aktiv vakansiyalar', Vacancy.objects.filter(is_active=True).count()),
+            ('Xidmətlər', Service.objects.count()),
+        ],
+        'rolled_up_to': DailyActivity.objects.aggregate(last=Max('day'))['last'],
+    }
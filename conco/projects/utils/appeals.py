@@ -0,0 +1,125 @@
+"""
+Vacancy application intake.
+
+Duplicate detection is a single INSERT ... ON CONFLICT DO NOTHING of the
+normalized email/phone keys into AppealVacancyKey (unique per vacancy; the
+appeal table itself is partitioned by month and cannot hold that unique
+constraint). The CV file is written to storage only after the row was
+accepted; rejected duplicates never touch the disk. Its size, type and
+SHA-256 are read from the upload and stored on the row.
+"""
+from django.db import connection, transaction
+from django.db.models.signals import post_save
+from django.utils import timezone
+
+from projects.models import AppealVacancy, AppealVacancyKey
+
+
+INSERT_COLUMNS = [
+    'vacancy', 'full_name', 'email', 'phone_number', 'info', 'cv',
+    'cv_size', 'cv_content_type', 'cv_original_name', 'cv_sha256', 'created_at', 'is_read',
+]
+
+
+def build_insert_sql():
+    opts = AppealVacancy._meta
+    columns = ', '.join(
+        connection.ops.quote_name(opts.get_field(name).column) for name in INSERT_COLUMNS
+    )
+    placeholders = ', '.join(['%s'] * len(INSERT_COLUMNS))
+    return (
+        f'INSERT INTO {connection.ops.quote_name(opts.db_table)} ({columns}) '
+        f'VALUES ({placeholders}) '
+        f'RETURNING {connection.ops.quote_name(opts.pk.column)}'
+    )
+
+
+def appeal_keys(email, phone_number):
+    keys = []
+    if email:
+        keys.append(f'email:{email}')
+    if phone_number:
+        keys.append(f'phone:{phone_number}')
+    return keys
+
+
+def build_keys_sql(count):
+    opts = AppealVacancyKey._meta
+    columns = ', '.join(
+        connection.ops.quote_name(opts.get_field(name).column)
+        for name in ('vacancy', 'key', 'appeal_id')
+    )
+    rows = ', '.join(['(%s, %s, %s)'] * count)
+    return (
+        f'INSERT INTO {connection.ops.quote_name(opts.db_table)} ({columns}) '
+        f'VALUES {rows} ON CONFLICT DO NOTHING '
+        f'RETURNING {connection.ops.quote_name(opts.pk.column)}'
+    )
+
+
+def sync_appeal_keys(appeal):
+    """Keep the keys of an appeal edited outside submit_vacancy_appeal() in line."""
+    keys = appeal_keys(appeal.email, appeal.phone_number) if appeal.vacancy_id else []
+    AppealVacancyKey.objects.filter(appeal_id=appeal.pk).exclude(key__in=keys).delete()
+    AppealVacancyKey.objects.bulk_create(
+        [AppealVacancyKey(vacancy_id=appeal.vacancy_id, key=key, appeal_id=appeal.pk) for key in keys],
+        ignore_conflicts=True,
+    )
+
+
+def submit_vacancy_appeal(form, vacancy):
+    """
+    Validated AppealForm -> saved AppealVacancy, or None when the same email
+    or phone number already applied to this vacancy.
+    """
+    appeal = form.save(commit=False)
+    appeal.vacancy = vacancy
+    appeal.created_at = timezone.now()
+
+    cv_file = appeal.cv.file
+    appeal.set_cv_metadata()
+    cv_field = AppealVacancy._meta.get_field('cv')
+    storage = cv_field.storage
+    cv_name = storage.get_available_name(
+        cv_field.generate_filename(appeal, cv_file.name),
+        max_length=cv_field.max_length,
+    )
+
+    values = []
+    for name in INSERT_COLUMNS:
+        field = AppealVacancy._meta.get_field(name)
+        value = cv_name if name == 'cv' else getattr(appeal, field.attname)
+        values.append(field.get_db_prep_save(value, connection))
+
+    keys = appeal_keys(appeal.email, appeal.phone_number)
+
+    with transaction.atomic():
+        with connection.cursor() as cursor:
+            cursor.execute(build_insert_sql(), values)
+            appeal.pk = cursor.fetchone()[0]
+
+            params = []
+            for key in keys:
+                params += [vacancy.pk, key, appeal.pk]
+            cursor.execute(build_keys_sql(len(keys)), params)
+            if len(cursor.fetchall()) < len(keys):
+                # Email or phone already applied: drop the appeal row as well
+                transaction.set_rollback(True)
+                return None
+
+        # A file with the same name may have appeared meanwhile
+        saved_name = storage.save(cv_name, cv_file, max_length=cv_field.max_length)
+        if saved_name != cv_name:
+            AppealVacancy.objects.filter(pk=appeal.pk).update(cv=saved_name)
+
+        appeal.cv.name = saved_name
+        appeal.cv._committed = True
+        appeal._state.adding = False
+        appeal._state.db = connection.alias
+        # Raw insert: keep the post_save receivers (counters, caches) informed
+        appeal._keys_synced = True
+        post_save.send(
+            sender=AppealVacancy, instance=appeal, created=True,
+            update_fields=None, raw=False, using=connection.alias,
+        )
+    return appeal
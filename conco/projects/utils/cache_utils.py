@@ -43,7 +43,8 @@ def generate_cache_key(prefix, *args, **kwargs):
     key_string = "|".join(key_parts)
     
     # Hash the key if it's too long (Django cache keys have length limits)
-    if len(key_string) > 200:
+    # or carries visitor text (spaces, non-ASCII) that memcached rejects
+    if len(key_string) > 200 or not key_string.isascii() or any(char.isspace() for char in key_string):
         key_string = hashlib.md5(key_string.encode()).hexdigest()
         return f"conco:{prefix}:{key_string}"
     
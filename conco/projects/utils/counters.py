@@ -0,0 +1,132 @@
+"""
+Incrementally maintained counters (Counter model).
+
+Signals in projects/signals.py apply +1/-1 deltas inside the writing
+transaction, so get_statistics() and the ProjectAdminForm quotas read a single
+row instead of running COUNT queries. `manage.py rebuild_counters` recomputes
+everything when rows were changed behind the signals (queryset.update(), raw
+SQL). The bulk read/unread actions (projects.utils.read_state) move the
+unread counters themselves.
+"""
+from django.db import transaction
+from django.db.models import Count, F
+
+from projects.models import Counter, Project, Partner, AppealVacancy, AppealContact
+
+
+ACTIVE_PROJECTS = 'active_projects'
+ACTIVE_PARTNERS = 'active_partners'
+DISTINCT_APPLICANTS = 'distinct_applicants'
+SPECIAL_PROJECTS = 'special_projects'
+UNREAD_APPEALS = 'unread_appeals'
+UNREAD_CONTACTS = 'unread_contacts'
+
+
+def main_page_key(category_id):
+    return f'main_page_projects:{category_id}'
+
+
+def unread_appeals_key(vacancy_id):
+    return f'{UNREAD_APPEALS}:{vacancy_id}'
+
+
+def project_counter_keys(project):
+    """Counters the given project is currently counted in."""
+    keys = set()
+    if project.is_active:
+        keys.add(ACTIVE_PROJECTS)
+    if project.speacial_project and project.on_main_page:
+        keys.add(SPECIAL_PROJECTS)
+    if project.on_main_page and project.category_id:
+        keys.add(main_page_key(project.category_id))
+    return keys
+
+
+def partner_counter_keys(partner):
+    return {ACTIVE_PARTNERS} if partner.is_active else set()
+
+
+def appeal_counter_keys(is_read, vacancy_id):
+    """Unread counters of an appeal: the total and its vacancy's."""
+    if is_read:
+        return set()
+    keys = {UNREAD_APPEALS}
+    if vacancy_id:
+        keys.add(unread_appeals_key(vacancy_id))
+    return keys
+
+
+def contact_counter_keys(is_read):
+    return set() if is_read else {UNREAD_CONTACTS}
+
+
+def increment(key, delta):
+    if not delta:
+        return
+    with transaction.atomic():
+        updated = Counter.objects.filter(key=key).update(value=F('value') + delta)
+        if not updated:
+            Counter.objects.get_or_create(key=key)
+            Counter.objects.filter(key=key).update(value=F('value') + delta)
+
+
+def apply_key_changes(old_keys, new_keys):
+    for key in new_keys - old_keys:
+        increment(key, 1)
+    for key in old_keys - new_keys:
+        increment(key, -1)
+
+
+def get_counters(keys):
+    """{key: value} for the given keys, missing counters are 0."""
+    values = dict(Counter.objects.filter(key__in=keys).values_list('key', 'value'))
+    return {key: values.get(key, 0) for key in keys}
+
+
+def get_counter(key):
+    return get_counters([key])[key]
+
+
+def applicant_exists(email, phone_number, exclude_pk=None):
+    qs = AppealVacancy.objects.filter(email=email, phone_number=phone_number)
+    if exclude_pk is not None:
+        qs = qs.exclude(pk=exclude_pk)
+    return qs.exists()
+
+
+def compute_counters():
+    """Counter values computed from scratch with COUNT queries."""
+    values = {
+        ACTIVE_PROJECTS: Project.objects.filter(is_active=True).count(),
+        ACTIVE_PARTNERS: Partner.objects.filter(is_active=True).count(),
+        DISTINCT_APPLICANTS: AppealVacancy.objects.values('email', 'phone_number').distinct().count(),
+        SPECIAL_PROJECTS: Project.objects.filter(speacial_project=True, on_main_page=True).count(),
+        UNREAD_APPEALS: AppealVacancy.objects.filter(is_read=False).count(),
+        UNREAD_CONTACTS: AppealContact.objects.filter(is_read=False).count(),
+    }
+    unread = (
+        AppealVacancy.objects.filter(is_read=False, vacancy__isnull=False)
+        .values_list('vacancy_id')
+        .annotate(count=Count('pk'))
+        .order_by()
+    )
+    for vacancy_id, count in unread:
+        values[unread_appeals_key(vacancy_id)] = count
+    category_ids = Project.objects.filter(on_main_page=True).values_list('category_id', flat=True)
+    for category_id in category_ids:
+        key = main_page_key(category_id)
+        values[key] = values.get(key, 0) + 1
+    return values
+
+
+def rebuild_counters():
+    values = compute_counters()
+    with transaction.atomic():
+        Counter.objects.exclude(key__in=values).delete()
+        Counter.objects.bulk_create(
+            [Counter(key=key, value=value) for key, value in values.items()],
+            update_conflicts=True,
+            unique_fields=['key'],
+            update_fields=['value'],
+        )
+    return values
@@ -0,0 +1,76 @@
+"""
+Streamed ZIP of applicants' CVs (admin "download CVs" actions).
+
+Appeals are read in chunks, every CV is copied from storage in chunks into
+the ZIP stream (stream_zip), and manifest.csv at the end lists every appeal
+with its file name inside the archive, or notes that the file is missing.
+The manifest is a second chunked pass over the same rows; only the ids of
+missing files are kept in between. Nothing is built in memory or on disk first.
+"""
+import os
+
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+from django.utils.text import get_valid_filename
+
+from projects.models import AppealVacancy
+from projects.utils.exports import stream_csv
+from projects.utils.zip_stream import stream_zip
+
+
+ARCHIVE_CHUNK_SIZE = 500
+NO_VACANCY_FOLDER = 'vakansiyasiz'
+
+ARCHIVE_FIELDS = (
+    'pk', 'vacancy__slug', 'vacancy__title_az', 'full_name', 'email',
+    'phone_number', 'created_at', 'cv', 'cv_original_name', 'cv_sha256',
+)
+MANIFEST_HEADERS = (
+    'Fayl', 'ID', 'Vakansiya', 'Ad Soyad', 'E-poçt', 'Mobil nömrə', 'Tarix', 'SHA-256',
+)
+
+
+def archive_name(pk, vacancy_slug, full_name, cv_name, original_name):
+    extension = os.path.splitext(original_name or cv_name)[1].lower()
+    # The id keeps names unique within a vacancy folder
+    stem = get_valid_filename(f'{pk}-{full_name or "cv"}')
+    return f'{vacancy_slug or NO_VACANCY_FOLDER}/{stem}{extension}'
+
+
+def read_chunks(storage, name):
+    with storage.open(name) as cv_file:
+        yield from cv_file.chunks()
+
+
+def archive_rows(queryset):
+    return (
+        queryset.exclude(cv='')
+        .order_by('vacancy_id', 'pk')
+        .values_list(*ARCHIVE_FIELDS)
+        .iterator(chunk_size=ARCHIVE_CHUNK_SIZE)
+    )
+
+
+def manifest_rows(queryset, missing):
+    for pk, slug, title, full_name, email, phone, created_at, cv, original_name, sha256 in archive_rows(queryset):
+        name = f'Tapılmadı: {cv}' if pk in missing else archive_name(pk, slug, full_name, cv, original_name)
+        yield name, pk, title, full_name, email, phone, created_at, sha256
+
+
+def archive_entries(queryset):
+    storage = AppealVacancy._meta.get_field('cv').storage
+    missing = set()
+    for pk, slug, title, full_name, email, phone, created_at, cv, original_name, sha256 in archive_rows(queryset):
+        if storage.exists(cv):
+            yield archive_name(pk, slug, full_name, cv, original_name), read_chunks(storage, cv)
+        else:
+            missing.add(pk)
+
+    manifest = stream_csv(MANIFEST_HEADERS, manifest_rows(queryset, missing))
+    yield 'manifest.csv', (chunk.encode() for chunk in manifest)
+
+
+def cv_archive_response(queryset):
+    response = StreamingHttpResponse(stream_zip(archive_entries(queryset)), content_type='application/zip')
+    response['Content-Disposition'] = f'attachment; filename="cv-{timezone.localdate():%Y-%m-%d}.zip"'
+    return response
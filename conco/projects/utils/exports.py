@@ -0,0 +1,146 @@
+"""
+Streamed CSV and XLSX exports of querysets.
+
+Rows are read with values_list(...).iterator(chunk_size=...) (a server-side
+cursor on PostgreSQL) and written out as they arrive, so memory does not
+grow with the export. XLSX is a minimal SpreadsheetML workbook with inline
+strings, zipped on the fly by stream_zip().
+"""
+import csv
+import datetime
+import re
+from xml.sax.saxutils import escape
+
+from django.utils import timezone
+
+from projects.utils.zip_stream import stream_zip
+
+
+EXPORT_CHUNK_SIZE = 2000
+BATCH_ROWS = 500
+
+CSV_CONTENT_TYPE = 'text/csv; charset=utf-8'
+XLSX_CONTENT_TYPE = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+
+# Spreadsheet programs run cells starting with these as formulas
+FORMULA_PREFIXES = ('=', '+', '-', '@', '\t', '\r')
+XML_ILLEGAL_RE = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f]')
+XLSX_MAX_CELL = 32767
+
+
+def export_rows(queryset, lookups):
+    return queryset.values_list(*lookups).iterator(chunk_size=EXPORT_CHUNK_SIZE)
+
+
+def format_value(value, tz=None):
+    if value is None:
+        return ''
+    if isinstance(value, bool):
+        return 'Bəli' if value else 'Xeyr'
+    if isinstance(value, datetime.datetime):
+        if timezone.is_aware(value):
+            value = value.astimezone(tz or timezone.get_current_timezone())
+        return value.strftime('%d.%m.%Y %H:%M')
+    if isinstance(value, datetime.date):
+        return value.strftime('%d.%m.%Y')
+    return value
+
+
+def safe_text(value):
+    value = str(value)
+    if value.startswith(FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+class Echo:
+    """File-like object for csv.writer that returns the written line."""
+
+    def write(self, value):
+        return value
+
+
+def stream_csv(headers, rows):
+    writer = csv.writer(Echo())
+    tz = timezone.get_current_timezone()
+    # BOM: Excel opens UTF-8 (ə, ş, ğ) correctly only with it
+    lines = ['\ufeff' + writer.writerow(headers)]
+    for row in rows:
+        lines.append(writer.writerow([
+            value if isinstance(value, (int, float)) else safe_text(value)
+            for value in (format_value(value, tz) for value in row)
+        ]))
+        if len(lines) >= BATCH_ROWS:
+            yield ''.join(lines)
+            lines = []
+    yield ''.join(lines)
+
+
+XLSX_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/worksheets/sheet1.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+    '</Types>'
+)
+XLSX_ROOT_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Target="xl/workbook.xml" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument"/>'
+    '</Relationships>'
+)
+XLSX_WORKBOOK = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+    '<sheets><sheet name="{name}" sheetId="1" r:id="rId1"/></sheets>'
+    '</workbook>'
+)
+XLSX_WORKBOOK_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Target="worksheets/sheet1.xml" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet"/>'
+    '</Relationships>'
+)
+
+
+def xlsx_cell(value, tz=None):
+    value = format_value(value, tz)
+    if isinstance(value, (int, float)):
+        return f'<c><v>{value}</v></c>'
+    text = escape(XML_ILLEGAL_RE.sub('', str(value))[:XLSX_MAX_CELL])
+    return f'<c t="inlineStr"><is><t xml:space="preserve">{text}</t></is></c>'
+
+
+def xlsx_sheet(headers, rows):
+    tz = timezone.get_current_timezone()
+    yield (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>'
+        f'<row>{"".join(map(xlsx_cell, headers))}</row>'
+    ).encode()
+    lines = []
+    for row in rows:
+        lines.append(f'<row>{"".join(xlsx_cell(value, tz) for value in row)}</row>')
+        if len(lines) >= BATCH_ROWS:
+            yield ''.join(lines).encode()
+            lines = []
+    yield (''.join(lines) + '</sheetData></worksheet>').encode()
+
+
+def stream_xlsx(headers, rows, sheet_name='Sheet1'):
+    # Sheet names: at most 31 characters, no []:*?/\
+    sheet_name = re.sub(r'[\[\]:*?/\\]', '', sheet_name)[:31] or 'Sheet1'
+    return stream_zip([
+        ('[Content_Types].xml', [XLSX_CONTENT_TYPES.encode()]),
+        ('_rels/.rels', [XLSX_ROOT_RELS.encode()]),
+        ('xl/workbook.xml', [XLSX_WORKBOOK.format(name=escape(sheet_name, {'"': '&quot;'})).encode()]),
+        ('xl/_rels/workbook.xml.rels', [XLSX_WORKBOOK_RELS.encode()]),
+        ('xl/worksheets/sheet1.xml', xlsx_sheet(headers, rows)),
+    ])
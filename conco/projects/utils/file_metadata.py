@@ -0,0 +1,46 @@
+import hashlib
+import mimetypes
+import os
+
+
+# mimetypes does not know .docx on every system
+CONTENT_TYPES = {
+    '.pdf': 'application/pdf',
+    '.doc': 'application/msword',
+    '.docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
+}
+
+
+def guess_content_type(name):
+    extension = os.path.splitext(name or '')[1].lower()
+    return CONTENT_TYPES.get(extension) or mimetypes.guess_type(name or '')[0] or 'application/octet-stream'
+
+
+def read_file_metadata(file, name=None):
+    """
+    Size, content type and SHA-256 of a file, read in chunks.
+    The content type comes from the extension, not from the browser.
+    """
+    digest = hashlib.sha256()
+    size = 0
+    for chunk in file.chunks():
+        digest.update(chunk)
+        size += len(chunk)
+    if hasattr(file, 'seek'):
+        file.seek(0)
+
+    name = name or file.name
+    return {
+        'size': size,
+        'content_type': guess_content_type(name),
+        'original_name': os.path.basename(name or '')[:255],
+        'sha256': digest.hexdigest(),
+    }
+
+
+def format_file_size(size):
+    if size is None:
+        return 'N/A'
+    if size < 1024 * 1024:
+        return f'{round(size / 1024, 1)} KB'
+    return f'{round(size / (1024 * 1024), 1)} MB'
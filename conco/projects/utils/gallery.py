@@ -0,0 +1,95 @@
+"""
+Admin media gallery (projects.admin.mixins.GalleryMixin).
+
+Every file is uploaded in its own request and only written to storage; the
+upload returns a signed token naming the stored file. When a selection is
+done, one request turns all its tokens into Media rows with a single
+bulk_create. Existing media are listed a page at a time (keyset on id), so
+neither the change form nor any gallery request grows with the gallery.
+"""
+import os
+
+from django.core import signing
+from django.db import router
+from django.db.models.signals import post_save
+from django.utils import timezone
+
+from projects.models import Media
+from projects.utils.thumbnails import (
+    ADMIN_THUMBNAIL_SIZE, delete_thumbnails, ensure_thumbnail, thumbnail_url,
+)
+
+
+GALLERY_PAGE_SIZE = 24
+# Tokens of uploads that were never turned into Media rows expire
+UPLOAD_MAX_AGE = 60 * 60 * 24
+
+signer = signing.TimestampSigner(salt='projects.gallery.upload')
+
+
+def store_upload(upload):
+    """Write a validated image upload to Media.image storage, return its token."""
+    field = Media._meta.get_field('image')
+    name = field.storage.save(
+        field.generate_filename(None, upload.name), upload, max_length=field.max_length,
+    )
+    ensure_thumbnail(field.storage, name, ADMIN_THUMBNAIL_SIZE)
+    return signer.sign(name)
+
+
+def unsign_uploads(tokens):
+    """Stored file names of the tokens; raises signing.BadSignature."""
+    names = []
+    for token in tokens:
+        name = signer.unsign(token, max_age=UPLOAD_MAX_AGE)
+        if name not in names:
+            names.append(name)
+    return names
+
+
+def pending_uploads(names):
+    """Names not yet turned into Media rows: a replayed token adds nothing."""
+    existing = set(Media.objects.filter(image__in=names).values_list('image', flat=True))
+    return [name for name in names if name not in existing]
+
+
+def discard_uploads(names):
+    """Delete stored uploads; only pass pending_uploads() names."""
+    storage = Media._meta.get_field('image').storage
+    for name in names:
+        storage.delete(name)
+        delete_thumbnails(storage, name)
+
+
+def create_media(owner_field, owner, names):
+    """Media rows of pending_uploads() names."""
+    medias = Media.objects.bulk_create([Media(**{owner_field: owner}, image=name) for name in names])
+    if medias:
+        # bulk_create sends no signals. The Media receivers (caches, cover,
+        # cards, search) only look at the owner: one post_save covers the batch
+        post_save.send(
+            sender=Media, instance=medias[0], created=True,
+            update_fields=None, raw=False, using=router.db_for_write(Media),
+        )
+    return medias
+
+
+def gallery_page(queryset, after=None, size=GALLERY_PAGE_SIZE):
+    """(medias, next cursor or None) of the page following media id `after`."""
+    if after is not None:
+        queryset = queryset.filter(pk__gt=after)
+    medias = list(queryset.order_by('pk')[:size + 1])
+    if len(medias) > size:
+        return medias[:size], medias[size - 1].pk
+    return medias, None
+
+
+def gallery_item(media):
+    return {
+        'id': media.pk,
+        'url': media.image.url if media.image else '',
+        'thumbnail': thumbnail_url(media.image),
+        'name': os.path.basename(media.image.name),
+        'video': bool(media.video),
+        'created_at': timezone.localtime(media.created_at).strftime('%d.%m.%Y %H:%M') if media.created_at else '',
+    }
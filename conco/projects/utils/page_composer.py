@@ -0,0 +1,255 @@
+"""
+Single round-trip page composition for PostgreSQL.
+
+compose_home_page_data() builds the same payload as get_home_page_data() but
+lets PostgreSQL assemble it with json_build_object/json_agg, so a cold home
+page costs one SQL statement instead of one query per section. It is enabled
+with the PAGE_COMPOSER_SQL setting and only used on PostgreSQL.
+"""
+import json
+
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.db import connection, connections, router
+from django.utils.dateparse import parse_date, parse_datetime
+
+
+def is_sql_composer_enabled():
+    return getattr(settings, 'PAGE_COMPOSER_SQL', False) and connection.vendor == 'postgresql'
+
+
+def parse_page_number(value):
+    """Paginator ilə eyni: rəqəm olmayan səhifə 1-ci səhifəyə düşür."""
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return 1
+
+
+HOME_PAGE_SQL = """
+WITH
+main_projects AS (
+    SELECT p.*, c.slug AS category_slug, c.{name} AS category_name,
+           row_number() OVER (PARTITION BY p.category_id ORDER BY p.created_at DESC) AS category_rank
+    FROM projects_project p
+    JOIN projects_projectcategory c ON c.id = p.category_id
+    WHERE p.on_main_page AND p.is_active = %(is_active)s {project_filters}
+),
+selected_projects AS (
+    SELECT * FROM main_projects {project_selection}
+),
+vacancy_meta AS (
+    SELECT total_count, num_pages,
+           CASE WHEN %(vacancies_page)s < 1 OR %(vacancies_page)s > num_pages
+                THEN num_pages ELSE %(vacancies_page)s END AS current_page
+    FROM (
+        SELECT count(*) AS total_count,
+               greatest(ceil(count(*)::numeric / %(vacancies_per_page)s)::int, 1) AS num_pages
+        FROM projects_vacancy WHERE is_active
+    ) counts
+),
+vacancy_page AS (
+    SELECT * FROM projects_vacancy
+    WHERE is_active
+    ORDER BY created_at DESC
+    LIMIT %(vacancies_per_page)s
+    OFFSET ((SELECT current_page FROM vacancy_meta) - 1) * %(vacancies_per_page)s
+),
+first_about AS (
+    SELECT * FROM projects_about ORDER BY id LIMIT 1
+)
+SELECT json_build_object(
+    'projects', (
+        SELECT coalesce(json_agg(json_build_object(
+            'id', id,
+            'slug', slug,
+            'name', {name},
+            'url', url,
+            'is_completed', is_completed,
+            'speacial_project', speacial_project,
+            'on_main_page', on_main_page,
+            'project_date', project_date,
+            'category', json_build_object('id', category_id, 'slug', category_slug, 'name', category_name),
+            'cover', CASE WHEN coalesce(cover_media_url, '') = '' THEN NULL ELSE json_build_object(
+                'url', cover_media_url, 'width', cover_media_width, 'height', cover_media_height
+            ) END
+        ) ORDER BY {project_order}), '[]'::json)
+        FROM selected_projects
+    ),
+    'categories', (
+        SELECT coalesce(json_agg(json_build_object(
+            'id', id, 'slug', slug, 'name', {name}
+        ) ORDER BY id), '[]'::json)
+        FROM projects_projectcategory
+    ),
+    'partners', (
+        SELECT coalesce(json_agg(json_build_object(
+            'id', id,
+            'name', {name},
+            'instagram', instagram,
+            'facebook', facebook,
+            'linkedn', linkedn,
+            'is_active', is_active,
+            'created_at', created_at,
+            'logo', cover_media_url
+        ) ORDER BY created_at DESC), '[]'::json)
+        FROM projects_partner WHERE is_active
+    ),
+    'vacancies', (
+        SELECT coalesce(json_agg(json_build_object(
+            'id', id,
+            'slug', slug,
+            'title', {title},
+            'description', {description},
+            'is_active', is_active,
+            'created_at', created_at,
+            'image', cover_media_url
+        ) ORDER BY created_at DESC), '[]'::json)
+        FROM vacancy_page
+    ),
+    'vacancies_pagination', (
+        SELECT json_build_object(
+            'current_page', current_page,
+            'total_pages', num_pages,
+            'total_count', total_count,
+            'per_page', %(vacancies_per_page)s,
+            'has_next', current_page < num_pages,
+            'has_previous', current_page > 1
+        ) FROM vacancy_meta
+    ),
+    'about', (
+        SELECT json_build_object(
+            'id', a.id,
+            'main_title', a.{main_title},
+            'second_title', a.{second_title},
+            'description', a.{description},
+            'medias', (
+                SELECT coalesce(json_agg(json_build_object(
+                    'id', m.id, 'image', m.image, 'video', m.video
+                ) ORDER BY m.id), '[]'::json)
+                FROM projects_media m WHERE m.about_id = a.id
+            )
+        ) FROM first_about a
+    ),
+    'contact', (
+        SELECT json_build_object(
+            'id', id,
+            'address', {address},
+            'phone', phone,
+            'whatsapp_number', whatsapp_number,
+            'whatsapp_number_2', whatsapp_number_2,
+            'phone_three', phone_three,
+            'email', email,
+            'instagram', instagram,
+            'facebook', facebook,
+            'youtube', youtube,
+            'linkedn', linkedn,
+            'tiktok', tiktok
+        ) FROM (SELECT * FROM projects_contact ORDER BY id LIMIT 1) c
+    ),
+    'motto', (SELECT {text} FROM projects_motto ORDER BY id LIMIT 1),
+    'statistics', coalesce(
+        (
+            SELECT json_build_object(
+                'client_count', value_one, 'project_count', value_two, 'partner_count', value_three
+            ) FROM projects_statistic ORDER BY id LIMIT 1
+        ),
+        json_build_object(
+            'project_count', coalesce((SELECT value FROM projects_counter WHERE key = 'active_projects'), 0),
+            'partner_count', coalesce((SELECT value FROM projects_counter WHERE key = 'active_partners'), 0)
+        )
+    ),
+    'backgrounds', (
+        SELECT coalesce(json_agg(json_build_array(mp.placement, m.image) ORDER BY mp.placement, mp.media_id), '[]'::json)
+        FROM projects_mediaplacement mp
+        JOIN projects_media m ON m.id = mp.media_id
+        WHERE m.image <> ''
+    )
+)
+"""
+
+
+def build_home_page_sql(lang, is_completed, special):
+    from projects.utils.queries import get_localized_field_name
+
+    project_filters = ''
+    if is_completed is not None:
+        project_filters += ' AND p.is_completed = %(is_completed)s'
+
+    if special:
+        project_filters += ' AND p.speacial_project'
+        project_selection = 'ORDER BY created_at DESC LIMIT 9'
+        project_order = 'created_at DESC'
+    else:
+        project_selection = 'WHERE category_rank <= 9'
+        project_order = 'category_id, created_at DESC'
+
+    return HOME_PAGE_SQL.format(
+        name=get_localized_field_name('name', lang),
+        title=get_localized_field_name('title', lang),
+        description=get_localized_field_name('description', lang),
+        main_title=get_localized_field_name('main_title', lang),
+        second_title=get_localized_field_name('second_title', lang),
+        address=get_localized_field_name('address', lang),
+        text=get_localized_field_name('text', lang),
+        project_filters=project_filters,
+        project_selection=project_selection,
+        project_order=project_order,
+    )
+
+
+def compose_home_page_data(request, lang):
+    """
+    get_home_page_data() ilə eyni nəticəni bir SQL sorğusu ilə qaytarır.
+    """
+    from projects.models import Project
+    from projects.utils.queries import build_background_images
+
+    category_slug = request.GET.get('slug')
+    is_completed = request.GET.get('is_completed')
+    is_active = request.GET.get('is_active', 'true').lower() == 'true'
+    special = request.GET.get('special') == 'true'
+
+    if is_completed is not None:
+        is_completed = is_completed.lower() == 'true'
+
+    params = {
+        'is_active': is_active,
+        'is_completed': is_completed,
+        'vacancies_page': parse_page_number(request.GET.get('vacancies_page', 1)),
+        'vacancies_per_page': int(request.GET.get('vacancies_per_page', 9)),
+    }
+
+    # Raw SQL bypasses the router: use the alias the ORM would read from
+    with connections[router.db_for_read(Project)].cursor() as cursor:
+        cursor.execute(build_home_page_sql(lang, is_completed, special), params)
+        payload = cursor.fetchone()[0]
+    if isinstance(payload, str):
+        payload = json.loads(payload)
+
+    for project in payload['projects']:
+        project['project_date'] = parse_date(project['project_date']) if project['project_date'] else None
+    for item in payload['partners'] + payload['vacancies']:
+        item['created_at'] = parse_datetime(item['created_at'])
+
+    about = payload['about']
+    if about:
+        for media in about['medias']:
+            media['image'] = default_storage.url(media['image']) if media['image'] else None
+            media['video'] = default_storage.url(media['video']) if media['video'] else None
+
+    backgrounds = build_background_images(payload.pop('backgrounds'))
+
+    payload.update({
+        'projects_pagination': None,
+        'partners_pagination': None,
+        'filters': {
+            'slug': category_slug,
+            'is_completed': is_completed,
+            'is_active': is_active,
+        },
+        'background_image': backgrounds.get('home'),
+        'hero_background_images': backgrounds['hero'][:6],
+        'footer_image': backgrounds.get('footer'),
+    })
+    return payload
@@ -0,0 +1,163 @@
+"""
+Monthly RANGE (created_at) partitioning of the appeal tables on PostgreSQL.
+
+Partitions are named <table>_pYYYY_MM and cover [first day of month,
+first day of next month) in settings.TIME_ZONE, so the admin's month
+drill-down (date_hierarchy) hits exactly one partition. A <table>_default partition catches rows
+outside the prepared range; ensure_partitions() moves such rows into their
+month when the month partition is created.
+"""
+import re
+from datetime import date, datetime
+
+from django.conf import settings
+from django.utils import timezone
+
+
+PARTITIONED_TABLES = ('projects_appealvacancy', 'projects_appealcontact')
+ARCHIVE_SCHEMA = 'appeal_archive'
+
+PARTITION_NAME_RE = re.compile(r'_p(\d{4})_(\d{2})$')
+
+
+def month_start(value):
+    if isinstance(value, datetime) and timezone.is_aware(value):
+        value = timezone.localtime(value)
+    return date(value.year, value.month, 1)
+
+
+def add_months(month, count):
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(table, month):
+    return f'{table}_p{month:%Y_%m}'
+
+
+def month_bound(month):
+    return f'{month:%Y-%m-%d} 00:00:00 {settings.TIME_ZONE}'
+
+
+def is_partitioned(cursor, table):
+    cursor.execute(
+        "SELECT c.relkind = 'p' FROM pg_class c "
+        "JOIN pg_namespace n ON n.oid = c.relnamespace "
+        "WHERE c.relname = %s AND n.nspname = current_schema()",
+        [table],
+    )
+    row = cursor.fetchone()
+    return bool(row and row[0])
+
+
+def list_partitions(cursor, table):
+    """[(partition name, month)] of the monthly partitions, oldest first."""
+    cursor.execute(
+        "SELECT c.relname FROM pg_inherits i "
+        "JOIN pg_class c ON c.oid = i.inhrelid "
+        "WHERE i.inhparent = %s::regclass",
+        [table],
+    )
+    partitions = []
+    for (name,) in cursor.fetchall():
+        match = PARTITION_NAME_RE.search(name)
+        if match:
+            partitions.append((name, date(int(match.group(1)), int(match.group(2)), 1)))
+    return sorted(partitions, key=lambda partition: partition[1])
+
+
+def create_month_partition(cursor, table, month):
+    """
+    Create the partition of `month` unless it exists. Rows of that month that
+    landed in the default partition are moved into it first.
+    """
+    name = partition_name(table, month)
+    cursor.execute('SELECT to_regclass(%s)', [name])
+    if cursor.fetchone()[0]:
+        return False
+
+    lower, upper = month_bound(month), month_bound(add_months(month, 1))
+    cursor.execute(f'CREATE TABLE "{name}" (LIKE "{table}" INCLUDING DEFAULTS INCLUDING CONSTRAINTS)')
+    cursor.execute(
+        f'WITH moved AS ('
+        f'DELETE FROM "{table}_default" WHERE created_at >= %s AND created_at < %s RETURNING *'
+        f') INSERT INTO "{name}" SELECT * FROM moved',
+        [lower, upper],
+    )
+    # DDL takes no bind parameters; the bounds are generated dates
+    cursor.execute(
+        f'ALTER TABLE "{table}" ATTACH PARTITION "{name}" '
+        f"FOR VALUES FROM ('{lower}') TO ('{upper}')"
+    )
+    return True
+
+
+def ensure_partitions(cursor, table, since, until):
+    """Create the missing monthly partitions for the months since..until."""
+    month = since
+    created = []
+    while month <= until:
+        if create_month_partition(cursor, table, month):
+            created.append(partition_name(table, month))
+        month = add_months(month, 1)
+    return created
+
+
+def partition_table(cursor, table, since, until):
+    """
+    Convert a plain table into a partitioned one, keeping its data, indexes,
+    foreign keys and id sequence. The primary key becomes (id, created_at).
+    """
+    if is_partitioned(cursor, table):
+        return
+
+    cursor.execute(
+        'SELECT pg_get_indexdef(indexrelid) FROM pg_index '
+        'WHERE indrelid = %s::regclass AND NOT indisprimary',
+        [table],
+    )
+    indexes = [sql for (sql,) in cursor.fetchall()]
+    cursor.execute(
+        "SELECT conname FROM pg_constraint WHERE conrelid = %s::regclass AND contype = 'p'",
+        [table],
+    )
+    pk_name = cursor.fetchone()[0]
+    cursor.execute(
+        "SELECT conname, pg_get_constraintdef(oid) FROM pg_constraint "
+        "WHERE conrelid = %s::regclass AND contype IN ('f', 'c')",
+        [table],
+    )
+    constraints = cursor.fetchall()
+    cursor.execute(f'SELECT min(created_at), max(id) FROM "{table}"')
+    oldest, max_id = cursor.fetchone()
+
+    old = f'{table}_unpartitioned'
+    cursor.execute(f'ALTER TABLE "{table}" RENAME TO "{old}"')
+    cursor.execute(f'CREATE TABLE "{table}" (LIKE "{old}" INCLUDING DEFAULTS) PARTITION BY RANGE (created_at)')
+    cursor.execute(f'CREATE TABLE "{table}_default" PARTITION OF "{table}" DEFAULT')
+
+    ensure_partitions(cursor, table, min(month_start(oldest), since) if oldest else since, until)
+
+    cursor.execute(f'INSERT INTO "{table}" SELECT * FROM "{old}"')
+    cursor.execute(f'DROP TABLE "{old}"')
+
+    # Identity columns are not allowed on partitioned tables before PostgreSQL 17
+    cursor.execute(f'CREATE SEQUENCE "{table}_id_seq" OWNED BY "{table}".id')
+    cursor.execute('SELECT setval(%s, %s, %s)', [f'{table}_id_seq', max_id or 1, max_id is not None])
+    cursor.execute(f'ALTER TABLE "{table}" ALTER COLUMN id SET DEFAULT nextval(\'"{table}_id_seq"\')')
+    cursor.execute(f'ALTER TABLE "{table}" ADD CONSTRAINT "{pk_name}" PRIMARY KEY (id, created_at)')
+
+    for sql in indexes:
+        cursor.execute(sql)
+    for name, definition in constraints:
+        cursor.execute(f'ALTER TABLE "{table}" ADD CONSTRAINT "{name}" {definition}')
+
+
+def archive_partition(cursor, table, name, drop=False):
+    """Detach a monthly partition and move it to ARCHIVE_SCHEMA (or drop it)."""
+    cursor.execute(f'ALTER TABLE "{table}" DETACH PARTITION "{name}"')
+    if drop:
+        cursor.execute(f'DROP TABLE "{name}"')
+        return
+    cursor.execute(f'CREATE SCHEMA IF NOT EXISTS "{ARCHIVE_SCHEMA}"')
+    cursor.execute(f'ALTER TABLE "{name}" SET SCHEMA "{ARCHIVE_SCHEMA}"')
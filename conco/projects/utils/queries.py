@@ -1,10 +1,14 @@
-from django.db.models import Q, Prefetch
+from django.db.models import Q, Prefetch, Subquery
 from django.utils import translation
 from django.core.paginator import Paginator, EmptyPage, PageNotAnInteger
+from django.core.files.storage import default_storage
 # from django.conf import settings
 
 from projects.models import *
 from projects.utils.cache_utils import cached_query, get_query_cache_key, cached_page_data
+from projects.utils.serializer_utils import strict_serializer, prefetched
+from projects.utils.counters import get_counters, ACTIVE_PROJECTS, ACTIVE_PARTNERS, DISTINCT_APPLICANTS
+from projects.utils.page_composer import is_sql_composer_enabled, compose_home_page_data
 from django.core.cache import cache
 
 
@@ -62,8 +66,10 @@ def get_project_categories(lang='az'):
 
 
 def get_projects(lang='az', category_slug=None, is_active=True, is_completed=None, on_main_page=None, speacial_project=None):
-    queryset = Project.objects.select_related('category').prefetch_related(
-        Prefetch('medias', queryset=Media.objects.filter(image__isnull=False))
+    # List projection: cards read the denormalized cover, so no media prefetch
+    # and no long descriptions are loaded.
+    queryset = Project.objects.select_related('category').defer(
+        'description_az', 'description_en', 'description_ru'
     )
     
     if is_active is not None:
@@ -73,7 +79,11 @@ def get_projects(lang='az', category_slug=None, is_active=True, is_completed=Non
         queryset = queryset.filter(is_completed=is_completed)
     
     if category_slug:
-        queryset = queryset.filter(category__slug=category_slug)
+        # Scalar subquery, not a join: category_id is then a constant and
+        # project_category_listing_idx returns the rows already ordered
+        queryset = queryset.filter(category_id=Subquery(
+            ProjectCategory.objects.filter(slug=category_slug).values('pk')[:1]
+        ))
     
     if on_main_page is not None:
         queryset = queryset.filter(on_main_page=on_main_page)
@@ -84,6 +94,22 @@ def get_projects(lang='az', category_slug=None, is_active=True, is_completed=Non
     return queryset.order_by('-created_at')
 
 
+def get_project_cards(lang='az', category_slug=None, is_active=True, is_completed=None):
+    # Read table: already localized, no joins (see utils/read_tables.py)
+    queryset = ProjectCard.objects.filter(lang=lang)
+
+    if is_active is not None:
+        queryset = queryset.filter(is_active=is_active)
+
+    if is_completed is not None:
+        queryset = queryset.filter(is_completed=is_completed)
+
+    if category_slug:
+        queryset = queryset.filter(category_slug=category_slug)
+
+    return queryset.order_by('-created_at')
+
+
 @cached_query(timeout='CACHE_TIMEOUT_MEDIUM')
 def get_project_by_slug(slug, lang='az'):
     try:
@@ -106,9 +132,7 @@ def get_about(lang='az'):
 
 
 def get_partners(lang='az', is_active=True):
-    queryset = Partner.objects.prefetch_related(
-        Prefetch('medias', queryset=Media.objects.filter(image__isnull=False))
-    )
+    queryset = Partner.objects.all()
     
     if is_active is not None:
         queryset = queryset.filter(is_active=is_active)
@@ -123,18 +147,14 @@ def get_contact(lang='az'):
 
 @cached_query(timeout='CACHE_TIMEOUT_MEDIUM')
 def get_services(lang='az', is_active=True):
-    queryset = Service.objects.prefetch_related(
-        Prefetch('medias', queryset=Media.objects.filter(image__isnull=False))
-    )
+    queryset = Service.objects.all()
     if is_active is not None:
         queryset = queryset.filter(is_active=is_active)
     return list(queryset.order_by('-created_at'))
 
 
 def get_vacancies(lang='az', is_active=True):
-    queryset = Vacancy.objects.prefetch_related(
-        Prefetch('medias', queryset=Media.objects.filter(image__isnull=False))
-    )
+    queryset = Vacancy.objects.all()
     
     if is_active is not None:
         queryset = queryset.filter(is_active=is_active)
@@ -142,48 +162,64 @@ def get_vacancies(lang='az', is_active=True):
     return queryset.order_by('-created_at')
 
 
+def get_vacancy_cards(lang='az', is_active=True):
+    queryset = VacancyCard.objects.filter(lang=lang)
+
+    if is_active is not None:
+        queryset = queryset.filter(is_active=is_active)
+
+    return queryset.order_by('-created_at')
+
+
 @cached_query(timeout='CACHE_TIMEOUT_MEDIUM')
 def get_vacancy_by_slug(slug, lang='az'):
     try:
-        vacancy = Vacancy.objects.prefetch_related(
-            Prefetch('medias', queryset=Media.objects.filter(image__isnull=False))
-        ).get(slug=slug, is_active=True)
+        vacancy = Vacancy.objects.get(slug=slug, is_active=True)
         return vacancy
     except Vacancy.DoesNotExist:
         return None
 
 
 @cached_query(timeout='CACHE_TIMEOUT_LONG')
-def get_background_image(page_type):
-    image_map = {
-        'home': 'is_home_page_background_image',
-        'about': 'is_about_page_background_image',
-        'contact': 'is_contact_page_background_image',
-        'partner': 'is_partner_background_image',
-        'project': 'is_project_page_background_image',
-        'vacancy': 'is_vacany_page_background_image',
-        'service': 'is_service_page_background_image',
-        'footer': 'is_footer_background_image',
+def get_background_images():
+    """
+    Bütün səhifələrin arxa plan şəkillərini bir sorğu ilə qaytarır:
+    {'home': url, 'about': url, ..., 'footer': url, 'hero': [url, ...]}
+    """
+    placements = (
+        MediaPlacement.objects
+        .exclude(media__image='')
+        .order_by('placement', 'media_id')
+        .values_list('placement', 'media__image')
+    )
+    return build_background_images(placements)
+
+
+def build_background_images(placements):
+    """
+    (placement, image_name) cütlərindən arxa plan xəritəsini qurur.
+    Cütlər placement, sonra media id üzrə sıralanmış olmalıdır.
+    """
+    urls_by_placement = {}
+    for placement, image_name in placements:
+        urls_by_placement.setdefault(placement, []).append(default_storage.url(image_name))
+
+    backgrounds = {
+        placement: urls[0]
+        for placement, urls in urls_by_placement.items()
     }
-    
-    if page_type not in image_map:
-        return None
-    
-    media = Media.objects.filter(**{image_map[page_type]: True}).first()
-    if media and media.image:
-        return media.image.url
-    return None
+    # Hero karuseli üçün ən yeni şəkillər əvvəldə
+    backgrounds['hero'] = list(reversed(urls_by_placement.get(Placement.HOME, [])))
+    return backgrounds
+
+
+def get_background_image(page_type):
+    return get_background_images().get(page_type)
 
 
-@cached_query(timeout='CACHE_TIMEOUT_LONG')
 def get_home_background_images(limit=6):
     """Ana səhifə hero karuseli üçün background image-ləri qaytarır (maksimum 6 ədəd)"""
-    media_list = Media.objects.filter(
-        is_home_page_background_image=True,
-        image__isnull=False
-    ).order_by('-created_at')[:limit]
-    
-    return [media.image.url for media in media_list if media.image]
+    return get_background_images()['hero'][:limit]
 
 
 @cached_query(timeout='CACHE_TIMEOUT_LONG')
@@ -198,7 +234,6 @@ def get_motto(lang='az'):
 
 
 @cached_query(timeout='CACHE_TIMEOUT_LONG')
-@cached_query(timeout='CACHE_TIMEOUT_MEDIUM')
 def get_statistics():
 
     statistic = Statistic.objects.first()
@@ -210,20 +245,74 @@ def get_statistics():
             'partner_count': statistic.value_three,
         }
     
-    from projects.models import AppealVacancy
+    # Signals ilə saxlanılan sayğaclar: COUNT əvəzinə bir sətir oxunur
+    values = get_counters([ACTIVE_PROJECTS, ACTIVE_PARTNERS, DISTINCT_APPLICANTS])
+    
+    return {
+        # 'client_count': values[DISTINCT_APPLICANTS],
+        'project_count': values[ACTIVE_PROJECTS],
+        'partner_count': values[ACTIVE_PARTNERS],
+    }
+
+
+@strict_serializer
+def serialize_project_list(project, lang='az'):
+    """Layihə kartı üçün qısa proyeksiya (list səhifələri)"""
+    if project is None:
+        return None
     
-    client_count = AppealVacancy.objects.values('email', 'phone_number').distinct().count()
-    project_count = Project.objects.filter(is_active=True).count()
-    partner_count = Partner.objects.filter(is_active=True).count()
+    name_field = get_localized_field_name('name', lang)
+    cat_name_field = get_localized_field_name('name', lang)
     
     return {
-        # 'client_count': client_count,
-        'project_count': project_count,
-        'partner_count': partner_count,
+        'id': project.id,
+        'slug': project.slug,
+        'name': getattr(project, name_field, project.name_az),
+        'url': project.url,
+        'is_completed': project.is_completed,
+        'speacial_project': project.speacial_project,
+        'on_main_page': project.on_main_page,
+        'project_date': project.project_date,
+        'category': {
+            'id': project.category.id,
+            'slug': project.category.slug,
+            'name': getattr(project.category, cat_name_field, project.category.name_az),
+        },
+        'cover': project.cover_media,
     }
 
 
+@strict_serializer
+def serialize_project_card(card):
+    """ProjectCard sətrini serialize_project_list() ilə eyni formaya salır"""
+    if card is None:
+        return None
+
+    return {
+        'id': card.project_id,
+        'slug': card.slug,
+        'name': card.name,
+        'url': card.url,
+        'is_completed': card.is_completed,
+        'speacial_project': card.speacial_project,
+        'on_main_page': card.on_main_page,
+        'project_date': card.project_date,
+        'category': {
+            'id': card.category_id,
+            'slug': card.category_slug,
+            'name': card.category_name,
+        },
+        'cover': {
+            'url': card.cover_url,
+            'width': card.cover_width,
+            'height': card.cover_height,
+        } if card.cover_url else None,
+    }
+
+
+@strict_serializer
 def serialize_project(project, lang='az'):
+    """Layihənin tam proyeksiyası (detal səhifəsi)"""
     if project is None:
         return None
     
@@ -248,17 +337,19 @@ def serialize_project(project, lang='az'):
             'slug': project.category.slug,
             'name': getattr(project.category, cat_name_field, project.category.name_az),
         },
+        'cover': project.cover_media,
         'medias': [
             {
                 'id': media.id,
                 'image': media.image.url if media.image else None,
                 'video': media.video.url if media.video else None,
             }
-            for media in project.medias.all()
+            for media in prefetched(project, 'medias')
         ]
     }
 
 
+@strict_serializer
 def serialize_project_category(category, lang='az'):
     name_field = get_localized_field_name('name', lang)
     
@@ -269,6 +360,7 @@ def serialize_project_category(category, lang='az'):
     }
 
 
+@strict_serializer
 def serialize_about(about, lang='az'):
     if about is None:
         return None
@@ -288,34 +380,33 @@ def serialize_about(about, lang='az'):
                 'image': media.image.url if media.image else None,
                 'video': media.video.url if media.video else None,
             }
-            for media in about.medias.all()
+            for media in prefetched(about, 'medias')
         ]
     }
 
 
+@strict_serializer
 def serialize_service(service, lang='az'):
     if service is None:
         return None
     title_field = get_localized_field_name('title', lang)
     desc_field = get_localized_field_name('description', lang)
-    first_media = service.medias.filter(image__isnull=False).first()
     return {
         'id': service.id,
         'title': getattr(service, title_field, service.title_az),
         'description': getattr(service, desc_field, service.description_az),
-        'image': first_media.image.url if first_media and first_media.image else None,
+        'image': service.cover_media_url,
         'url': service.url if getattr(service, 'url', None) else None,
     }
 
 
+@strict_serializer
 def serialize_partner(partner, lang='az'):
     if partner is None:
         return None
     
     name_field = get_localized_field_name('name', lang)
     
-    media = partner.medias.first()
-    
     return {
         'id': partner.id,
         'name': getattr(partner, name_field, partner.name_az),
@@ -324,10 +415,11 @@ def serialize_partner(partner, lang='az'):
         'linkedn': partner.linkedn,
         'is_active': partner.is_active,
         'created_at': partner.created_at,
-        'logo': media.image.url if media and media.image else None,
+        'logo': partner.cover_media_url,
     }
 
 
+@strict_serializer
 def serialize_contact(contact, lang='az'):
     if contact is None:
         return None
@@ -350,6 +442,7 @@ def serialize_contact(contact, lang='az'):
     }
 
 
+@strict_serializer
 def serialize_vacancy(vacancy, lang='az'):
     if vacancy is None:
         return None
@@ -357,8 +450,6 @@ def serialize_vacancy(vacancy, lang='az'):
     title_field = get_localized_field_name('title', lang)
     desc_field = get_localized_field_name('description', lang)
     
-    media = vacancy.medias.first()
-    
     return {
         'id': vacancy.id,
         'slug': vacancy.slug,
@@ -366,7 +457,22 @@ def serialize_vacancy(vacancy, lang='az'):
         'description': getattr(vacancy, desc_field, vacancy.description_az),
         'is_active': vacancy.is_active,
         'created_at': vacancy.created_at,
-        'image': media.image.url if media and media.image else None,
+        'image': vacancy.cover_media_url,
+    }
+
+
+@strict_serializer
+def serialize_vacancy_card(card):
+    if card is None:
+        return None
+
+    return {
+        'id': card.vacancy_id,
+        'slug': card.slug,
+        'title': card.title,
+        'is_active': card.is_active,
+        'created_at': card.created_at,
+        'image': card.image,
     }
 
 
@@ -395,6 +501,10 @@ def get_pagination_data(page_obj, paginator):
 
 @cached_page_data(timeout='CACHE_TIMEOUT_MEDIUM')
 def get_home_page_data(request, lang):
+    if is_sql_composer_enabled():
+        # PostgreSQL-də bütün səhifə bir sorğu ilə yığılır
+        return compose_home_page_data(request, lang)
+    
     category_slug = request.GET.get('slug')  # category_slug -> slug
     is_completed = request.GET.get('is_completed')
     is_active = request.GET.get('is_active', 'true').lower() == 'true'
@@ -440,7 +550,7 @@ def get_home_page_data(request, lang):
         for cat_id in sorted(projects_by_category.keys()):
             projects.extend(projects_by_category[cat_id])
 
-    serialized_projects = [serialize_project(project, lang) for project in projects]
+    serialized_projects = [serialize_project_list(project, lang) for project in projects]
     projects_paginator = None
     projects_page_obj = None
     
@@ -473,12 +583,13 @@ def get_home_page_data(request, lang):
     contact = get_contact(lang)
     serialized_contact = serialize_contact(contact, lang) if contact else None
     
-    # Hero carousel üçün 6 ədəd background image
-    hero_background_images = get_home_background_images(limit=6)
-    
     # Motto modelindən deviz
     motto = get_motto(lang)
     
+    # Hero carousel üçün 6 ədəd background image
+    backgrounds = get_background_images()
+    hero_background_images = backgrounds['hero'][:6]
+    
     return {
         'projects': serialized_projects,
         'categories': serialized_categories,
@@ -494,11 +605,11 @@ def get_home_page_data(request, lang):
             'is_completed': is_completed,
             'is_active': is_active,
         },
-        'background_image': get_background_image('home'),
+        'background_image': backgrounds.get('home'),
         'hero_background_images': hero_background_images,
         'motto': motto,
         'statistics': get_statistics(),
-        'footer_image': get_background_image('footer'),
+        'footer_image': backgrounds.get('footer'),
     }
 
 
@@ -516,7 +627,7 @@ def get_project_list_data(request, lang):
     page = request.GET.get('page', 1)
     per_page_param = request.GET.get('per_page')
     
-    projects = get_projects(
+    projects = get_project_cards(
         lang=lang,
         category_slug=category_slug,
         is_active=is_active,
@@ -532,8 +643,8 @@ def get_project_list_data(request, lang):
     
     projects_page_obj, projects_paginator = paginate_queryset(projects, page, per_page)
     serialized_projects = [
-        serialize_project(project, lang)
-        for project in projects_page_obj
+        serialize_project_card(card)
+        for card in projects_page_obj
     ]
     
     categories = get_project_categories(lang)
@@ -554,6 +665,8 @@ def get_project_list_data(request, lang):
     contact = get_contact(lang)
     serialized_contact = serialize_contact(contact, lang) if contact else None
     
+    backgrounds = get_background_images()
+    
     return {
         'projects': serialized_projects,
         'categories': serialized_categories,
@@ -565,8 +678,8 @@ def get_project_list_data(request, lang):
             'is_completed': is_completed,
             'is_active': is_active,
         },
-        'background_image': get_background_image('project'),
-        'footer_image': get_background_image('footer'),
+        'background_image': backgrounds.get('project'),
+        'footer_image': backgrounds.get('footer'),
     }
 
 
@@ -576,21 +689,23 @@ def get_vacancy_list_data(request, lang):
     page = request.GET.get('page', 1)
     per_page = int(request.GET.get('per_page', 10))
     
-    vacancies = get_vacancies(lang=lang, is_active=is_active)
+    vacancies = get_vacancy_cards(lang=lang, is_active=is_active)
     vacancies_page_obj, vacancies_paginator = paginate_queryset(vacancies, page, per_page)
     
     serialized_vacancies = [
-        serialize_vacancy(vacancy, lang)
-        for vacancy in vacancies_page_obj
+        serialize_vacancy_card(card)
+        for card in vacancies_page_obj
     ]
     
     contact = get_contact(lang)
     serialized_contact = serialize_contact(contact, lang) if contact else None
     
+    backgrounds = get_background_images()
+    
     return {
         'vacancies': serialized_vacancies,
         'contact': serialized_contact,
         'pagination': get_pagination_data(vacancies_page_obj, vacancies_paginator),
-        'background_image': get_background_image('vacancy'),
-        'footer_image': get_background_image('footer'),
+        'background_image': backgrounds.get('vacancy'),
+        'footer_image': backgrounds.get('footer'),
     }
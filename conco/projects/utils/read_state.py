@@ -0,0 +1,59 @@
+"""
+Bulk read/unread marking of appeals and contact messages.
+
+One UPDATE ... WHERE id IN (...) changes only the rows whose state actually
+flips and returns how many flipped per vacancy; the unread counters are then
+moved by those amounts. No per-row save(), so no per-row signals.
+"""
+from collections import Counter as Tally
+
+from django.db import connections, router, transaction
+
+from projects.models import AppealVacancy
+from projects.utils import counters
+
+
+def build_update_sql(model, connection, subquery_sql, has_vacancy):
+    quote = connection.ops.quote_name
+    opts = model._meta
+    vacancy = quote(opts.get_field('vacancy').column) if has_vacancy else 'NULL'
+    return (
+        f'WITH changed AS ('
+        f'UPDATE {quote(opts.db_table)} SET {quote(opts.get_field("is_read").column)} = %s '
+        f'WHERE {quote(opts.get_field("is_read").column)} = %s '
+        f'AND {quote(opts.pk.column)} IN ({subquery_sql}) '
+        f'RETURNING {vacancy} AS vacancy_id'
+        f') SELECT vacancy_id, COUNT(*) FROM changed GROUP BY vacancy_id'
+    )
+
+
+def unread_deltas(model, changed, is_read):
+    """{counter key: delta} for rows that switched to is_read, per vacancy."""
+    sign = -1 if is_read else 1
+    deltas = Tally()
+    for vacancy_id, count in changed:
+        if model is AppealVacancy:
+            for key in counters.appeal_counter_keys(False, vacancy_id):
+                deltas[key] += sign * count
+        else:
+            deltas[counters.UNREAD_CONTACTS] += sign * count
+    return deltas
+
+
+def set_read_state(queryset, is_read):
+    """Mark every row of `queryset` read/unread; returns the number changed."""
+    model = queryset.model
+    alias = router.db_for_write(model)
+    connection = connections[alias]
+    subquery_sql, params = (
+        queryset.using(alias).order_by().values('pk').query.get_compiler(alias).as_sql()
+    )
+    sql = build_update_sql(model, connection, subquery_sql, model is AppealVacancy)
+
+    with transaction.atomic(using=alias):
+        with connection.cursor() as cursor:
+            cursor.execute(sql, [is_read, not is_read, *params])
+            changed = cursor.fetchall()
+        for key, delta in unread_deltas(model, changed, is_read).items():
+            counters.increment(key, delta)
+    return sum(count for _, count in changed)
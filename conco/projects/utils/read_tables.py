@@ -0,0 +1,119 @@
+"""
+Maintenance of the per-language read tables (ProjectCard, VacancyCard).
+
+List pages read these rows directly: one indexed range scan, no joins, no
+prefetch and no localization in Python. Rows are rebuilt by signals after the
+writing transaction commits, and `manage.py rebuild_read_tables` rebuilds
+everything from scratch.
+"""
+from django.conf import settings
+from django.db import transaction
+
+from projects.models import Project, Vacancy, ProjectCard, VacancyCard
+from projects.utils.cache_utils import invalidate_model_cache
+
+
+PROJECT_CARD_FIELDS = [
+    'slug', 'name', 'url', 'category_id', 'category_slug', 'category_name',
+    'cover_url', 'cover_width', 'cover_height', 'is_active', 'is_completed',
+    'speacial_project', 'on_main_page', 'project_date', 'created_at',
+]
+VACANCY_CARD_FIELDS = ['slug', 'title', 'image', 'is_active', 'created_at']
+
+
+def get_languages():
+    return [code for code, _ in settings.LANGUAGES]
+
+
+def build_project_cards(project):
+    for lang in get_languages():
+        yield ProjectCard(
+            lang=lang,
+            project_id=project.pk,
+            slug=project.slug,
+            name=getattr(project, f'name_{lang}'),
+            url=project.url,
+            category_id=project.category_id,
+            category_slug=project.category.slug,
+            category_name=getattr(project.category, f'name_{lang}'),
+            cover_url=project.cover_media_url,
+            cover_width=project.cover_media_width,
+            cover_height=project.cover_media_height,
+            is_active=project.is_active,
+            is_completed=project.is_completed,
+            speacial_project=project.speacial_project,
+            on_main_page=project.on_main_page,
+            project_date=project.project_date,
+            created_at=project.created_at,
+        )
+
+
+def build_vacancy_cards(vacancy):
+    for lang in get_languages():
+        yield VacancyCard(
+            lang=lang,
+            vacancy_id=vacancy.pk,
+            slug=vacancy.slug,
+            title=getattr(vacancy, f'title_{lang}'),
+            image=vacancy.cover_media_url,
+            is_active=vacancy.is_active,
+            created_at=vacancy.created_at,
+        )
+
+
+def refresh_project_cards(project_ids=None, category_id=None):
+    """
+    Upsert the cards of the given projects (or of a whole category).
+    With no arguments every project card is rebuilt.
+    """
+    projects = Project.objects.select_related('category').defer(
+        'description_az', 'description_en', 'description_ru'
+    )
+    if project_ids is not None:
+        projects = projects.filter(pk__in=project_ids)
+    if category_id is not None:
+        projects = projects.filter(category_id=category_id)
+
+    cards = [card for project in projects for card in build_project_cards(project)]
+    with transaction.atomic():
+        ProjectCard.objects.bulk_create(
+            cards,
+            batch_size=500,
+            update_conflicts=True,
+            unique_fields=['project', 'lang'],
+            update_fields=PROJECT_CARD_FIELDS,
+        )
+    invalidate_model_cache('ProjectCard')
+
+
+def refresh_vacancy_cards(vacancy_ids=None):
+    """
+    Upsert the cards of the given vacancies. With no arguments every
+    vacancy card is rebuilt.
+    """
+    vacancies = Vacancy.objects.defer(
+        'description_az', 'description_en', 'description_ru'
+    )
+    if vacancy_ids is not None:
+        vacancies = vacancies.filter(pk__in=vacancy_ids)
+
+    cards = [card for vacancy in vacancies for card in build_vacancy_cards(vacancy)]
+    with transaction.atomic():
+        VacancyCard.objects.bulk_create(
+            cards,
+            batch_size=500,
+            update_conflicts=True,
+            unique_fields=['vacancy', 'lang'],
+            update_fields=VACANCY_CARD_FIELDS,
+        )
+    invalidate_model_cache('VacancyCard')
+
+
+def schedule_project_cards_refresh(project_ids=None, category_id=None):
+    transaction.on_commit(
+        lambda: refresh_project_cards(project_ids=project_ids, category_id=category_id)
+    )
+
+
+def schedule_vacancy_cards_refresh(vacancy_ids=None):
+    transaction.on_commit(lambda: refresh_vacancy_cards(vacancy_ids=vacancy_ids))
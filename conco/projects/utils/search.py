@@ -0,0 +1,213 @@
+"""
+Public site search over projects, services and vacancies (SearchEntry).
+
+Each active object gets one row per language with a weighted tsvector
+(title A, description B) built with that language's text search
+configuration. Text is lowercased and accent-folded in Python before it is
+indexed or queried: PostgreSQL's unaccent has no rule for the Azerbaijani
+"ə", and folding both sides the same way lets "temir" find "Təmir".
+
+Every query term is a prefix match. When full-text search finds nothing and
+pg_trgm is installed, a trigram similarity match on the title catches typos.
+Results are cached per language and normalized query.
+"""
+import re
+import unicodedata
+
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector, TrigramWordSimilarity
+from django.db import connections, router, transaction
+from django.db.models import F
+from django.urls import reverse
+from django.utils.text import Truncator
+
+from projects.models import Project, Service, Vacancy, SearchEntry
+from projects.models.search_models import SEARCH_LANGUAGES
+from projects.utils.cache_utils import cached_query, invalidate_model_cache
+from projects.utils.queries import paginate_queryset, get_pagination_data
+
+
+# PostgreSQL has no Azerbaijani configuration: no stemming, only folding
+SEARCH_CONFIGS = {
+    'az': 'simple',
+    'en': 'english',
+    'ru': 'russian',
+}
+
+MAX_QUERY_LENGTH = 100
+MAX_QUERY_TERMS = 8
+SNIPPET_LENGTH = 200
+
+FOLD_TABLE = str.maketrans({
+    'ə': 'e', 'Ə': 'e',
+    'ı': 'i', 'İ': 'i',
+    'ё': 'е', 'Ё': 'е',
+})
+
+
+def fold_text(value):
+    """Lowercase and strip Latin diacritics (ş, ç, ğ, ö, ü, ə, ı)."""
+    value = (value or '').translate(FOLD_TABLE).lower()
+    # Only Latin letters are decomposed: Cyrillic "й" keeps its breve
+    return ''.join(
+        ''.join(c for c in unicodedata.normalize('NFD', char) if not unicodedata.combining(c))
+        if char < '\u0250' else char
+        for char in value
+    )
+
+
+def normalize_query(value):
+    """Cache key friendly form of a visitor's query."""
+    return ' '.join(fold_text(value[:MAX_QUERY_LENGTH]).split())
+
+
+def query_terms(query):
+    return re.findall(r'[^\W_]+', query)[:MAX_QUERY_TERMS]
+
+
+def localized(obj, field, lang):
+    return getattr(obj, f'{field}_{lang}', None) or getattr(obj, f'{field}_az') or ''
+
+
+def build_entries(kind, obj, title_field, extra_text=None):
+    for lang in SEARCH_LANGUAGES:
+        title = localized(obj, title_field, lang)
+        description = localized(obj, 'description', lang)
+        body = ' '.join(filter(None, [description, extra_text(obj, lang) if extra_text else None]))
+        yield SearchEntry(
+            kind=kind,
+            object_id=obj.pk,
+            lang=lang,
+            title=title[:250],
+            snippet=Truncator(description).chars(SNIPPET_LENGTH),
+            slug=getattr(obj, 'slug', None),
+            image=obj.cover_media_url,
+            title_text=fold_text(title)[:250],
+            body_text=fold_text(body),
+            created_at=obj.created_at,
+        )
+
+
+def project_category_name(project, lang):
+    return localized(project.category, 'name', lang)
+
+
+SOURCES = {
+    SearchEntry.Kind.PROJECT: (
+        lambda: Project.objects.select_related('category'), 'name', project_category_name,
+    ),
+    SearchEntry.Kind.SERVICE: (lambda: Service.objects.all(), 'title', None),
+    SearchEntry.Kind.VACANCY: (lambda: Vacancy.objects.all(), 'title', None),
+}
+
+
+def refresh_search_entries(kind, object_ids=None):
+    """
+    Rebuild the search rows of the given objects of `kind`. Inactive and
+    deleted objects lose their rows. With no ids the whole kind is rebuilt.
+    """
+    get_queryset, title_field, extra_text = SOURCES[kind]
+    objects = get_queryset().filter(is_active=True)
+    if object_ids is not None:
+        objects = objects.filter(pk__in=object_ids)
+
+    entries = [
+        entry
+        for obj in objects
+        for entry in build_entries(kind, obj, title_field, extra_text)
+    ]
+
+    rows = SearchEntry.objects.filter(kind=kind)
+    if object_ids is not None:
+        rows = rows.filter(object_id__in=object_ids)
+
+    with transaction.atomic():
+        rows.delete()
+        SearchEntry.objects.bulk_create(entries, batch_size=500)
+        for lang, config in SEARCH_CONFIGS.items():
+            rows.filter(lang=lang).update(
+                document=(
+                    SearchVector('title_text', weight='A', config=config)
+                    + SearchVector('body_text', weight='B', config=config)
+                )
+            )
+    invalidate_model_cache('SearchEntry')
+
+
+def refresh_category_search_entries(category_id):
+    """Project rows carry the category name."""
+    project_ids = list(Project.objects.filter(category_id=category_id).values_list('pk', flat=True))
+    if project_ids:
+        refresh_search_entries(SearchEntry.Kind.PROJECT, project_ids)
+
+
+def schedule_search_refresh(kind, object_ids=None):
+    transaction.on_commit(lambda: refresh_search_entries(kind, object_ids))
+
+
+def schedule_category_search_refresh(category_id):
+    transaction.on_commit(lambda: refresh_category_search_entries(category_id))
+
+
+@cached_query(timeout='CACHE_TIMEOUT_LONG')
+def trigram_available():
+    alias = router.db_for_read(SearchEntry)
+    with connections[alias].cursor() as cursor:
+        cursor.execute("SELECT EXISTS(SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm')")
+        return cursor.fetchone()[0]
+
+
+def get_entry_url(kind, object_id, slug):
+    if kind == SearchEntry.Kind.PROJECT:
+        return reverse('projects:project-detail', kwargs={'slug': slug})
+    if kind == SearchEntry.Kind.VACANCY:
+        return reverse('projects:vacancy-detail', kwargs={'slug': slug})
+    return f"{reverse('projects:services-page')}#service-{object_id}"
+
+
+def serialize_search_entry(entry):
+    return {
+        'kind': entry.kind,
+        'id': entry.object_id,
+        'title': entry.title,
+        'snippet': entry.snippet,
+        'image': entry.image,
+        'url': get_entry_url(entry.kind, entry.object_id, entry.slug),
+    }
+
+
+@cached_query(timeout='CACHE_TIMEOUT_SHORT')
+def search_site(lang, query, page=1, per_page=10):
+    """
+    Search results for a normalize_query() query:
+    {'results', 'pagination', 'fuzzy'}; fuzzy marks trigram fallback results.
+    """
+    terms = query_terms(query)
+    if not terms or lang not in SEARCH_CONFIGS:
+        return {'results': [], 'pagination': None, 'fuzzy': False}
+
+    entries = SearchEntry.objects.filter(lang=lang).only(
+        'kind', 'object_id', 'title', 'snippet', 'slug', 'image'
+    )
+    search_query = SearchQuery(
+        ' & '.join(f'{term}:*' for term in terms),
+        config=SEARCH_CONFIGS[lang],
+        search_type='raw',
+    )
+    matches = entries.filter(document=search_query).annotate(
+        rank=SearchRank(F('document'), search_query)
+    ).order_by('-rank', '-created_at', 'pk')
+    page_obj, paginator = paginate_queryset(matches, page, per_page)
+
+    fuzzy = False
+    if not paginator.count and trigram_available():
+        matches = entries.filter(title_text__trigram_word_similar=query).annotate(
+            similarity=TrigramWordSimilarity(query, 'title_text')
+        ).order_by('-similarity', '-created_at', 'pk')
+        page_obj, paginator = paginate_queryset(matches, page, per_page)
+        fuzzy = True
+
+    return {
+        'results': [serialize_search_entry(entry) for entry in page_obj],
+        'pagination': get_pagination_data(page_obj, paginator),
+        'fuzzy': fuzzy,
+    }
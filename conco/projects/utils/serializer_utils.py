@@ -0,0 +1,70 @@
+"""
+Helpers that keep serializers on prefetched data only.
+
+Serializers must never hit the database: everything they read has to come
+from select_related/prefetch_related or from denormalized columns. With
+SERIALIZER_STRICT_MODE enabled any lazy query inside a serializer raises
+LazyQueryError instead of silently turning a list page into N+1 queries.
+"""
+from contextlib import ExitStack, contextmanager
+from functools import wraps
+
+from django.conf import settings
+from django.db import connections
+
+
+class LazyQueryError(RuntimeError):
+    """Raised in strict mode when a serializer triggers a database query."""
+
+
+def is_strict_mode():
+    return getattr(settings, 'SERIALIZER_STRICT_MODE', False)
+
+
+@contextmanager
+def forbid_queries(label='serializer'):
+    """
+    Context manager that makes every database query raise LazyQueryError.
+
+    Args:
+        label: Name shown in the error message (usually the serializer name)
+    """
+    def blocker(execute, sql, params, many, context):
+        raise LazyQueryError(f"{label} triggered a lazy query: {sql}")
+
+    with ExitStack() as stack:
+        for alias in connections:
+            stack.enter_context(connections[alias].execute_wrapper(blocker))
+        yield
+
+
+def strict_serializer(func):
+    """
+    Decorator for serialize_* functions. In strict mode the serializer runs
+    inside forbid_queries(); otherwise it is called as is.
+    """
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        if not is_strict_mode():
+            return func(*args, **kwargs)
+        with forbid_queries(func.__name__):
+            return func(*args, **kwargs)
+    return wrapper
+
+
+def prefetched(instance, relation):
+    """
+    Return the prefetched objects of `relation` on `instance` as a list.
+
+    Falls back to a lazy `.all()` when the relation was not prefetched,
+    unless strict mode is on, in which case LazyQueryError is raised.
+    """
+    cache = getattr(instance, '_prefetched_objects_cache', {})
+    if relation in cache:
+        return list(cache[relation])
+
+    if is_strict_mode():
+        raise LazyQueryError(
+            f"{instance.__class__.__name__}.{relation} was not prefetched"
+        )
+    return list(getattr(instance, relation).all())
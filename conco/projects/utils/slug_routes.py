@@ -0,0 +1,97 @@
+"""
+/projects/<slug>/ routing index (SlugRoute).
+
+Every Project and ProjectCategory slug is recorded with its kind, object id
+and a version bumped on each save. Slugs replaced by a rename stay as
+non-current rows so old URLs redirect to the new one. The whole index is
+cached as one dict, so resolving a slug is a single memory lookup.
+Rows written behind the signals (bulk_create, bulk_update) are picked up by
+rebuild_slug_routes() (`manage.py rebuild_read_tables`).
+"""
+from django.db import transaction
+from django.db.models import Max
+
+from projects.models import Project, ProjectCategory, SlugRoute
+from projects.utils.cache_utils import cached_query, invalidate_model_cache
+
+
+def record_slug(kind, object_id, slug):
+    """Make `slug` the current route of the object; its older slugs become redirects."""
+    with transaction.atomic():
+        routes = SlugRoute.objects.filter(kind=kind, object_id=object_id)
+        version = (routes.aggregate(Max('version'))['version__max'] or 0) + 1
+        routes.exclude(slug=slug).update(is_current=False)
+        # An old slug of another object may be reused: the new owner takes it over
+        SlugRoute.objects.update_or_create(
+            slug=slug,
+            kind=kind,
+            defaults={'object_id': object_id, 'version': version, 'is_current': True},
+        )
+    invalidate_model_cache('SlugRoute')
+
+
+def route_models():
+    return (
+        (SlugRoute.Kind.PROJECT, Project),
+        (SlugRoute.Kind.CATEGORY, ProjectCategory),
+    )
+
+
+def route_kind(model):
+    """SlugRoute kind of a model, None for models without routes."""
+    return dict((model, kind) for kind, model in route_models()).get(model)
+
+
+def rebuild_slug_routes():
+    """
+    Record the current slug of every object whose route is missing or
+    outdated and drop routes of deleted objects; returns the slugs recorded.
+    """
+    current = dict(
+        ((kind, object_id), slug)
+        for kind, object_id, slug in SlugRoute.objects.filter(is_current=True).values_list('kind', 'object_id', 'slug')
+    )
+    recorded = 0
+    for kind, model in route_models():
+        object_ids = set()
+        for pk, slug in model.objects.exclude(slug='').exclude(slug__isnull=True).values_list('pk', 'slug'):
+            object_ids.add(pk)
+            if current.get((kind, pk)) != slug:
+                record_slug(kind, pk, slug)
+                recorded += 1
+        SlugRoute.objects.filter(kind=kind).exclude(object_id__in=object_ids).delete()
+    invalidate_model_cache('SlugRoute')
+    return recorded
+
+
+def forget_object(kind, object_id):
+    SlugRoute.objects.filter(kind=kind, object_id=object_id).delete()
+    invalidate_model_cache('SlugRoute')
+
+
+@cached_query(timeout='CACHE_TIMEOUT_LONG')
+def get_slug_routes():
+    """
+    {slug: {kind: {'id', 'version', 'redirect_to'}}}
+    redirect_to is None for current slugs and the current slug otherwise.
+    """
+    rows = list(SlugRoute.objects.values_list('slug', 'kind', 'object_id', 'version', 'is_current'))
+    current = {
+        (kind, object_id): slug
+        for slug, kind, object_id, version, is_current in rows
+        if is_current
+    }
+
+    routes = {}
+    for slug, kind, object_id, version, is_current in rows:
+        routes.setdefault(slug, {})[kind] = {
+            'id': object_id,
+            'version': version,
+            'redirect_to': None if is_current else current.get((kind, object_id)),
+        }
+    return routes
+
+
+def resolve_slug(slug):
+    """{kind: route} for the slug, or an empty dict for unknown slugs."""
+    return get_slug_routes().get(slug, {})
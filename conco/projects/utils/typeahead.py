@@ -0,0 +1,128 @@
+"""
+Search-as-you-type suggestions from an in-process prefix index.
+
+Per language, every project, category, service and vacancy name is
+transliterated with unidecode (as unique_slugify does; "ə" is folded first,
+unidecode would turn it into "@") and stored once per word position in a
+sorted list, so "rem" finds both "Remont kvartir" and "Kapitalnyy remont".
+A lookup is a bisect plus a short scan, no database.
+
+The index lives in process memory and is rebuilt lazily: content changes
+replace the version token in the cache, and the next lookup in every worker
+notices the new token and rebuilds.
+"""
+import re
+import uuid
+from bisect import bisect_left
+
+from django.core.cache import cache
+from django.db import transaction
+from django.urls import reverse
+from unidecode import unidecode
+
+from projects.models import Project, ProjectCategory, Service, Vacancy
+from projects.models.search_models import SEARCH_LANGUAGES
+from projects.utils.search import fold_text
+
+
+VERSION_CACHE_KEY = 'typeahead_version'
+MAX_SCAN = 200
+
+_state = None
+
+
+def normalize(value):
+    return re.sub(r'[^a-z0-9]+', ' ', unidecode(fold_text(value))).strip()
+
+
+class PrefixIndex:
+    """Sorted word-position keys over a list of (label, kind, url) items."""
+
+    def __init__(self, items):
+        self.items = items
+        keys = []
+        for ref, (label, kind, url) in enumerate(items):
+            words = normalize(label).split()
+            for position in range(len(words)):
+                keys.append((' '.join(words[position:]), position, ref))
+        keys.sort()
+        self.keys = [key for key, _, _ in keys]
+        self.refs = [(position, ref) for _, position, ref in keys]
+
+    def suggest(self, prefix, limit=8):
+        prefix = normalize(prefix)
+        if not prefix:
+            return []
+
+        matches = {}
+        start = bisect_left(self.keys, prefix)
+        for index in range(start, min(start + MAX_SCAN, len(self.keys))):
+            if not self.keys[index].startswith(prefix):
+                break
+            position, ref = self.refs[index]
+            matches[ref] = min(position, matches.get(ref, position))
+
+        # Names starting with the prefix first, then shorter names
+        ranked = sorted(matches, key=lambda ref: (matches[ref], len(self.items[ref][0]), ref))
+        return [
+            {'label': label, 'kind': kind, 'url': url}
+            for label, kind, url in (self.items[ref] for ref in ranked[:limit])
+        ]
+
+
+def localized(row, field, lang):
+    return row[f'{field}_{lang}'] or row[f'{field}_az']
+
+
+def build_items(lang):
+    items = []
+    projects_url = reverse('projects:project-page')
+    services_url = reverse('projects:services-page')
+
+    for row in ProjectCategory.objects.values('slug', 'name_az', f'name_{lang}'):
+        items.append((localized(row, 'name', lang), 'category', f'{projects_url}?slug={row["slug"]}'))
+    for row in Project.objects.filter(is_active=True).values('slug', 'name_az', f'name_{lang}'):
+        items.append((
+            localized(row, 'name', lang), 'project',
+            reverse('projects:project-detail', kwargs={'slug': row['slug']}),
+        ))
+    for row in Service.objects.filter(is_active=True).values('id', 'title_az', f'title_{lang}'):
+        items.append((localized(row, 'title', lang), 'service', f'{services_url}#service-{row["id"]}'))
+    for row in Vacancy.objects.filter(is_active=True).values('slug', 'title_az', f'title_{lang}'):
+        items.append((
+            localized(row, 'title', lang), 'vacancy',
+            reverse('projects:vacancy-detail', kwargs={'slug': row['slug']}),
+        ))
+    return [item for item in items if item[0]]
+
+
+def get_version():
+    version = cache.get(VERSION_CACHE_KEY)
+    if version is None:
+        # First worker (or a cleared cache) sets the token, the others read it
+        cache.add(VERSION_CACHE_KEY, uuid.uuid4().hex, None)
+        version = cache.get(VERSION_CACHE_KEY)
+    return version
+
+
+def get_indexes():
+    global _state
+    version = get_version()
+    state = _state
+    if state is None or state[0] != version:
+        state = (version, {lang: PrefixIndex(build_items(lang)) for lang in SEARCH_LANGUAGES})
+        _state = state
+    return state[1]
+
+
+def suggest(lang, prefix, limit=8):
+    index = get_indexes().get(lang)
+    return index.suggest(prefix, limit) if index else []
+
+
+def invalidate_typeahead():
+    cache.set(VERSION_CACHE_KEY, uuid.uuid4().hex, None)
+
+
+def schedule_typeahead_rebuild():
+    transaction.on_commit(invalidate_typeahead)
@@ -1,18 +1,80 @@
+import re
+
 from django.utils.text import slugify
 from unidecode import unidecode
 
 
+def slug_base(value, max_length=255):
+    value = unidecode(value)
+    # Leave room for a "-<n>" suffix
+    return slugify(value)[:max_length - 8].strip('-')
+
+
+def next_free_slug(base, taken):
+    """
+    First free slug for `base` given the already used slugs
+    ("base", "base-1", "base-2", ...).
+    """
+    if base not in taken:
+        return base
+
+    pattern = re.compile(rf'^{re.escape(base)}-(\d+)$')
+    suffixes = [int(match.group(1)) for match in map(pattern.match, taken) if match]
+    return f"{base}-{max(suffixes, default=0) + 1}"
+
+
 def unique_slugify(instance, value, slug_field='slug'):
-    value = unidecode(value)  
-    slug = slugify(value)
+    """
+    Bir sorğu ilə: base və base-<n> formalı bütün slug-lar oxunur, növbəti
+    boş suffix Python-da hesablanır. Paralel insert-lərdə unique index
+    qoruyur (SluggedModel.save yenidən cəhd edir).
+    """
     ModelClass = instance.__class__
-    unique_slug = slug
-    num = 1
+    max_length = ModelClass._meta.get_field(slug_field).max_length
+    slug = slug_base(value, max_length)
 
-    while ModelClass.objects.filter(**{slug_field: unique_slug}).exists():
-        unique_slug = f"{slug}-{num}"
-        num += 1
+    taken = ModelClass._default_manager.filter(**{
+        f'{slug_field}__regex': rf'^{re.escape(slug)}(-[0-9]+)?$',
+    })
+    if instance.pk is not None:
+        taken = taken.exclude(pk=instance.pk)
 
+    unique_slug = next_free_slug(slug, set(taken.values_list(slug_field, flat=True)))
     setattr(instance, slug_field, unique_slug)
 
-    
\ No newline at end of file
+
+def assign_unique_slugs(rows, slug_field='slug'):
+    """
+    Toplu import üçün: sətirlərə (hələ yazılmamış da ola bilər) bir sorğu ilə
+    unikal slug verir. Sonra bulk_create/bulk_update ilə yazılır.
+    """
+    if not rows:
+        return rows
+
+    ModelClass = type(rows[0])
+    max_length = ModelClass._meta.get_field(slug_field).max_length
+    pks = [row.pk for row in rows if row.pk is not None]
+    taken = set(
+        ModelClass._default_manager.exclude(pk__in=pks)
+        .values_list(slug_field, flat=True)
+    )
+
+    # Candidates per base ("base", "base-<n>") are read from `taken`, which
+    # also gets every assigned slug: "Təmir 1" must see the "tmir-1" given to
+    # the second "Təmir". The cached candidate sets are kept in step.
+    candidates = {}
+    for row in rows:
+        base = slug_base(row.get_slug_source(), max_length)
+        if base not in candidates:
+            candidates[base] = {
+                slug for slug in taken
+                if slug == base or slug.startswith(f'{base}-')
+            }
+        slug = next_free_slug(base, candidates[base])
+        taken.add(slug)
+        head, _, suffix = slug.rpartition('-')
+        for owner in (slug, head if suffix.isdigit() else None):
+            if owner in candidates:
+                candidates[owner].add(slug)
+        setattr(row, slug_field, slug)
+    return rows
@@ -0,0 +1,47 @@
+"""
+ZIP archives written straight into a streamed response.
+
+zipfile can write to a stream it cannot seek: sizes and CRCs then follow
+each entry in a data descriptor and nothing has to be buffered beyond the
+chunk being compressed. Entries are always ZIP64, so neither a member nor
+the archive has a 4 GB limit.
+"""
+import io
+import zipfile
+
+
+class StreamSink(io.RawIOBase):
+    """Unseekable file object collecting what zipfile writes between two yields."""
+
+    def __init__(self):
+        self.chunks = []
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self.chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self):
+        data = b''.join(self.chunks)
+        self.chunks.clear()
+        return data
+
+
+def stream_zip(entries, compression=zipfile.ZIP_DEFLATED):
+    """
+    Yield the bytes of a ZIP archive of `entries`, an iterable of
+    (name, iterable of bytes chunks). Entries are read lazily, one at a time.
+    """
+    sink = StreamSink()
+    with zipfile.ZipFile(sink, 'w', compression=compression) as archive:
+        for name, chunks in entries:
+            with archive.open(name, 'w', force_zip64=True) as member:
+                for chunk in chunks:
+                    member.write(chunk)
+                    data = sink.drain()
+                    if data:
+                        yield data
+            yield sink.drain()
+    yield sink.drain()
@@ -2,21 +2,27 @@ from django.views import View
 from django.shortcuts import render
 from django.shortcuts import render, redirect
 from django.contrib import messages
-from django.db import IntegrityError
-from django.http import Http404
+from django.http import Http404, JsonResponse
+from django.urls import reverse
 from django.utils.translation import gettext as _
+from django.conf import settings
 
-from projects.models import AppealVacancy
+from projects.models import SlugRoute
 from projects.forms.forms_v1 import AppealForm
 from projects.utils.queries import (
     get_language_from_request, get_home_page_data, get_project_list_data,
-    get_project_by_slug, serialize_project, get_background_image,
+    get_project_by_slug, serialize_project, get_background_images,
     get_about, serialize_about, get_partners, serialize_partner,
     get_contact, serialize_contact, get_vacancy_list_data,
     get_vacancy_by_slug, serialize_vacancy, get_statistics,
     get_project_categories, serialize_project_category,
     get_services, serialize_service,
 )
+from projects.utils.slug_routes import resolve_slug
+from projects.utils.appeals import submit_vacancy_appeal
+from projects.utils.page_composer import parse_page_number
+from projects.utils.search import search_site, normalize_query
+from projects.utils.typeahead import suggest
 
 
 class HomePageView(View):
@@ -24,8 +30,9 @@ class HomePageView(View):
     
     def get(self, request):
         lang = get_language_from_request(request)
+        backgrounds = get_background_images()
         context = get_home_page_data(request, lang)
-        context['footer_image'] = get_background_image('footer')
+        context['footer_image'] = backgrounds.get('footer')
         context['language'] = lang
         return render(request, self.template_name, context)
 
@@ -35,12 +42,13 @@ class ProjectPageView(View):
     
     def get(self, request, category_slug=None):
         lang = get_language_from_request(request)
+        backgrounds = get_background_images()
         if category_slug:
             request.GET = request.GET.copy()
             request.GET['slug'] = category_slug
         context = get_project_list_data(request, lang)
-        context['background_image'] = get_background_image('project')
-        context['footer_image'] = get_background_image('footer')
+        context['background_image'] = backgrounds.get('project')
+        context['footer_image'] = backgrounds.get('footer')
         context['language'] = lang
         return render(request, self.template_name, context)
 
@@ -50,9 +58,18 @@ class ProjectDetailPageView(View):
     
     def get(self, request, slug):
         lang = get_language_from_request(request)
+        backgrounds = get_background_images()
         
-        # Əvvəlcə layihə kimi yoxla
-        project = get_project_by_slug(slug, lang)
+        # Slug marşrut cədvəlindən (keşdə) həll olunur: layihə, kateqoriya və ya köhnə slug
+        routes = resolve_slug(slug)
+        if routes and all(route['redirect_to'] for route in routes.values()):
+            route = routes.get(SlugRoute.Kind.PROJECT) or routes[SlugRoute.Kind.CATEGORY]
+            url = reverse('projects:project-detail', kwargs={'slug': route['redirect_to']})
+            if request.GET:
+                url = f'{url}?{request.GET.urlencode()}'
+            return redirect(url, permanent=True)
+        
+        project = get_project_by_slug(slug, lang) if SlugRoute.Kind.PROJECT in routes else None
         if project:
             # Bu layihədir, detalları göstər
             categories = get_project_categories(lang)
@@ -67,25 +84,23 @@ class ProjectDetailPageView(View):
                 'categories': serialized_categories,
                 'contact': serialize_contact(contact, lang) if contact else None,
                 'language': lang,
-                'background_image': get_background_image('project'),
-                'footer_image': get_background_image('footer'),
+                'background_image': backgrounds.get('project'),
+                'footer_image': backgrounds.get('footer'),
             }
             return render(request, self.template_name, context)
         
         # Əgər layihə deyilsə, kateqoriya kimi yoxla
-        from projects.models import ProjectCategory
-        try:
-            category = ProjectCategory.objects.get(slug=slug)
+        if SlugRoute.Kind.CATEGORY in routes:
             # Bu kateqoriyadır, kateqoriya səhifəsini göstər
             request.GET = request.GET.copy()
             request.GET['slug'] = slug
             context = get_project_list_data(request, lang)
-            context['background_image'] = get_background_image('project')
-            context['footer_image'] = get_background_image('footer')
+            context['background_image'] = backgrounds.get('project')
+            context['footer_image'] = backgrounds.get('footer')
             context['language'] = lang
             return render(request, 'projects.html', context)
-        except ProjectCategory.DoesNotExist:
-            raise Http404(_("Project not found"))
+        
+        raise Http404(_("Project not found"))
 
 
 class AboutPageView(View):
@@ -93,6 +108,7 @@ class AboutPageView(View):
     
     def get(self, request):
         lang = get_language_from_request(request)
+        backgrounds = get_background_images()
         is_active = request.GET.get('is_active', 'true').lower() == 'true'
         about = get_about(lang)
         partners = get_partners(lang=lang, is_active=is_active)
@@ -110,8 +126,8 @@ class AboutPageView(View):
             'categories': serialized_categories,
             'statistics': statistics,
             'language': lang,
-            'background_image': get_background_image('about'),
-            'footer_image': get_background_image('footer'),
+            'background_image': backgrounds.get('about'),
+            'footer_image': backgrounds.get('footer'),
         }
 
         return render(request, self.template_name, context)
@@ -122,6 +138,7 @@ class ServicesPageView(View):
 
     def get(self, request):
         lang = get_language_from_request(request)
+        backgrounds = get_background_images()
         contact = get_contact(lang)
         categories = get_project_categories(lang)
         serialized_categories = [
@@ -135,8 +152,8 @@ class ServicesPageView(View):
             'categories': serialized_categories,
             'services': serialized_services,
             'language': lang,
-            'background_image': get_background_image('service'),
-            'footer_image': get_background_image('footer'),
+            'background_image': backgrounds.get('service'),
+            'footer_image': backgrounds.get('footer'),
         }
         return render(request, self.template_name, context)
 
@@ -146,6 +163,7 @@ class ContactPageView(View):
     
     def get(self, request):
         lang = get_language_from_request(request)
+        backgrounds = get_background_images()
         contact = get_contact(lang)
         categories = get_project_categories(lang)
         serialized_categories = [
@@ -158,8 +176,8 @@ class ContactPageView(View):
             'contact': serialize_contact(contact, lang) if contact else None,
             'categories': serialized_categories,
             'language': lang,
-            'background_image': get_background_image('contact'),
-            'footer_image': get_background_image('footer'),
+            'background_image': backgrounds.get('contact'),
+            'footer_image': backgrounds.get('footer'),
             'form': form,
         }
 
@@ -167,6 +185,7 @@ class ContactPageView(View):
     
     def post(self, request):
         lang = get_language_from_request(request)
+        backgrounds = get_background_images()
         from projects.forms.forms_v1 import AppealContactForm
         form = AppealContactForm(request.POST)
         
@@ -190,8 +209,8 @@ class ContactPageView(View):
             'contact': serialize_contact(contact, lang) if contact else None,
             'categories': serialized_categories,
             'language': lang,
-            'background_image': get_background_image('contact'),
-            'footer_image': get_background_image('footer'),
+            'background_image': backgrounds.get('contact'),
+            'footer_image': backgrounds.get('footer'),
             'form': form,
         }
         
@@ -203,14 +222,15 @@ class VacancyPageView(View):
     
     def get(self, request):
         lang = get_language_from_request(request)
+        backgrounds = get_background_images()
         context = get_vacancy_list_data(request, lang)
         categories = get_project_categories(lang)
         context['categories'] = [
             serialize_project_category(category, lang)
             for category in categories
         ]
-        context['background_image'] = get_background_image('vacancy')
-        context['footer_image'] = get_background_image('footer')
+        context['background_image'] = backgrounds.get('vacancy')
+        context['footer_image'] = backgrounds.get('footer')
         context['language'] = lang
         return render(request, self.template_name, context)
 
@@ -220,6 +240,7 @@ class VacancyDetailPageView(View):
     
     def get(self, request, slug):
         lang = get_language_from_request(request)
+        backgrounds = get_background_images()
         vacancy = get_vacancy_by_slug(slug, lang)
         if not vacancy:
             from django.http import Http404
@@ -237,36 +258,26 @@ class VacancyDetailPageView(View):
             'contact': serialize_contact(contact, lang) if contact else None,
             'categories': serialized_categories,
             'language': lang,
-            'background_image': get_background_image('vacancy'),
-            'footer_image': get_background_image('footer'),
+            'background_image': backgrounds.get('vacancy'),
+            'footer_image': backgrounds.get('footer'),
             'form': form,
         }
         return render(request, self.template_name, context)
     
     def post(self, request, slug):
         lang = get_language_from_request(request)
+        backgrounds = get_background_images()
         vacancy = get_vacancy_by_slug(slug, lang)
         if not vacancy:
             raise Http404(_("Vacancy not found"))
         
         form = AppealForm(request.POST, request.FILES)
         if form.is_valid():
-            email = form.cleaned_data.get('email')
-            phone_number = form.cleaned_data.get('phone_number')
-            situation_one = AppealVacancy.objects.filter(vacancy=vacancy, email=email).exists()
-            situation_two = AppealVacancy.objects.filter(vacancy=vacancy, phone_number=phone_number).exists()
-            
-            if situation_one or situation_two :
-                messages.error(request, _('Bu vakansiyaya müraciət artıq göndərilmişdir.'))
-            else:
-                try:
-                    appeal = form.save(commit=False)
-                    appeal.vacancy = vacancy
-                    appeal.save()
-                    messages.success(request, _('Müraciətiniz uğurla göndərildi.'))
-                    return redirect('projects:vacancy-detail', slug=slug)
-                except IntegrityError:
-                    messages.error(request, _('Bu e-poçt ünvanı ilə bu vakansiyaya müraciət artıq göndərilmişdir.'))
+            # Normallaşdırılmış email/telefon üzrə bir INSERT ... ON CONFLICT DO NOTHING
+            if submit_vacancy_appeal(form, vacancy):
+                messages.success(request, _('Müraciətiniz uğurla göndərildi.'))
+                return redirect('projects:vacancy-detail', slug=slug)
+            messages.error(request, _('Bu vakansiyaya müraciət artıq göndərilmişdir.'))
         else:
             messages.error(request, _('Xəta baş verdi. Zəhmət olmasa yenidən cəhd edin.'))
         
@@ -281,10 +292,67 @@ class VacancyDetailPageView(View):
             'contact': serialize_contact(contact, lang) if contact else None,
             'categories': serialized_categories,
             'language': lang,
-            'background_image': get_background_image('vacancy'),
-            'footer_image': get_background_image('footer'),
+            'background_image': backgrounds.get('vacancy'),
+            'footer_image': backgrounds.get('footer'),
             'form': form,
         }
         return render(request, self.template_name, context)
 
 
+class SearchPageView(View):
+    template_name = 'search.html'
+
+    def get(self, request):
+        lang = get_language_from_request(request)
+        backgrounds = get_background_images()
+        query = request.GET.get('q', '').strip()
+        page = parse_page_number(request.GET.get('page', 1))
+        # Nəticələr normallaşdırılmış sorğu üzrə keşlənir
+        search = search_site(lang, normalize_query(query), page)
+        contact = get_contact(lang)
+        categories = get_project_categories(lang)
+        serialized_categories = [
+            serialize_project_category(category, lang)
+            for category in categories
+        ]
+        context = {
+            'query': query,
+            'results': search['results'],
+            'pagination': search['pagination'],
+            'fuzzy': search['fuzzy'],
+            'contact': serialize_contact(contact, lang) if contact else None,
+            'categories': serialized_categories,
+            'language': lang,
+            'background_image': backgrounds.get('project'),
+            'footer_image': backgrounds.get('footer'),
+        }
+        return render(request, self.template_name, context)
+
+
+class SearchResultsView(View):
+    """JSON variant of the search page (?q=&page=&per_page=)."""
+    MAX_PER_PAGE = 50
+
+    def get(self, request):
+        lang = get_language_from_request(request)
+        query = request.GET.get('q', '').strip()
+        page = parse_page_number(request.GET.get('page', 1))
+        per_page = min(max(parse_page_number(request.GET.get('per_page', 10)), 1), self.MAX_PER_PAGE)
+        search = search_site(lang, normalize_query(query), page, per_page)
+        return JsonResponse({'query': query, 'language': lang, **search})
+
+
+class SearchSuggestView(View):
+    """
+    Typeahead (?q=&lang=). Answered from process memory; with an explicit
+    lang the session is not touched either, so a keystroke costs no query.
+    """
+    MAX_LIMIT = 20
+
+    def get(self, request):
+        lang = request.GET.get('lang', '').lower()
+        if lang not in dict(settings.LANGUAGES):
+            lang = getattr(request, 'LANGUAGE_CODE', 'az')
+        limit = min(max(parse_page_number(request.GET.get('limit', 8)), 1), self.MAX_LIMIT)
+        query = request.GET.get('q', '')[:100]
+        return JsonResponse({'query': query, 'suggestions': suggest(lang, query, limit)})
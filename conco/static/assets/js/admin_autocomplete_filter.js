@@ -0,0 +1,21 @@
+/**
+ * Admin siyahı filtri: autocomplete seçimi dəyişəndə səhifəni həmin filtrlə açır
+ */
+(function() {
+    'use strict';
+
+    document.addEventListener('DOMContentLoaded', function() {
+        var $ = django.jQuery;
+
+        $('.admin-autocomplete-filter select').on('change', function() {
+            var base = $(this).closest('.admin-autocomplete-filter').data('base-url');
+            var value = $(this).val();
+            var url = base;
+            if (value) {
+                url += (base.indexOf('?') === -1 ? '?' : '&') +
+                    encodeURIComponent($(this).attr('name')) + '=' + encodeURIComponent(value);
+            }
+            window.location.href = url;
+        });
+    });
+})();
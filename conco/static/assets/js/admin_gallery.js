@@ -0,0 +1,209 @@
+/**
+ * Admin media qalereyası (GalleryMixin)
+ * Mövcud şəkillər səhifə-səhifə yüklənir, yeni fayllar hər biri ayrıca sorğu ilə
+ * göndərilir, sonra bütün seçim üçün Media sətirləri bir sorğu ilə yaradılır
+ */
+(function() {
+    'use strict';
+
+    var PARALLEL_UPLOADS = 3;
+
+    function csrfToken() {
+        var input = document.querySelector('input[name="csrfmiddlewaretoken"]');
+        return input ? input.value : '';
+    }
+
+    function request(url, body) {
+        var options = {
+            credentials: 'same-origin',
+            headers: {'X-CSRFToken': csrfToken(), 'X-Requested-With': 'XMLHttpRequest'}
+        };
+        if (body) {
+            options.method = 'POST';
+            options.body = body;
+        }
+        return fetch(url, options).then(function(response) {
+            return response.json().catch(function() {
+                return {};
+            }).then(function(data) {
+                if (!response.ok) {
+                    throw new Error(data.error || response.statusText);
+                }
+                return data;
+            });
+        });
+    }
+
+    // Brauzerdə WebP-yə çevirmə (admin_image_compress.js), alınmasa original fayl
+    function compress(file) {
+        if (window.compressImageToWebP && file.type.match(/^image\//) && file.type !== 'image/webp') {
+            return window.compressImageToWebP(file, 1920, 1080, 0.8).catch(function() {
+                return file;
+            });
+        }
+        return Promise.resolve(file);
+    }
+
+    function Gallery(root) {
+        this.root = root;
+        this.grid = root.querySelector('.media-gallery-grid');
+        this.status = root.querySelector('.media-gallery-status');
+        this.more = root.querySelector('.media-gallery-more');
+        this.canChange = root.dataset.canChange === '1';
+        this.next = null;
+        this.loaded = false;
+
+        var self = this;
+        this.more.addEventListener('click', function() {
+            self.load(self.next);
+        });
+        var input = root.querySelector('input[type="file"]');
+        if (input) {
+            input.addEventListener('change', function() {
+                var files = Array.prototype.slice.call(input.files);
+                input.value = '';
+                if (files.length) {
+                    self.upload(files);
+                }
+            });
+        }
+        this.load(null);
+    }
+
+    Gallery.prototype.setStatus = function(text, isError) {
+        this.status.textContent = text;
+        this.status.classList.toggle('error', !!isError);
+    };
+
+    Gallery.prototype.render = function(item) {
+        var figure = document.createElement('figure');
+        figure.className = 'media-gallery-item';
+
+        var link = document.createElement('a');
+        link.href = item.url;
+        link.target = '_blank';
+        var img = document.createElement('img');
+        img.src = item.thumbnail || item.url;
+        img.alt = item.name;
+        img.loading = 'lazy';
+        img.decoding = 'async';
+        link.appendChild(img);
+        figure.appendChild(link);
+
+        var caption = document.createElement('figcaption');
+        caption.textContent = (item.video ? '🎬 ' : '') + item.created_at;
+        caption.title = item.name;
+        figure.appendChild(caption);
+
+        if (this.canChange) {
+            var remove = document.createElement('button');
+            remove.type = 'button';
+            remove.className = 'button';
+            remove.textContent = 'Sil';
+            remove.style.marginTop = '4px';
+            remove.addEventListener('click', this.remove.bind(this, item, figure));
+            figure.appendChild(remove);
+        }
+        this.grid.appendChild(figure);
+    };
+
+    Gallery.prototype.load = function(after) {
+        var self = this;
+        var url = this.root.dataset.listUrl + (after ? '?after=' + after : '');
+        this.more.disabled = true;
+        return request(url).then(function(data) {
+            data.items.forEach(self.render, self);
+            self.next = data.next;
+            self.loaded = !data.next;
+            self.more.hidden = !data.next;
+            self.more.disabled = false;
+            if (!after && !data.items.length) {
+                self.setStatus('Hələ şəkil yoxdur.');
+            }
+        }).catch(function(error) {
+            self.more.disabled = false;
+            self.setStatus('Şəkillər yüklənmədi: ' + error.message, true);
+        });
+    };
+
+    Gallery.prototype.upload = function(files) {
+        var self = this;
+        var tokens = [];
+        var failed = [];
+        var done = 0;
+        var queue = files.slice();
+
+        function report() {
+            self.setStatus('Yüklənir: ' + done + ' / ' + files.length);
+        }
+
+        function worker() {
+            var file = queue.shift();
+            if (!file) {
+                return Promise.resolve();
+            }
+            return compress(file).then(function(prepared) {
+                var body = new FormData();
+                body.append('file', prepared, prepared.name);
+                return request(self.root.dataset.uploadUrl, body);
+            }).then(function(data) {
+                tokens.push(data.token);
+            }).catch(function(error) {
+                failed.push(file.name + ': ' + error.message);
+            }).then(function() {
+                done += 1;
+                report();
+                return worker();
+            });
+        }
+
+        report();
+        var workers = [];
+        for (var i = 0; i < Math.min(PARALLEL_UPLOADS, files.length); i++) {
+            workers.push(worker());
+        }
+        return Promise.all(workers).then(function() {
+            if (!tokens.length) {
+                throw new Error('heç bir fayl yüklənmədi');
+            }
+            var body = new FormData();
+            tokens.forEach(function(token) {
+                body.append('token', token);
+            });
+            return request(self.root.dataset.createUrl, body);
+        }).then(function(data) {
+            // Siyahı sona qədər açılıbsa yeniləri əlavə et, yoxsa növbəti səhifələrdə gələcək
+            if (self.loaded) {
+                data.items.forEach(self.render, self);
+            }
+            var text = data.items.length + ' şəkil əlavə edildi.';
+            if (failed.length) {
+                text += ' Yüklənmədi: ' + failed.join('; ');
+            }
+            self.setStatus(text, failed.length > 0);
+        }).catch(function(error) {
+            failed.unshift(error.message);
+            self.setStatus('Xəta: ' + failed.join('; '), true);
+        });
+    };
+
+    Gallery.prototype.remove = function(item, figure) {
+        if (!window.confirm('Şəkil silinsin?')) {
+            return;
+        }
+        var self = this;
+        var url = this.root.dataset.deleteUrl.replace(/\/0\/delete\/$/, '/' + item.id + '/delete/');
+        request(url, new FormData()).then(function() {
+            figure.remove();
+        }).catch(function(error) {
+            self.setStatus('Silinmədi: ' + error.message, true);
+        });
+    };
+
+    document.addEventListener('DOMContentLoaded', function() {
+        var root = document.getElementById('media-gallery');
+        if (root) {
+            new Gallery(root);
+        }
+    });
+})();
@@ -108,6 +108,9 @@
                 });
             }
 
+            // Qalereya yükləyicisi (admin_gallery.js) də istifadə edir
+            window.compressImageToWebP = compressImageToWebP;
+
             // Şəkil compress handler funksiyası
             function handleImageCompression(e) {
                 var $input = $(e.target);
@@ -0,0 +1,17 @@
+#!/bin/bash
+# Periodic management commands (docker compose "scheduler" service)
+
+ROLLUP_INTERVAL=${ROLLUP_INTERVAL:-3600}
+
+# The web container runs the migrations: wait until they are applied
+echo "Waiting for migrations..."
+until python conco/manage.py migrate --check >/dev/null 2>&1; do
+  sleep 5
+done
+echo "Database is ready!"
+
+while true; do
+  # Admin dashboard rollup (DailyActivity): only the last days are recomputed
+  python conco/manage.py rollup_activity || echo "rollup_activity failed"
+  sleep "$ROLLUP_INTERVAL"
+done